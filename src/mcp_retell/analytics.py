@@ -0,0 +1,263 @@
+"""Streaming call analytics — duration percentiles, outcome histograms, rollups.
+
+Calls are consumed one page at a time from the API or the local archive and
+folded into fixed-size aggregates, so memory stays bounded however many calls
+a time range holds:
+
+* durations go into log-bucketed histograms (relative error under 1%), from
+  which p50/p90/p99 are read without keeping individual values;
+* per-agent and per-number rollups are capped at ``max_groups`` keys each,
+  with the remainder folded into ``"_other"``;
+* the time series has one bucket per hour in the range.
+
+Rollups and the time series are returned in columnar form (one list per
+column), which is compact for tool responses and easy to chart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional
+
+from .client import RetellClient
+from .operations.calls import aiter_calls, iter_calls
+
+if TYPE_CHECKING:
+    from .archive import CallArchive
+
+HOUR_MS = 3_600_000
+OTHER = "_other"
+
+
+class DurationHistogram:
+    """Log-bucketed histogram of durations in milliseconds.
+
+    Bucket ``i`` covers ``(GROWTH**(i-1), GROWTH**i]``, so a percentile read
+    from the buckets is within ``GROWTH - 1`` of the true value.
+    """
+
+    GROWTH = 1.01
+    _LOG_GROWTH = math.log(GROWTH)
+
+    def __init__(self) -> None:
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def add(self, value: int) -> None:
+        value = max(0, value)
+        self.buckets[math.ceil(math.log(value) / self._LOG_GROWTH) if value > 1 else 0] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> Optional[int]:
+        """Approximate ``q``-th percentile (0-100), or ``None`` when empty."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                estimate = round(self.GROWTH ** index) if index else 1
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count) if self.count else None,
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class _Group:
+    __slots__ = ("calls", "durations", "statuses")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.durations = DurationHistogram()
+        self.statuses: Counter = Counter()
+
+
+def _duration_ms(call: dict) -> Optional[int]:
+    start, end = call.get("start_timestamp"), call.get("end_timestamp")
+    return end - start if start is not None and end else None
+
+
+def _retell_number(call: dict) -> Optional[str]:
+    """The account's own number: caller ID when outbound, dialed number when inbound."""
+    return call.get("to_number") if call.get("direction") == "inbound" else call.get("from_number")
+
+
+class CallAnalytics:
+    """Fold calls into bounded aggregates; call :meth:`report` for the result."""
+
+    def __init__(self, max_groups: int = 1000) -> None:
+        self.max_groups = max_groups
+        self.calls = 0
+        self.durations = DurationHistogram()
+        self.statuses: Counter = Counter()
+        self.reasons: Counter = Counter()
+        self.agents: dict[str, _Group] = {}
+        self.numbers: dict[str, _Group] = {}
+        self.hours: dict[int, list[int]] = {}  # hour start -> [calls, total duration]
+        self.first_start: Optional[int] = None
+        self.last_start: Optional[int] = None
+
+    def _group(self, groups: dict[str, _Group], key: Optional[str]) -> _Group:
+        key = key or "unknown"
+        group = groups.get(key)
+        if group is None:
+            key = key if len(groups) < self.max_groups else OTHER
+            group = groups.setdefault(key, _Group())
+        return group
+
+    def add(self, call: dict) -> None:
+        self.calls += 1
+        status = call.get("call_status") or "unknown"
+        self.statuses[status] += 1
+        if call.get("disconnection_reason"):
+            self.reasons[call["disconnection_reason"]] += 1
+        duration = _duration_ms(call)
+        groups = (
+            self._group(self.agents, call.get("agent_id")),
+            self._group(self.numbers, _retell_number(call)),
+        )
+        for group in groups:
+            group.calls += 1
+            group.statuses[status] += 1
+        if duration is not None:
+            self.durations.add(duration)
+            for group in groups:
+                group.durations.add(duration)
+        start = call.get("start_timestamp")
+        if start is not None:
+            self.first_start = start if self.first_start is None else min(self.first_start, start)
+            self.last_start = start if self.last_start is None else max(self.last_start, start)
+            hour = self.hours.setdefault(start - start % HOUR_MS, [0, 0])
+            hour[0] += 1
+            hour[1] += duration or 0
+
+    def add_many(self, calls: Iterable[dict]) -> None:
+        for call in calls:
+            self.add(call)
+
+    @staticmethod
+    def _columns(key: str, groups: dict[str, _Group]) -> dict:
+        ordered = sorted(groups.items(), key=lambda item: -item[1].calls)
+        summaries = [g.durations.summary() for _, g in ordered]
+        return {
+            key: [k for k, _ in ordered],
+            "calls": [g.calls for _, g in ordered],
+            "ended": [g.statuses["ended"] for _, g in ordered],
+            "error": [g.statuses["error"] for _, g in ordered],
+            "duration_p50_ms": [s["p50"] for s in summaries],
+            "duration_p90_ms": [s["p90"] for s in summaries],
+            "duration_p99_ms": [s["p99"] for s in summaries],
+        }
+
+    def report(self) -> dict:
+        hours = sorted(self.hours.items())
+        return {
+            "calls": self.calls,
+            "first_start_timestamp": self.first_start,
+            "last_start_timestamp": self.last_start,
+            "duration_ms": self.durations.summary(),
+            "call_status": dict(self.statuses.most_common()),
+            "disconnection_reason": dict(self.reasons.most_common()),
+            "by_agent": self._columns("agent_id", self.agents),
+            "by_number": self._columns("phone_number", self.numbers),
+            "hourly": {
+                "hour_start_ms": [h for h, _ in hours],
+                "calls": [v[0] for _, v in hours],
+                "duration_total_ms": [v[1] for _, v in hours],
+            },
+        }
+
+
+def _archive_calls(
+    archive: CallArchive,
+    agent_id: Optional[str],
+    start_after: Optional[int],
+    start_before: Optional[int],
+    page_size: int,
+) -> Iterable[dict]:
+    key = None
+    while True:
+        page = archive.list_call_summaries(
+            agent_id=agent_id, start_after=start_after, start_before=start_before,
+            limit=page_size, pagination_key=key,
+        )
+        yield from page
+        if len(page) < page_size:
+            return
+        key = page[-1]["call_id"]
+
+
+def _finish(analytics: CallAnalytics, started: float, source: str) -> dict:
+    return {**analytics.report(), "source": source, "elapsed_s": round(time.monotonic() - started, 3)}
+
+
+def analyze_calls(
+    client: RetellClient,
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    archive: Optional[CallArchive] = None,
+    page_size: int = 1000,
+    max_groups: int = 1000,
+) -> dict:
+    """Aggregate every call started in ``(start_after, start_before)`` (sync).
+
+    Timestamps are ms since epoch. With an ``archive``, calls are read from
+    the local store instead of the API.
+    """
+    started = time.monotonic()
+    analytics = CallAnalytics(max_groups=max_groups)
+    if archive is not None:
+        analytics.add_many(_archive_calls(archive, agent_id, start_after, start_before, page_size))
+        return _finish(analytics, started, "archive")
+    analytics.add_many(iter_calls(
+        client, agent_id=agent_id, page_size=page_size,
+        start_after=start_after, start_before=start_before,
+    ))
+    return _finish(analytics, started, "api")
+
+
+async def aanalyze_calls(
+    client: RetellClient,
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    archive: Optional[CallArchive] = None,
+    page_size: int = 1000,
+    max_groups: int = 1000,
+) -> dict:
+    """Aggregate every call started in ``(start_after, start_before)`` (async). See ``analyze_calls``."""
+    if archive is not None:
+        # Local SQLite reads; keep them off the event loop.
+        return await asyncio.to_thread(
+            analyze_calls, client, agent_id, start_after, start_before, archive=archive,
+            page_size=page_size, max_groups=max_groups,
+        )
+    started = time.monotonic()
+    analytics = CallAnalytics(max_groups=max_groups)
+    async for call in aiter_calls(
+        client, agent_id=agent_id, page_size=page_size,
+        start_after=start_after, start_before=start_before,
+    ):
+        analytics.add(call)
+    return _finish(analytics, started, "api")
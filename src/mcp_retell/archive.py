@@ -0,0 +1,495 @@
+"""Local SQLite archive of Retell calls and transcripts.
+
+The archive keeps every call object it has seen, keyed by ``call_id``, and is
+kept current by an incremental sync: only calls newer than the sync's
+``start_timestamp`` watermark are listed, and calls that were not yet final
+at the last sync are re-fetched until they are. Final means the same as for
+the call cache (:func:`mcp_retell.callcache.is_final`): ended with its
+``call_analysis``, ended more than ``settle_s`` ago, or failed.
+The watermark is stored separately from the calls themselves, so calls
+written through by other paths (e.g. ``get_call``) never cause a sync to skip
+older, not-yet-archived calls.
+Reads are indexed local queries and never touch the network.
+
+Transcripts are indexed with SQLite FTS5 as calls are written, so
+:meth:`CallArchive.search_transcripts` supports phrase, boolean and prefix
+queries ranked by BM25 without re-reading any call.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional
+
+from .callcache import is_final
+from .client import RetellClient
+from .config import Settings
+from .operations.batch import afetch_many, fetch_many
+from .operations.calls import aiter_calls, is_terminal, iter_calls
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    call_id TEXT PRIMARY KEY,
+    agent_id TEXT,
+    call_status TEXT,
+    from_number TEXT,
+    to_number TEXT,
+    start_timestamp INTEGER,
+    end_timestamp INTEGER,
+    disconnection_reason TEXT,
+    transcript TEXT,
+    data TEXT NOT NULL,
+    archived_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_calls_start ON calls (start_timestamp, call_id);
+CREATE INDEX IF NOT EXISTS idx_calls_agent_start ON calls (agent_id, start_timestamp);
+CREATE INDEX IF NOT EXISTS idx_calls_status ON calls (call_status);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    watermark INTEGER
+);
+"""
+
+# External-content FTS5 index over calls.transcript, maintained by triggers so
+# every write path (sync, get_call write-through, webhooks) keeps it current.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE transcripts_fts USING fts5(
+    transcript,
+    content = 'calls',
+    content_rowid = 'rowid',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER calls_fts_insert AFTER INSERT ON calls BEGIN
+    INSERT INTO transcripts_fts (rowid, transcript) VALUES (new.rowid, new.transcript);
+END;
+CREATE TRIGGER calls_fts_delete AFTER DELETE ON calls BEGIN
+    INSERT INTO transcripts_fts (transcripts_fts, rowid, transcript)
+    VALUES ('delete', old.rowid, old.transcript);
+END;
+CREATE TRIGGER calls_fts_update AFTER UPDATE OF transcript ON calls BEGIN
+    INSERT INTO transcripts_fts (transcripts_fts, rowid, transcript)
+    VALUES ('delete', old.rowid, old.transcript);
+    INSERT INTO transcripts_fts (rowid, transcript) VALUES (new.rowid, new.transcript);
+END;
+INSERT INTO transcripts_fts (transcripts_fts) VALUES ('rebuild');
+"""
+
+_UPSERT = """
+INSERT INTO calls (
+    call_id, agent_id, call_status, from_number, to_number, start_timestamp,
+    end_timestamp, disconnection_reason, transcript, data, archived_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (call_id) DO UPDATE SET
+    agent_id = excluded.agent_id,
+    call_status = excluded.call_status,
+    from_number = excluded.from_number,
+    to_number = excluded.to_number,
+    start_timestamp = excluded.start_timestamp,
+    end_timestamp = excluded.end_timestamp,
+    disconnection_reason = excluded.disconnection_reason,
+    transcript = COALESCE(excluded.transcript, calls.transcript),
+    data = excluded.data,
+    archived_at = excluded.archived_at
+"""
+
+
+def _merge(stored: Optional[dict], update: dict) -> dict:
+    if stored is None:
+        return update
+    if is_terminal(stored) and not is_terminal(update):
+        return {**update, **stored}
+    return {**stored, **update}
+
+
+class CallArchive:
+    """SQLite-backed call store, safe to share between threads."""
+
+    def __init__(self, path: str | Path, settle_s: float = 600.0) -> None:
+        self.path = str(path)
+        self.settle_s = settle_s
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self.full_text = self._ensure_fts()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> CallArchive:
+        return cls(settings.archive_path, settle_s=settings.call_cache_settle_s)
+
+    def is_final(self, call: dict) -> bool:
+        """Whether ``call`` is complete enough to serve and stop re-syncing."""
+        return is_final(call, self.settle_s)
+
+    def _ensure_fts(self) -> bool:
+        """Create the transcript index (indexing existing rows); ``False`` without FTS5."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'transcripts_fts'",
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            self._conn.executescript(f"BEGIN; {_FTS_SCHEMA} COMMIT;")
+        except sqlite3.OperationalError:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            return False
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # --- Writes ---
+
+    @staticmethod
+    def _row(call: dict, now: float) -> tuple:
+        return (
+            call["call_id"], call.get("agent_id"), call.get("call_status"),
+            call.get("from_number"), call.get("to_number"), call.get("start_timestamp"),
+            call.get("end_timestamp"), call.get("disconnection_reason"),
+            call.get("transcript"), json.dumps(call), now,
+        )
+
+    def _write(self, rows: list[tuple]) -> None:
+        """Run the upsert for ``rows`` in one transaction; the lock must be held."""
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(_UPSERT, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def upsert_calls(self, calls: Iterable[dict]) -> int:
+        """Insert or replace calls in one transaction; returns the row count."""
+        now = time.time()
+        rows = [self._row(c, now) for c in calls if c.get("call_id")]
+        if not rows:
+            return 0
+        with self._lock:
+            self._write(rows)
+        return len(rows)
+
+    def merge_calls(self, calls: Iterable[dict]) -> int:
+        """Merge partial call objects into the stored ones; returns the row count.
+
+        Keys present in an update replace the stored values, except that an
+        update in a live status never overwrites a call already stored in a
+        terminal status (events can arrive out of order).
+        """
+        updates: dict[str, dict] = {}
+        for call in calls:
+            if call.get("call_id"):
+                updates[call["call_id"]] = _merge(updates.get(call["call_id"]), call)
+        if not updates:
+            return 0
+        now = time.time()
+        with self._lock:
+            placeholders = ",".join("?" * len(updates))
+            stored = {
+                row["call_id"]: json.loads(row["data"])
+                for row in self._conn.execute(
+                    f"SELECT call_id, data FROM calls WHERE call_id IN ({placeholders})",
+                    list(updates),
+                )
+            }
+            self._write([
+                self._row(_merge(stored.get(call_id), update), now)
+                for call_id, update in updates.items()
+            ])
+        return len(updates)
+
+    # --- Reads ---
+
+    def get_call(self, call_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM calls WHERE call_id = ?", (call_id,),
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def _select(
+        self,
+        columns: str,
+        agent_id: Optional[str],
+        limit: int,
+        sort_order: str,
+        pagination_key: Optional[str],
+        start_after: Optional[int],
+        start_before: Optional[int],
+    ) -> list[sqlite3.Row]:
+        descending = sort_order != "ascending"
+        clauses, args = [], []
+        if agent_id:
+            clauses.append("agent_id = ?")
+            args.append(agent_id)
+        if start_after is not None:
+            clauses.append("start_timestamp > ?")
+            args.append(start_after)
+        if start_before is not None:
+            clauses.append("start_timestamp < ?")
+            args.append(start_before)
+        with self._lock:
+            if pagination_key:
+                cursor = self._conn.execute(
+                    "SELECT start_timestamp FROM calls WHERE call_id = ?", (pagination_key,),
+                ).fetchone()
+                if cursor is not None:
+                    op = "<" if descending else ">"
+                    clauses.append(f"(start_timestamp, call_id) {op} (?, ?)")
+                    args.extend([cursor["start_timestamp"], pagination_key])
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            order = "DESC" if descending else "ASC"
+            return self._conn.execute(
+                f"SELECT {columns} FROM calls {where} "
+                f"ORDER BY start_timestamp {order}, call_id {order} LIMIT ?",
+                (*args, limit),
+            ).fetchall()
+
+    def list_calls(
+        self,
+        agent_id: Optional[str] = None,
+        limit: int = 50,
+        sort_order: str = "descending",
+        pagination_key: Optional[str] = None,
+        start_after: Optional[int] = None,
+        start_before: Optional[int] = None,
+    ) -> list[dict]:
+        """Archived calls ordered by ``start_timestamp``, with the API's cursor semantics."""
+        rows = self._select(
+            "data", agent_id, limit, sort_order, pagination_key, start_after, start_before,
+        )
+        return [json.loads(r["data"]) for r in rows]
+
+    def list_call_summaries(
+        self,
+        agent_id: Optional[str] = None,
+        limit: int = 1000,
+        sort_order: str = "descending",
+        pagination_key: Optional[str] = None,
+        start_after: Optional[int] = None,
+        start_before: Optional[int] = None,
+    ) -> list[dict]:
+        """Like :meth:`list_calls`, but only the indexed columns plus ``direction``.
+
+        Skips decoding each stored call object, which makes scans over large
+        ranges (e.g. analytics) much cheaper.
+        """
+        rows = self._select(
+            "call_id, agent_id, call_status, from_number, to_number, start_timestamp, "
+            "end_timestamp, disconnection_reason, json_extract(data, '$.direction') AS direction",
+            agent_id, limit, sort_order, pagination_key, start_after, start_before,
+        )
+        return [dict(r) for r in rows]
+
+    def watermark(self, agent_id: Optional[str] = None) -> Optional[int]:
+        """Newest ``start_timestamp`` covered by a completed sync of this scope."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_state WHERE scope = ?", (agent_id or "*",),
+            ).fetchone()
+        return row["watermark"] if row else None
+
+    def set_watermark(self, watermark: Optional[int], agent_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sync_state (scope, watermark) VALUES (?, ?) "
+                "ON CONFLICT (scope) DO UPDATE SET watermark = excluded.watermark",
+                (agent_id or "*", watermark),
+            )
+
+    def open_call_ids(self) -> list[str]:
+        """Calls archived before they were final (see :meth:`is_final`)."""
+        settled = int((time.time() - self.settle_s) * 1000)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT call_id FROM calls WHERE call_status IS NULL "
+                "OR call_status NOT IN ('ended', 'error') "
+                "OR (call_status = 'ended' AND (COALESCE(end_timestamp, 0) = 0 OR end_timestamp >= ?) "
+                "AND json_extract(data, '$.call_analysis') IS NULL)",
+                (settled,),
+            ).fetchall()
+        return [r["call_id"] for r in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM calls").fetchone()[0]
+
+    def search_transcripts(
+        self,
+        query: str,
+        agent_id: Optional[str] = None,
+        start_after: Optional[int] = None,
+        start_before: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+        snippet_tokens: int = 16,
+    ) -> dict:
+        """Full-text search over archived transcripts, best matches first.
+
+        ``query`` uses FTS5 syntax: bare words are ANDed, ``"exact phrase"``,
+        ``OR`` / ``NOT``, ``NEAR(a b, 5)`` and ``prefix*`` are supported.
+        Results carry a snippet with matches wrapped in ``[...]`` and a
+        ``next_offset`` for the following page (``None`` on the last page).
+        """
+        if not self.full_text:
+            raise RuntimeError("SQLite was built without FTS5; transcript search is unavailable.")
+        clauses, args = ["transcripts_fts MATCH ?"], [query]
+        if agent_id:
+            clauses.append("c.agent_id = ?")
+            args.append(agent_id)
+        if start_after is not None:
+            clauses.append("c.start_timestamp > ?")
+            args.append(start_after)
+        if start_before is not None:
+            clauses.append("c.start_timestamp < ?")
+            args.append(start_before)
+        sql = (
+            "SELECT c.call_id, c.agent_id, c.call_status, c.start_timestamp, "
+            "snippet(transcripts_fts, 0, '[', ']', '…', ?) AS snippet, "
+            "bm25(transcripts_fts) AS score "
+            "FROM transcripts_fts JOIN calls c ON c.rowid = transcripts_fts.rowid "
+            f"WHERE {' AND '.join(clauses)} ORDER BY score LIMIT ? OFFSET ?"
+        )
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    sql, (snippet_tokens, *args, limit + 1, offset),
+                ).fetchall()
+        except sqlite3.OperationalError as exc:
+            raise ValueError(f"Invalid transcript search query {query!r}: {exc}") from exc
+        results = [
+            {
+                "call_id": r["call_id"],
+                "agent_id": r["agent_id"],
+                "call_status": r["call_status"],
+                "start_timestamp": r["start_timestamp"],
+                "snippet": r["snippet"],
+                "score": round(-r["score"], 6),
+            }
+            for r in rows[:limit]
+        ]
+        return {
+            "results": results,
+            "next_offset": offset + limit if len(rows) > limit else None,
+        }
+
+
+# --- Incremental sync ---
+
+
+class _SyncRun:
+    """Bookkeeping shared by the sync and async refresh paths."""
+
+    def __init__(self, archive: CallArchive, agent_id: Optional[str], page_size: int) -> None:
+        self.archive = archive
+        self.agent_id = agent_id
+        self.page_size = page_size
+        self.started = time.monotonic()
+        self.watermark = archive.watermark(agent_id)
+        self.newest = self.watermark
+        self.stale = set(archive.open_call_ids())
+        self.batch: list[dict] = []
+        self.synced = 0
+        self.refreshed = 0
+        self.failed: dict[str, str] = {}
+
+    def add(self, call: dict) -> bool:
+        """Buffer a listed call; returns ``False`` once the watermark is reached."""
+        start = call.get("start_timestamp")
+        # An undated call says nothing about where the watermark is.
+        if start:
+            if self.watermark is not None and start < self.watermark:
+                return False
+            self.newest = max(self.newest or 0, start)
+        self.batch.append(call)
+        if self.archive.is_final(call):
+            self.stale.discard(call["call_id"])
+        if len(self.batch) >= self.page_size:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        self.synced += self.archive.upsert_calls(self.batch)
+        self.batch.clear()
+
+    def refresh(self, fetched: dict) -> None:
+        """Write re-fetched open calls; failed ones stay open for the next sync."""
+        self.refreshed = self.archive.upsert_calls(
+            entry["data"] for entry in fetched["results"] if "data" in entry
+        )
+        self.failed = {entry["call_id"]: entry["error"] for entry in fetched["results"] if "error" in entry}
+
+    def report(self) -> dict:
+        self.flush()
+        self.archive.set_watermark(self.newest, self.agent_id)
+        return {
+            "synced": self.synced,
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "archived_total": self.archive.count(),
+            "watermark": self.newest,
+            "elapsed_s": round(time.monotonic() - self.started, 3),
+        }
+
+
+def refresh_archive(
+    client: RetellClient,
+    archive: CallArchive,
+    agent_id: Optional[str] = None,
+    page_size: int = 100,
+    concurrency: int = 8,
+) -> dict:
+    """Pull calls newer than the sync watermark and refresh open calls (sync).
+
+    Open calls that cannot be re-fetched are reported under ``failed`` and
+    retried on the next sync; they do not stop the watermark from advancing.
+    """
+    run = _SyncRun(archive, agent_id, page_size)
+    for call in iter_calls(client, agent_id=agent_id, page_size=page_size):
+        if not run.add(call):
+            break
+    run.flush()
+    run.refresh(fetch_many(
+        run.stale, lambda call_id: client.get_sync(f"/get-call/{call_id}"),
+        id_key="call_id", concurrency=concurrency,
+    ))
+    return run.report()
+
+
+async def arefresh_archive(
+    client: RetellClient,
+    archive: CallArchive,
+    agent_id: Optional[str] = None,
+    page_size: int = 100,
+    concurrency: int = 8,
+) -> dict:
+    """Pull calls newer than the sync watermark and refresh open calls (async).
+
+    See ``refresh_archive`` for how failed refreshes are reported.
+    """
+    run = _SyncRun(archive, agent_id, page_size)
+    listing = aiter_calls(client, agent_id=agent_id, page_size=page_size)
+    try:
+        async for call in listing:
+            if not run.add(call):
+                break
+    finally:
+        await listing.aclose()
+    run.flush()
+    run.refresh(await afetch_many(
+        run.stale, lambda call_id: client.get(f"/get-call/{call_id}"),
+        id_key="call_id", concurrency=concurrency,
+    ))
+    return run.report()
@@ -0,0 +1,205 @@
+"""Read-through TTL cache for Retell catalog endpoints.
+
+Agents, voices and phone numbers change rarely but are read constantly by
+LLM tool loops. :class:`ResponseCache` keeps recent GET responses for those
+resources in a bounded LRU with per-resource TTLs, and drops a resource's
+entries whenever a mutating request touches it.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from mcp_retell.config import Settings
+
+MISS = object()
+
+AGENTS = "agents"
+VOICES = "voices"
+PHONE_NUMBERS = "phone_numbers"
+
+# GET endpoint prefix -> cached resource.
+_READ_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("/list-agents", AGENTS),
+    ("/get-agent/", AGENTS),
+    ("/list-voices", VOICES),
+    ("/get-voice/", VOICES),
+    ("/list-phone-numbers", PHONE_NUMBERS),
+    ("/get-phone-number/", PHONE_NUMBERS),
+)
+
+# Mutating endpoint prefix -> resource whose entries become stale.
+_WRITE_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("/create-agent", AGENTS),
+    ("/update-agent/", AGENTS),
+    ("/delete-agent/", AGENTS),
+    ("/create-phone-number", PHONE_NUMBERS),
+    ("/update-phone-number/", PHONE_NUMBERS),
+    ("/delete-phone-number/", PHONE_NUMBERS),
+)
+
+
+def _match(prefixes: tuple[tuple[str, str], ...], endpoint: str) -> str | None:
+    for prefix, resource in prefixes:
+        if endpoint.startswith(prefix):
+            return resource
+    return None
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    A TTL of ``None`` keeps the entry until it is evicted or invalidated.
+    Entries may carry tags so related keys can be dropped together.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, tuple[float | None, frozenset[str], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value or :data:`MISS`."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            expires, _, value = entry
+            if expires is not None and expires <= time.monotonic():
+                # Kept (until evicted or replaced) for get_stale().
+                self.misses += 1
+                return MISS
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_stale(self, key: Any) -> Any:
+        """Return the value even if it has expired, or :data:`MISS` if absent."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISS
+            self.stale_hits += 1
+            return entry[2]
+
+    def set(self, key: Any, value: Any, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires, frozenset(tags), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Drop every entry carrying ``tag``; returns the number removed."""
+        with self._lock:
+            stale = [k for k, (_, tags, _) in self._data.items() if tag in tags]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+            }
+
+
+class ResponseCache:
+    """Caches GET responses for catalog resources with mutation-aware invalidation."""
+
+    def __init__(self, ttls: dict[str, float], maxsize: int = 512) -> None:
+        self.ttls = {resource: ttl for resource, ttl in ttls.items() if ttl > 0}
+        self.store = TTLCache(maxsize)
+        self._generations: dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ResponseCache:
+        return cls(
+            {
+                AGENTS: settings.cache_ttl_agents,
+                VOICES: settings.cache_ttl_voices,
+                PHONE_NUMBERS: settings.cache_ttl_phone_numbers,
+            },
+            maxsize=settings.cache_max_entries,
+        )
+
+    @staticmethod
+    def key(endpoint: str, params: dict | None) -> tuple[str, str]:
+        return endpoint, json.dumps(params or {}, sort_keys=True, default=str)
+
+    def resource(self, endpoint: str) -> str | None:
+        """The cached resource an endpoint reads, or ``None`` if it is not cached."""
+        resource = _match(_READ_PREFIXES, endpoint)
+        return resource if resource in self.ttls else None
+
+    def get(self, endpoint: str, params: dict | None = None) -> Any:
+        if self.resource(endpoint) is None:
+            return MISS
+        value = self.store.get(self.key(endpoint, params))
+        return value if value is MISS else copy.deepcopy(value)
+
+    def get_stale(self, endpoint: str, params: dict | None = None) -> Any:
+        """The last stored response even if its TTL has run out, or :data:`MISS`."""
+        if self.resource(endpoint) is None:
+            return MISS
+        value = self.store.get_stale(self.key(endpoint, params))
+        return value if value is MISS else copy.deepcopy(value)
+
+    def generation(self, endpoint: str) -> int:
+        """Invalidation counter for the endpoint's resource, read before fetching."""
+        return self._generations.get(_match(_READ_PREFIXES, endpoint) or "", 0)
+
+    def set(
+        self, endpoint: str, params: dict | None, value: Any, generation: int | None = None,
+    ) -> None:
+        """Store a response unless the resource was invalidated since ``generation``."""
+        resource = self.resource(endpoint)
+        if resource is None:
+            return
+        if generation is not None and generation != self._generations.get(resource, 0):
+            return
+        self.store.set(
+            self.key(endpoint, params), copy.deepcopy(value), self.ttls[resource], tags=(resource,),
+        )
+
+    def invalidate(self, endpoint: str) -> int:
+        """Drop entries made stale by a mutating request to ``endpoint``."""
+        resource = _match(_WRITE_PREFIXES, endpoint)
+        if resource is None:
+            return 0
+        self._generations[resource] = self._generations.get(resource, 0) + 1
+        return self.store.invalidate_tag(resource)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def snapshot(self) -> dict:
+        return self.store.snapshot()
@@ -0,0 +1,211 @@
+"""Cache of finished calls — ``/get-call/`` payloads that can no longer change.
+
+Once a call has ended and its post-call analysis is in, its ``/get-call/``
+payload is final. :class:`CallCache` keeps those payloads zlib-compressed
+in a memory LRU bounded by compressed bytes, optionally backed by a
+size-bounded SQLite file that survives restarts. :class:`RetellClient`
+consults it before every ``/get-call/`` request, so every path that reads a
+call (``get_call``, transcripts, batch fetches, exports, recordings) pays
+for a finished call at most once.
+
+A call counts as final when its status is ``error``, or when it has
+``ended`` and either carries ``call_analysis`` or ended more than
+``settle_s`` seconds ago (for agents without post-call analysis).
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from mcp_retell.config import Settings
+
+GET_CALL_PREFIX = "/get-call/"
+
+
+def call_id_of(endpoint: str) -> Optional[str]:
+    """The call ID a ``/get-call/{id}`` endpoint reads, else ``None``."""
+    if not endpoint.startswith(GET_CALL_PREFIX):
+        return None
+    return endpoint[len(GET_CALL_PREFIX):] or None
+
+
+def is_final(call: dict, settle_s: float = 600.0, now: Optional[float] = None) -> bool:
+    """Whether ``call``'s ``/get-call/`` payload will never change again."""
+    status = call.get("call_status")
+    if status == "error":
+        return True
+    if status != "ended":
+        return False
+    if call.get("call_analysis") is not None:
+        return True
+    end = call.get("end_timestamp")
+    now = time.time() if now is None else now
+    return bool(end) and now - end / 1000 > settle_s
+
+
+def _encode(call: dict) -> bytes:
+    return zlib.compress(json.dumps(call, separators=(",", ":")).encode(), 6)
+
+
+def _decode(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob))
+
+
+class BlobStore:
+    """SQLite table of blobs by key, evicting least recently read past ``max_bytes``."""
+
+    def __init__(self, path: str | Path, max_bytes: int, table: str = "blobs") -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.table = table
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, read_at REAL NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_read ON {table} (read_at)")
+            self.bytes = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {table}").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT data FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._conn.execute(f"UPDATE {self.table} SET read_at = ? WHERE key = ?", (time.time(), key))
+        return row[0] if row else None
+
+    def put(self, key: str, blob: bytes) -> None:
+        with self._lock:
+            old = self._conn.execute(f"SELECT size FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, data, size, read_at) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            self.bytes += len(blob) - (old[0] if old else 0)
+            if self.bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Trim to 90% so a full store does not evict on every write.
+        target, freed, stale = self.max_bytes * 0.9, 0, []
+        for key, size in self._conn.execute(f"SELECT key, size FROM {self.table} ORDER BY read_at"):
+            if self.bytes - freed <= target:
+                break
+            stale.append((key,))
+            freed += size
+        self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", stale)
+        self.bytes -= freed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CallCache:
+    """Memory LRU (plus optional disk store) of final call payloads."""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[str | Path] = None,
+        disk_max_bytes: int = 1024 * 1024 * 1024,
+        settle_s: float = 600.0,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.settle_s = settle_s
+        self.disk = BlobStore(disk_path, disk_max_bytes, table="calls") if disk_path else None
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> CallCache:
+        return cls(
+            max_bytes=settings.call_cache_max_bytes,
+            disk_path=settings.call_cache_path or None,
+            disk_max_bytes=settings.call_cache_disk_max_bytes,
+            settle_s=settings.call_cache_settle_s,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.disk is not None
+
+    def _remember(self, call_id: str, blob: bytes) -> None:
+        """Put ``blob`` in the memory LRU; the lock must be held."""
+        if self.max_bytes <= 0 or len(blob) > self.max_bytes:
+            return
+        old = self._memory.pop(call_id, None)
+        self._bytes += len(blob) - (len(old) if old else 0)
+        self._memory[call_id] = blob
+        while self._bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def get(self, call_id: str) -> Optional[dict]:
+        """The cached final payload of ``call_id``, or ``None``."""
+        with self._lock:
+            blob = self._memory.get(call_id)
+            if blob is not None:
+                self._memory.move_to_end(call_id)
+                self.hits += 1
+        if blob is None and self.disk is not None:
+            blob = self.disk.get(call_id)
+            if blob is not None:
+                with self._lock:
+                    self._remember(call_id, blob)
+                    self.disk_hits += 1
+        if blob is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return _decode(blob)
+
+    def put(self, call: dict) -> bool:
+        """Store ``call`` if it is final; returns whether it was stored."""
+        call_id = call.get("call_id") if isinstance(call, dict) else None
+        if not call_id or not self.enabled or not is_final(call, self.settle_s):
+            return False
+        blob = _encode(call)
+        with self._lock:
+            self._remember(call_id, blob)
+            self.stores += 1
+        if self.disk is not None:
+            self.disk.put(call_id, blob)
+        return True
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            snapshot = {
+                "entries": len(self._memory),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+            }
+        if self.disk is not None:
+            snapshot["disk_bytes"] = self.disk.bytes
+        return snapshot
@@ -0,0 +1,187 @@
+"""``mcp-retell`` command line.
+
+``mcp-retell`` (or ``mcp-retell serve``) runs the MCP server over stdio;
+``mcp-retell export`` streams calls to a file; ``mcp-retell recordings``
+downloads call recordings to the local cache; ``mcp-retell webhooks`` runs
+the webhook receiver.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def parse_time(value: str) -> int:
+    """Milliseconds since epoch from an integer or an ISO 8601 date/time (UTC if naive)."""
+    if value.lstrip("-").isdigit():
+        return int(value)
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a timestamp or ISO 8601 date: {value!r}") from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="mcp-retell", description="Retell AI tools.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("serve", help="Run the MCP server over stdio (default)")
+
+    export = commands.add_parser("export", help="Export calls and transcripts to a file")
+    export.add_argument("output", help="Output file path")
+    export.add_argument("--format", dest="fmt", choices=("jsonl", "csv", "parquet"),
+                        help="Output format (default: from the file extension, else jsonl)")
+    export.add_argument("--agent-id", help="Only calls handled by this agent")
+    export.add_argument("--start-after", type=parse_time,
+                        help="Only calls started after this time (ms since epoch or ISO 8601)")
+    export.add_argument("--start-before", type=parse_time,
+                        help="Only calls started before this time (ms since epoch or ISO 8601)")
+    export.add_argument("--checkpoint", help="Checkpoint file; re-run with it to resume")
+    export.add_argument("--concurrency", type=int, default=8, help="Concurrent get_call requests")
+    export.add_argument("--batch-size", type=int, default=200, help="Calls written per batch")
+    export.add_argument("--part-batches", type=int, default=10,
+                        help="With --checkpoint, batches per Parquet part file")
+    export.add_argument("--no-details", action="store_true",
+                        help="Write listed calls as-is instead of fetching each call's details")
+    export.add_argument("--from-archive", action="store_true",
+                        help="Read from the local call archive (RETELL_ARCHIVE_PATH)")
+    export.add_argument("--quiet", action="store_true", help="Do not report progress on stderr")
+
+    recordings = commands.add_parser("recordings", help="Download call recordings to the local cache")
+    recordings.add_argument("call_ids", nargs="*", metavar="CALL_ID", help="Calls whose recordings to fetch")
+    recordings.add_argument("--ids-file", help="File with one call ID per line (- for stdin)")
+    recordings.add_argument("--cache-dir", help="Cache directory (default: RETELL_RECORDINGS_DIR)")
+    recordings.add_argument("--concurrency", type=int, default=8, help="Concurrent downloads")
+
+    webhooks = commands.add_parser("webhooks", help="Receive call events into the local call archive")
+    webhooks.add_argument("--host", help="Interface to listen on (default: RETELL_WEBHOOK_HOST)")
+    webhooks.add_argument("--port", type=int, default=8787, help="Port to listen on")
+
+    sync = commands.add_parser("sync-agents", help="Update agents to match a JSON/YAML manifest")
+    sync.add_argument("manifest", help="Manifest of desired agents (.json, .yaml or .yml)")
+    sync.add_argument("--dry-run", action="store_true", help="Report changes without applying them")
+    sync.add_argument("--concurrency", type=int, default=10, help="Concurrent requests")
+    return parser
+
+
+def _export(args: argparse.Namespace) -> int:
+    from .client import RetellClient
+    from .config import get_settings
+    from .operations.export import FORMATS, aexport_calls
+
+    fmt = args.fmt
+    if fmt is None:
+        suffix = args.output.rsplit(".", 1)[-1].lower()
+        fmt = suffix if suffix in FORMATS else "jsonl"
+    archive = None
+    if args.from_archive:
+        from .archive import CallArchive
+
+        settings = get_settings()
+        if not settings.archive_path:
+            print("The call archive is disabled; set RETELL_ARCHIVE_PATH to enable it.", file=sys.stderr)
+            return 2
+        archive = CallArchive.from_settings(settings)
+
+    def progress(report: dict) -> None:
+        print(f"{report['rows']} rows, {report['rows_per_s']} rows/s", file=sys.stderr)
+
+    async def run() -> dict:
+        async with RetellClient() as client:
+            return await aexport_calls(
+                client, args.output, fmt=fmt, agent_id=args.agent_id,
+                start_after=args.start_after, start_before=args.start_before,
+                details=not args.no_details, concurrency=args.concurrency,
+                batch_size=args.batch_size, checkpoint_path=args.checkpoint,
+                archive=archive, progress=None if args.quiet else progress,
+                part_batches=args.part_batches,
+            )
+
+    print(json.dumps(asyncio.run(run()), indent=2))
+    return 0
+
+
+def _recordings(args: argparse.Namespace) -> int:
+    from .client import RetellClient
+    from .operations.recordings import adownload_recordings
+
+    call_ids = list(args.call_ids)
+    if args.ids_file:
+        with (sys.stdin if args.ids_file == "-" else open(args.ids_file)) as f:
+            call_ids += [line.strip() for line in f if line.strip()]
+    if not call_ids:
+        print("No call IDs given.", file=sys.stderr)
+        return 2
+
+    async def run() -> dict:
+        async with RetellClient() as client:
+            return await adownload_recordings(
+                client, call_ids, cache_dir=args.cache_dir, concurrency=args.concurrency,
+            )
+
+    report = asyncio.run(run())
+    print(json.dumps(report, indent=2))
+    return 1 if report["summary"]["failed"] else 0
+
+
+def _webhooks(args: argparse.Namespace) -> int:
+    from .archive import CallArchive
+    from .config import get_settings
+    from .webhooks import WebhookReceiver, webhook_server
+
+    settings = get_settings()
+    if not settings.archive_path:
+        print("The call archive is disabled; set RETELL_ARCHIVE_PATH to enable it.", file=sys.stderr)
+        return 2
+    receiver = WebhookReceiver.from_settings(CallArchive.from_settings(settings), settings)
+    host = args.host or settings.webhook_host
+    print(f"Receiving webhooks on http://{host}:{args.port}{receiver.path}", file=sys.stderr)
+    webhook_server(receiver, host, args.port).run()
+    return 0
+
+
+def _sync_agents(args: argparse.Namespace) -> int:
+    from .client import RetellClient
+    from .operations.sync import load_manifest, sync_agents_async
+
+    try:
+        agents = load_manifest(args.manifest)
+    except (OSError, ValueError, ImportError) as exc:
+        print(f"Cannot read manifest: {exc}", file=sys.stderr)
+        return 2
+
+    async def run() -> dict:
+        async with RetellClient() as client:
+            return await sync_agents_async(client, agents, dry_run=args.dry_run, concurrency=args.concurrency)
+
+    report = asyncio.run(run())
+    print(json.dumps(report, indent=2))
+    summary = report["summary"]
+    return 1 if summary["failed"] or summary["not_found"] else 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "export":
+        return _export(args)
+    if args.command == "recordings":
+        return _recordings(args)
+    if args.command == "webhooks":
+        return _webhooks(args)
+    if args.command == "sync-agents":
+        return _sync_agents(args)
+    from .server import main as serve
+
+    serve()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import threading
+import time
+import warnings
+from collections.abc import Awaitable
+from typing import Any, TypeVar
+
 import httpx
 
+from mcp_retell.cache import MISS, ResponseCache
+from mcp_retell.callcache import CallCache, call_id_of
 from mcp_retell.config import get_settings
+from mcp_retell.httpcache import HTTPCache
+from mcp_retell.ratelimit import RateLimiter
+from mcp_retell.retry import RetryPolicy, RetryStats, retry_reason
+from mcp_retell.singleflight import SingleFlight
+from mcp_retell.timeouts import TimeoutPolicy, remaining
+
+T = TypeVar("T")
+
+# Sent when a 304 arrives with nothing cached to answer it from.
+_REFETCH_HEADERS = {"Cache-Control": "no-cache"}
 
 
 class RetellClient:
@@ -13,79 +33,387 @@ class RetellClient:
     Configuration is loaded from environment variables (RETELL_* prefix)
     or a .env file via Pydantic Settings. Explicit constructor params
     override settings values.
+
+    The client owns two long-lived connection pools: an ``httpx.AsyncClient``
+    for the async methods and a thread-safe ``httpx.Client`` for the
+    ``*_sync`` methods. Both are created lazily on first use and reused for
+    every request, so repeated calls skip the TCP/TLS handshake. Release them
+    with :meth:`aclose` / :meth:`close`, or use the client as a (async)
+    context manager.
+
+    Each request is sent with the connect/read/write/pool timeouts that
+    :attr:`timeouts` assigns to its endpoint. Inside a
+    :func:`~mcp_retell.timeouts.deadline` block, timeouts are clamped to the
+    time left and no retry is scheduled past it.
+
+    Transient failures (429/5xx, connect errors) are retried according to
+    ``retry_policy``; counters are available from :attr:`retry_stats`.
+    Every attempt first takes a token from :attr:`rate_limiter`, whose
+    ``snapshot()`` reports how long requests queued client-side.
+
+    GET responses for agents, voices and phone numbers are served from
+    :attr:`cache` until their TTL expires or a mutating request to the same
+    resource invalidates them; pass ``bypass_cache=True`` to force a refetch.
+    While a refetch of an expired entry is in flight, other reads get the
+    expired copy instead of waiting for it. Below that, :attr:`http_cache` stores GET bodies with their
+    ``ETag``/``Last-Modified`` validators and revalidates them with
+    conditional requests, so an unchanged resource comes back as a bodiless
+    ``304``.
+
+    Finished calls read through ``/get-call/`` are kept in :attr:`call_cache`
+    and never fetched again (``bypass_cache=True`` also skips it).
+    Identical GETs that are in flight at the same time share one upstream
+    request (see :attr:`singleflight`).
     """
 
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
+        *,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        compression: bool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        timeouts: TimeoutPolicy | None = None,
+        call_cache: CallCache | None = None,
+        http_cache: HTTPCache | None = None,
     ) -> None:
         settings = get_settings()
         self.api_key = (api_key or settings.api_key).strip()
         self.base_url = (base_url or settings.base_url).strip()
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.max_connections,
+            max_keepalive_connections=(
+                max_keepalive_connections
+                if max_keepalive_connections is not None
+                else settings.max_keepalive_connections
+            ),
+            keepalive_expiry=(
+                keepalive_expiry if keepalive_expiry is not None else settings.keepalive_expiry
+            ),
+        )
+        self.http2 = settings.http2 if http2 is None else http2
+        self.compression = settings.compression if compression is None else compression
+
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            warnings.warn(
+                "HTTP/2 requested but the 'h2' package is not installed; "
+                "falling back to HTTP/1.1 (pip install 'mcp-retell[http2]').",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            self.http2 = False
+
+        self.timeouts = timeouts or TimeoutPolicy.from_settings(settings)
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(settings)
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter or RateLimiter.from_settings(settings)
+        self.cache = cache or ResponseCache.from_settings(settings)
+        self.call_cache = call_cache or CallCache.from_settings(settings)
+        self.http_cache = http_cache or HTTPCache.from_settings(settings)
+        self.singleflight = SingleFlight()
+
+        self._async_http: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_http: httpx.Client | None = None
+        self._sync_lock = threading.Lock()
 
     def _headers(self) -> dict[str, str]:
-        return {
+        headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        if not self.compression:
+            headers["Accept-Encoding"] = "identity"
+        return headers
+
+    # --- Connection pools ---
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "headers": self._headers(),
+            "timeout": self.timeouts.default,
+            "limits": self.limits,
+            "http2": self.http2,
+        }
+
+    async def _get_async_http(self) -> httpx.AsyncClient:
+        """Return the pooled async client, rebuilding it if the event loop changed.
+
+        An ``httpx.AsyncClient`` is bound to the loop its connections were
+        opened on, so callers that run successive ``asyncio.run()`` calls get
+        a fresh pool instead of connections tied to a closed loop. The old
+        pool is closed so its sockets are released rather than leaked.
+        """
+        loop = asyncio.get_running_loop()
+        http = self._async_http
+        if http is None or http.is_closed or self._async_loop is not loop:
+            stale = http if http is not None and not http.is_closed else None
+            http = httpx.AsyncClient(**self._client_kwargs())
+            self._async_http = http
+            self._async_loop = loop
+            if stale is not None:
+                await _close_stale(stale)
+        return http
+
+    def _get_sync_http(self) -> httpx.Client:
+        """Return the pooled sync client (``httpx.Client`` is thread-safe)."""
+        http = self._sync_http
+        if http is None or http.is_closed:
+            with self._sync_lock:
+                http = self._sync_http
+                if http is None or http.is_closed:
+                    http = httpx.Client(**self._client_kwargs())
+                    self._sync_http = http
+        return http
+
+    async def _close_async_http(self) -> None:
+        http, self._async_http, self._async_loop = self._async_http, None, None
+        if http is not None:
+            await http.aclose()
+
+    async def aclose(self) -> None:
+        """Close both connection pools."""
+        await self._close_async_http()
+        self.close()
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run ``coro`` with ``asyncio.run()``, closing the async pool it used.
+
+        The sync wrappers around async operations use this, so the pool is
+        closed while its event loop can still release the connections.
+        """
+
+        async def main() -> T:
+            try:
+                return await coro
+            finally:
+                if self._async_loop is asyncio.get_running_loop():
+                    await self._close_async_http()
+
+        return asyncio.run(main())
+
+    def close(self) -> None:
+        """Close the sync connection pool."""
+        with self._sync_lock:
+            http, self._sync_http = self._sync_http, None
+        if http is not None:
+            http.close()
+
+    async def __aenter__(self) -> RetellClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def __enter__(self) -> RetellClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # --- Request core ---
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        started: float,
+        response: httpx.Response | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        delay = self.retry_policy.next_delay(
+            method, attempt, time.monotonic() - started, response=response, exc=exc,
+        )
+        left = remaining()
+        if delay is not None and left is not None and delay >= left:
+            delay = None  # the retry could not finish before the deadline
+        if delay is not None:
+            self.retry_stats.record_retry(retry_reason(response, exc))
+        elif attempt > 1:
+            self.retry_stats.record_giveup()
+        return delay
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        params = kwargs.get("params")
+        cached = self.http_cache.lookup(method, endpoint, params)
+        headers = cached.conditional_headers if cached else None
+        self.retry_stats.record_request()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire(method, endpoint, remaining())
+            timeout = self.timeouts.for_request(endpoint)
+            try:
+                response = await (await self._get_async_http()).request(
+                    method, endpoint, timeout=timeout, headers=headers, **kwargs,
+                )
+            except httpx.TransportError as exc:
+                delay = self._retry_delay(method, attempt, started, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                if not response.is_error:
+                    result = self.http_cache.resolve(method, endpoint, params, response, cached)
+                    if result is not MISS:
+                        return result
+                    if headers == _REFETCH_HEADERS:
+                        raise httpx.HTTPStatusError(
+                            "304 Not Modified for an unconditional request",
+                            request=response.request, response=response,
+                        )
+                    # Nothing cached to answer the 304 from; ask for the full body.
+                    cached, headers = None, _REFETCH_HEADERS
+                    continue
+                delay = self._retry_delay(method, attempt, started, response=response)
+                if delay is None:
+                    response.raise_for_status()
+            await asyncio.sleep(delay)
+
+    def _request_sync(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        params = kwargs.get("params")
+        cached = self.http_cache.lookup(method, endpoint, params)
+        headers = cached.conditional_headers if cached else None
+        self.retry_stats.record_request()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            self.rate_limiter.acquire_sync(method, endpoint, remaining())
+            timeout = self.timeouts.for_request(endpoint)
+            try:
+                response = self._get_sync_http().request(
+                    method, endpoint, timeout=timeout, headers=headers, **kwargs,
+                )
+            except httpx.TransportError as exc:
+                delay = self._retry_delay(method, attempt, started, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                if not response.is_error:
+                    result = self.http_cache.resolve(method, endpoint, params, response, cached)
+                    if result is not MISS:
+                        return result
+                    if headers == _REFETCH_HEADERS:
+                        raise httpx.HTTPStatusError(
+                            "304 Not Modified for an unconditional request",
+                            request=response.request, response=response,
+                        )
+                    # Nothing cached to answer the 304 from; ask for the full body.
+                    cached, headers = None, _REFETCH_HEADERS
+                    continue
+                delay = self._retry_delay(method, attempt, started, response=response)
+                if delay is None:
+                    response.raise_for_status()
+            time.sleep(delay)
+
+    async def _mutate(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        try:
+            return await self._request(method, endpoint, **kwargs)
+        finally:
+            self.cache.invalidate(endpoint)
+
+    def _mutate_sync(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        try:
+            return self._request_sync(method, endpoint, **kwargs)
+        finally:
+            self.cache.invalidate(endpoint)
+
+    def _cached(self, endpoint: str, params: dict | None, call_id: str | None) -> Any:
+        if call_id is not None and not params:
+            call = self.call_cache.get(call_id)
+            return MISS if call is None else call
+        cached = self.cache.get(endpoint, params)
+        if cached is MISS and self.singleflight.in_flight(self.cache.key(endpoint, params)):
+            # Expired, but a refresh is already on its way: serve the last copy
+            # rather than queue behind it.
+            return self.cache.get_stale(endpoint, params)
+        return cached
+
+    def _store(
+        self, endpoint: str, params: dict | None, call_id: str | None, data: Any, generation: int,
+    ) -> None:
+        if call_id is not None and not params:
+            self.call_cache.put(data)
+        else:
+            self.cache.set(endpoint, params, data, generation)
 
     # --- Async methods (for MCP server) ---
 
-    async def get(self, endpoint: str, params: dict | None = None) -> dict | list:
+    async def get(
+        self, endpoint: str, params: dict | None = None, *, bypass_cache: bool = False,
+    ) -> dict | list:
         """Make an async GET request to the Retell API."""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=30.0) as http:
-            response = await http.get(endpoint, headers=self._headers(), params=params)
-            response.raise_for_status()
-            return response.json()
+        call_id = call_id_of(endpoint)
+        if not bypass_cache:
+            cached = self._cached(endpoint, params, call_id)
+            if cached is not MISS:
+                return cached
+
+        async def fetch() -> Any:
+            generation = self.cache.generation(endpoint)
+            data = await self._request("GET", endpoint, params=params)
+            self._store(endpoint, params, call_id, data, generation)
+            return data
+
+        return await self.singleflight.do(self.cache.key(endpoint, params), fetch)
 
     async def post(self, endpoint: str, json: dict | None = None) -> dict:
         """Make an async POST request to the Retell API."""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=30.0) as http:
-            response = await http.post(endpoint, headers=self._headers(), json=json)
-            response.raise_for_status()
-            return response.json()
+        return await self._mutate("POST", endpoint, json=json)
 
     async def patch(self, endpoint: str, json: dict | None = None) -> dict:
         """Make an async PATCH request to the Retell API."""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=30.0) as http:
-            response = await http.patch(endpoint, headers=self._headers(), json=json)
-            response.raise_for_status()
-            return response.json()
+        return await self._mutate("PATCH", endpoint, json=json)
 
     async def delete(self, endpoint: str) -> dict:
         """Make an async DELETE request to the Retell API."""
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=30.0) as http:
-            response = await http.delete(endpoint, headers=self._headers())
-            response.raise_for_status()
-            return response.json()
+        return await self._mutate("DELETE", endpoint)
 
     # --- Sync methods (for LangChain tools / operations) ---
 
-    def get_sync(self, endpoint: str, params: dict | None = None) -> dict | list:
+    def get_sync(
+        self, endpoint: str, params: dict | None = None, *, bypass_cache: bool = False,
+    ) -> dict | list:
         """Synchronous GET for LangChain tools."""
-        with httpx.Client(base_url=self.base_url, timeout=30.0) as http:
-            response = http.get(endpoint, headers=self._headers(), params=params)
-            response.raise_for_status()
-            return response.json()
+        call_id = call_id_of(endpoint)
+        if not bypass_cache:
+            cached = self._cached(endpoint, params, call_id)
+            if cached is not MISS:
+                return cached
+
+        def fetch() -> Any:
+            generation = self.cache.generation(endpoint)
+            data = self._request_sync("GET", endpoint, params=params)
+            self._store(endpoint, params, call_id, data, generation)
+            return data
+
+        return self.singleflight.do_sync(self.cache.key(endpoint, params), fetch)
 
     def post_sync(self, endpoint: str, json: dict | None = None) -> dict:
         """Synchronous POST for LangChain tools."""
-        with httpx.Client(base_url=self.base_url, timeout=30.0) as http:
-            response = http.post(endpoint, headers=self._headers(), json=json)
-            response.raise_for_status()
-            return response.json()
+        return self._mutate_sync("POST", endpoint, json=json)
 
     def patch_sync(self, endpoint: str, json: dict | None = None) -> dict:
         """Synchronous PATCH for LangChain tools."""
-        with httpx.Client(base_url=self.base_url, timeout=30.0) as http:
-            response = http.patch(endpoint, headers=self._headers(), json=json)
-            response.raise_for_status()
-            return response.json()
+        return self._mutate_sync("PATCH", endpoint, json=json)
 
     def delete_sync(self, endpoint: str) -> dict:
         """Synchronous DELETE for LangChain tools."""
-        with httpx.Client(base_url=self.base_url, timeout=30.0) as http:
-            response = http.delete(endpoint, headers=self._headers())
-            response.raise_for_status()
-            return response.json()
+        return self._mutate_sync("DELETE", endpoint)
+
+
+async def _close_stale(http: httpx.AsyncClient) -> None:
+    """Close a pool left behind by a previous event loop, ignoring errors
+    from connections that loop can no longer service."""
+    try:
+        await http.aclose()
+    except (RuntimeError, OSError, httpx.HTTPError):
+        pass
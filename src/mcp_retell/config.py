@@ -16,6 +16,207 @@ class Settings(BaseSettings):
         description="Retell API base URL",
     )
 
+    # --- Connection pool ---
+    max_connections: int = Field(
+        default=100,
+        description="Maximum concurrent connections per pool",
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum idle connections kept alive per pool",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle connection is kept before closing",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 (requires the 'h2' package)",
+    )
+    compression: bool = Field(
+        default=True,
+        description="Accept compressed (gzip/deflate/br/zstd) response bodies",
+    )
+
+    # --- Timeouts (seconds) ---
+    timeout_connect: float = Field(
+        default=5.0,
+        description="Time allowed to establish a connection",
+    )
+    timeout_read: float = Field(
+        default=30.0,
+        description="Time allowed between bytes of a response",
+    )
+    timeout_write: float = Field(
+        default=30.0,
+        description="Time allowed between bytes of a request body",
+    )
+    timeout_pool: float = Field(
+        default=10.0,
+        description="Time allowed to wait for a free pooled connection",
+    )
+    timeout_read_overrides: dict[str, float] = Field(
+        default={"/list-calls": 60.0},
+        description="Read timeouts by endpoint prefix, as JSON (e.g. {\"/list-voices\": 10})",
+    )
+    tool_deadline: float = Field(
+        default=0.0,
+        description="Overall deadline for each MCP or LangChain tool invocation (0 disables it)",
+    )
+
+    # --- Retries ---
+    retry_max_attempts: int = Field(
+        default=4,
+        description="Maximum attempts per request, including the first",
+    )
+    retry_backoff_base: float = Field(
+        default=0.5,
+        description="Base delay in seconds for exponential backoff",
+    )
+    retry_backoff_max: float = Field(
+        default=8.0,
+        description="Maximum backoff delay in seconds between attempts",
+    )
+    retry_max_elapsed: float = Field(
+        default=30.0,
+        description="Give up retrying once this many seconds have elapsed",
+    )
+
+    # --- Client-side rate limits (requests/second; 0 disables a bucket) ---
+    rate_limit_read_rps: float = Field(
+        default=10.0,
+        description="Sustained rate for GET endpoints (/list-*, /get-*)",
+    )
+    rate_limit_read_burst: int = Field(
+        default=20,
+        description="Burst size for GET endpoints",
+    )
+    rate_limit_write_rps: float = Field(
+        default=5.0,
+        description="Sustained rate for create/update/delete endpoints",
+    )
+    rate_limit_write_burst: int = Field(
+        default=10,
+        description="Burst size for create/update/delete endpoints",
+    )
+    rate_limit_create_call_rps: float = Field(
+        default=2.0,
+        description="Sustained rate for /create-phone-call",
+    )
+    rate_limit_create_call_burst: int = Field(
+        default=5,
+        description="Burst size for /create-phone-call",
+    )
+
+    # --- Response cache (TTL seconds; 0 disables caching for a resource) ---
+    cache_ttl_agents: float = Field(
+        default=60.0,
+        description="TTL for /list-agents and /get-agent responses",
+    )
+    cache_ttl_voices: float = Field(
+        default=3600.0,
+        description="TTL for /list-voices and /get-voice responses",
+    )
+    cache_ttl_phone_numbers: float = Field(
+        default=300.0,
+        description="TTL for /list-phone-numbers responses",
+    )
+    cache_max_entries: int = Field(
+        default=512,
+        description="Maximum cached responses before LRU eviction",
+    )
+
+    # --- HTTP validation cache ---
+    http_cache_backend: str = Field(
+        default="memory",
+        description="Where conditional-request bodies are kept: memory, disk or none",
+    )
+    http_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Size limit of the HTTP validation cache in bytes",
+    )
+    http_cache_path: str = Field(
+        default="",
+        description="SQLite file for the disk backend (empty: ~/.cache/mcp-retell/http-cache.db)",
+    )
+
+    # --- Finished-call cache ---
+    call_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Memory for cached finished calls, compressed bytes (0 disables it)",
+    )
+    call_cache_path: str = Field(
+        default="",
+        description="SQLite file that persists cached finished calls (empty keeps them in memory only)",
+    )
+    call_cache_disk_max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Size limit of the on-disk finished-call cache in bytes",
+    )
+    call_cache_settle_s: float = Field(
+        default=600.0,
+        description="Seconds after an ended call without call_analysis until it counts as final",
+    )
+
+    # --- Catalog warm-up ---
+    warm_catalogs: bool = Field(
+        default=False,
+        description="Prefetch agents, voices and phone numbers at server start and keep them fresh",
+    )
+    warm_interval: float = Field(
+        default=0.0,
+        description="Seconds between catalog refreshes, capped at 80% of each resource's cache TTL (0: that cap)",
+    )
+
+    # --- Local call archive ---
+    archive_path: str = Field(
+        default="",
+        description="SQLite file for the local call archive (empty disables it)",
+    )
+
+    # --- Webhook receiver ---
+    webhook_secret: str = Field(
+        default="",
+        description="Key that signs webhook events (empty: the API key)",
+    )
+    webhook_host: str = Field(
+        default="127.0.0.1",
+        description="Interface the webhook receiver listens on",
+    )
+    webhook_port: int = Field(
+        default=0,
+        description="Run the webhook receiver beside the MCP server on this port (0 disables it)",
+    )
+    webhook_queue_size: int = Field(
+        default=1000,
+        description="Events buffered before the receiver answers 503",
+    )
+
+    # --- Recording downloads ---
+    recordings_dir: str = Field(
+        default="",
+        description="Cache directory for downloaded recordings (empty: ~/.cache/mcp-retell/recordings)",
+    )
+
+    # --- Bulk dialing ---
+    dial_dir: str = Field(
+        default="",
+        description=(
+            "Directory the bulk_create_phone_calls tool reads rows files from and keeps "
+            "checkpoints in (empty: ~/.cache/mcp-retell/dials)"
+        ),
+    )
+
+    # --- Tool response shaping ---
+    response_compact: bool = Field(
+        default=False,
+        description="Encode tool responses as compact JSON by default",
+    )
+    response_max_bytes: int = Field(
+        default=0,
+        description="Default cap on tool response size in bytes (0 disables it)",
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="RETELL_",
         env_file=".env",
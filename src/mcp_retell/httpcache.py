@@ -0,0 +1,236 @@
+"""HTTP validation cache — conditional GETs with ``ETag``/``Last-Modified``.
+
+The TTL :class:`~mcp_retell.cache.ResponseCache` answers without a request
+but can serve stale data; this layer sits underneath it and always asks
+Retell, cheaply. Every cacheable GET response is stored with its validators
+and a SHA-256 of its body. The next request for the same URL carries
+``If-None-Match``/``If-Modified-Since``, and a ``304 Not Modified`` is
+answered from the stored body, so an unchanged agent config costs a round
+trip but no transfer.
+
+Retell's list and get endpoints usually send no validators, so the body
+hash is the fallback: a full ``200`` that repeats the stored body skips the
+backend write (:meth:`HTTPCache.snapshot` reports these as ``unchanged``),
+and the body parsed last time under that hash is returned without decoding
+again (``reused``). A reused body is the same object each time it is
+returned, so callers must treat responses as read-only (the TTL cache and
+single-flight followers already get copies). A ``304`` that
+cannot be answered from the cache is reported to the client as
+:data:`~mcp_retell.cache.MISS`, and the client asks again without
+validators.
+
+Bodies live in a pluggable backend: :class:`MemoryBackend` (an LRU bounded
+by bytes) or :class:`DiskBackend` (a size-bounded, zlib-compressed SQLite
+file that survives restarts). Stored bodies are decoded with ``orjson``
+when installed (``pip install 'mcp-retell[fast]'``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+import httpx
+
+from mcp_retell.cache import MISS
+from mcp_retell.callcache import BlobStore
+from mcp_retell.config import Settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is missing
+    orjson = None
+
+
+def _loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+# Calls change constantly while live and are handled by the call cache once
+# they are final; caching their bodies here would only cost memory.
+UNCACHED_PREFIXES = ("/list-calls", "/get-call/")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    body: bytes
+    digest: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def encode(self) -> bytes:
+        meta = json.dumps({"digest": self.digest, "etag": self.etag, "last_modified": self.last_modified})
+        return meta.encode() + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, blob: bytes) -> CachedResponse:
+        meta, _, body = blob.partition(b"\n")
+        return cls(body=body, **json.loads(meta))
+
+
+class CacheBackend(Protocol):
+    """Storage for :class:`CachedResponse` entries by key."""
+
+    def get(self, key: str) -> Optional[CachedResponse]: ...
+
+    def set(self, key: str, entry: CachedResponse) -> None: ...
+
+
+class MemoryBackend:
+    """In-process LRU of responses, bounded by total body bytes."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._data: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            self.bytes += len(entry.body) - (len(old.body) if old else 0)
+            self._data[key] = entry
+            while self.bytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.bytes -= len(evicted.body)
+
+
+class DiskBackend:
+    """Responses in a zlib-compressed SQLite file, bounded by total size."""
+
+    def __init__(self, path: str | Path, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.store = BlobStore(path, max_bytes, table="responses")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        blob = self.store.get(key)
+        return None if blob is None else CachedResponse.decode(zlib.decompress(blob))
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self.store.put(key, zlib.compress(entry.encode(), 6))
+
+    def close(self) -> None:
+        self.store.close()
+
+
+class HTTPCache:
+    """Adds validators to GETs and resolves ``304`` responses from a backend."""
+
+    def __init__(self, backend: Optional[CacheBackend], parsed_max_bytes: int = 8 * 1024 * 1024) -> None:
+        self.backend = backend
+        self.parsed_max_bytes = parsed_max_bytes
+        # Body digest -> (body size, parsed body), least recently used first.
+        self._parsed: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._parsed_bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {
+            "revalidated": 0, "not_modified": 0, "unchanged": 0, "stored": 0, "reused": 0, "misses": 0,
+        }
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> HTTPCache:
+        if settings.http_cache_backend == "disk":
+            path = settings.http_cache_path or Path.home() / ".cache" / "mcp-retell" / "http-cache.db"
+            return cls(DiskBackend(Path(path).expanduser(), settings.http_cache_max_bytes))
+        if settings.http_cache_backend == "memory" and settings.http_cache_max_bytes > 0:
+            return cls(MemoryBackend(settings.http_cache_max_bytes))
+        return cls(None)
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[dict]) -> str:
+        return endpoint + "?" + json.dumps(params or {}, sort_keys=True, default=str)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def _parse(self, body: bytes, digest: str) -> Any:
+        """``body`` decoded, reusing the value parsed last time for ``digest``."""
+        with self._lock:
+            hit = self._parsed.get(digest)
+            if hit is not None:
+                self._parsed.move_to_end(digest)
+                self.counters["reused"] += 1
+                return hit[1]
+        data = _loads(body)
+        if len(body) <= self.parsed_max_bytes:
+            with self._lock:
+                old = self._parsed.pop(digest, None)
+                self._parsed_bytes += len(body) - (old[0] if old else 0)
+                self._parsed[digest] = (len(body), data)
+                while self._parsed_bytes > self.parsed_max_bytes:
+                    _, (size, _) = self._parsed.popitem(last=False)
+                    self._parsed_bytes -= size
+        return data
+
+    def lookup(self, method: str, endpoint: str, params: Optional[dict]) -> Optional[CachedResponse]:
+        """The stored response to revalidate for this request, if any."""
+        if self.backend is None or method != "GET" or endpoint.startswith(UNCACHED_PREFIXES):
+            return None
+        entry = self.backend.get(self.key(endpoint, params))
+        if entry is not None and entry.conditional_headers:
+            self._count("revalidated")
+        return entry
+
+    def resolve(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict],
+        response: httpx.Response,
+        entry: Optional[CachedResponse],
+    ) -> Any:
+        """Decode a successful response, answering ``304`` from ``entry`` and storing new bodies.
+
+        Returns :data:`~mcp_retell.cache.MISS` for a ``304`` without an
+        ``entry`` to answer it from.
+        """
+        if response.status_code == 304:
+            if entry is None:
+                self._count("misses")
+                return MISS
+            self._count("not_modified")
+            return self._parse(entry.body, entry.digest)
+        if self.backend is None or method != "GET" or endpoint.startswith(UNCACHED_PREFIXES):
+            return response.json()
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if entry is not None and (entry.digest, entry.etag, entry.last_modified) == (digest, etag, last_modified):
+            self._count("unchanged")
+        else:
+            self.backend.set(
+                self.key(endpoint, params),
+                CachedResponse(body=body, digest=digest, etag=etag, last_modified=last_modified),
+            )
+            self._count("stored")
+        return self._parse(body, digest)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"backend": type(self.backend).__name__ if self.backend else None, **self.counters}
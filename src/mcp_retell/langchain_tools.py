@@ -1,4 +1,8 @@
-"""LangChain @tool wrappers for Retell operations.
+"""LangChain tool wrappers for Retell operations.
+
+Every tool runs on the sync client for ``invoke`` and natively on the async
+client for ``ainvoke``, so parallel tool calls in async agents share one
+connection pool without thread hops.
 
 Usage:
     from mcp_retell.langchain_tools import TOOLS
@@ -9,15 +13,22 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Optional
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
+from .analytics import aanalyze_calls, analyze_calls
+from .archive import CallArchive, arefresh_archive, refresh_archive
 from .client import RetellClient
+from .config import get_settings
 from .operations import agents, calls, phones, voices
+from .shaping import shape
+from .timeouts import deadline
 
 
 @lru_cache
@@ -26,28 +37,132 @@ def _get_client() -> RetellClient:
     return RetellClient()
 
 
+@lru_cache
+def _get_archive() -> Optional[CallArchive]:
+    """Singleton CallArchive at RETELL_ARCHIVE_PATH, if configured."""
+    settings = get_settings()
+    return CallArchive.from_settings(settings) if settings.archive_path else None
+
+
+def _require_archive() -> CallArchive:
+    archive = _get_archive()
+    if archive is None:
+        raise ValueError("The call archive is disabled; set RETELL_ARCHIVE_PATH to enable it.")
+    return archive
+
+
+class ShapingInput(BaseModel):
+    """Response-shaping options shared by every tool."""
+
+    fields: Optional[str] = Field(
+        default=None, description="Comma-separated fields to return; dotted paths select nested keys",
+    )
+    compact: Optional[bool] = Field(default=None, description="Return compact JSON instead of pretty-printed")
+    max_bytes: Optional[int] = Field(default=None, description="Truncate the response to at most this many bytes")
+
+
+def _tool(args_schema: type[BaseModel], coroutine: Callable[..., Awaitable[str]]):
+    """Like ``@tool``, but with a native async implementation for ``ainvoke``.
+
+    Both implementations run under the RETELL_TOOL_DEADLINE budget, as the
+    MCP server's tools do.
+    """
+    @functools.wraps(coroutine)
+    async def arun(*args: Any, **kwargs: Any) -> str:
+        with deadline(get_settings().tool_deadline):
+            return await coroutine(*args, **kwargs)
+
+    def decorator(func: Callable[..., str]) -> StructuredTool:
+        @functools.wraps(func)
+        def run(*args: Any, **kwargs: Any) -> str:
+            with deadline(get_settings().tool_deadline):
+                return func(*args, **kwargs)
+
+        return StructuredTool.from_function(func=run, coroutine=arun, args_schema=args_schema)
+    return decorator
+
+
 # =============================================================================
 # Agents
 # =============================================================================
 
 
-@tool
-def retell_list_agents() -> str:
+async def _aretell_list_agents(
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await agents.alist_agents(_get_client())
+    return shape(data, fields, compact, max_bytes, tool="retell_list_agents")
+
+
+@_tool(args_schema=ShapingInput, coroutine=_aretell_list_agents)
+def retell_list_agents(
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """List all voice agents."""
-    return json.dumps(agents.list_agents(_get_client()), indent=2)
+    data = agents.list_agents(_get_client())
+    return shape(data, fields, compact, max_bytes, tool="retell_list_agents")
 
 
-class GetAgentInput(BaseModel):
+class GetAgentInput(ShapingInput):
     agent_id: str = Field(description="The agent ID to retrieve")
 
 
-@tool(args_schema=GetAgentInput)
-def retell_get_agent(agent_id: str) -> str:
+async def _aretell_get_agent(
+    agent_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await agents.aget_agent(_get_client(), agent_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_agent")
+
+
+@_tool(args_schema=GetAgentInput, coroutine=_aretell_get_agent)
+def retell_get_agent(
+    agent_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """Get details of a specific voice agent."""
-    return json.dumps(agents.get_agent(_get_client(), agent_id), indent=2)
+    data = agents.get_agent(_get_client(), agent_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_agent")
+
+
+class GetAgentsManyInput(ShapingInput):
+    agent_ids: list[str] = Field(description="Agent IDs to retrieve")
+    concurrency: int = Field(default=10, description="Maximum agents fetched at once")
+
+
+async def _aretell_get_agents_many(
+    agent_ids: list[str],
+    concurrency: int = 10,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await agents.aget_agents_many(_get_client(), agent_ids, concurrency=concurrency)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_agents_many")
+
+
+@_tool(args_schema=GetAgentsManyInput, coroutine=_aretell_get_agents_many)
+def retell_get_agents_many(
+    agent_ids: list[str],
+    concurrency: int = 10,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """Get many voice agents concurrently; results keep input order with per-agent errors."""
+    data = agents.get_agents_many(_get_client(), agent_ids, concurrency=concurrency)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_agents_many")
 
 
-class CreateAgentInput(BaseModel):
+class CreateAgentInput(ShapingInput):
     agent_name: str = Field(description="Name for the agent")
     voice_id: str = Field(description="Voice ID to use (from Retell voice library)")
     prompt: str = Field(description="System prompt defining agent behavior")
@@ -59,7 +174,31 @@ class CreateAgentInput(BaseModel):
     enable_backchannel: bool = Field(default=True, description="Enable 'uh-huh', 'I see' responses")
 
 
-@tool(args_schema=CreateAgentInput)
+async def _aretell_create_agent(
+    agent_name: str,
+    voice_id: str,
+    prompt: str,
+    language: str = "en-US",
+    begin_message: Optional[str] = None,
+    model: str = "gpt-4o-mini",
+    responsiveness: float = 1.0,
+    interruption_sensitivity: float = 1.0,
+    enable_backchannel: bool = True,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await agents.acreate_agent(
+        _get_client(), agent_name, voice_id, prompt,
+        language=language, begin_message=begin_message, model=model,
+        responsiveness=responsiveness,
+        interruption_sensitivity=interruption_sensitivity,
+        enable_backchannel=enable_backchannel,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_create_agent")
+
+
+@_tool(args_schema=CreateAgentInput, coroutine=_aretell_create_agent)
 def retell_create_agent(
     agent_name: str,
     voice_id: str,
@@ -70,21 +209,22 @@ def retell_create_agent(
     responsiveness: float = 1.0,
     interruption_sensitivity: float = 1.0,
     enable_backchannel: bool = True,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
 ) -> str:
     """Create a new voice agent."""
-    return json.dumps(
-        agents.create_agent(
-            _get_client(), agent_name, voice_id, prompt,
-            language=language, begin_message=begin_message, model=model,
-            responsiveness=responsiveness,
-            interruption_sensitivity=interruption_sensitivity,
-            enable_backchannel=enable_backchannel,
-        ),
-        indent=2,
+    data = agents.create_agent(
+        _get_client(), agent_name, voice_id, prompt,
+        language=language, begin_message=begin_message, model=model,
+        responsiveness=responsiveness,
+        interruption_sensitivity=interruption_sensitivity,
+        enable_backchannel=enable_backchannel,
     )
+    return shape(data, fields, compact, max_bytes, tool="retell_create_agent")
 
 
-class UpdateAgentInput(BaseModel):
+class UpdateAgentInput(ShapingInput):
     agent_id: str = Field(description="Agent ID to update")
     agent_name: Optional[str] = Field(default=None, description="New name")
     prompt: Optional[str] = Field(default=None, description="New system prompt")
@@ -92,33 +232,68 @@ class UpdateAgentInput(BaseModel):
     voice_id: Optional[str] = Field(default=None, description="New voice ID")
 
 
-@tool(args_schema=UpdateAgentInput)
+async def _aretell_update_agent(
+    agent_id: str,
+    agent_name: Optional[str] = None,
+    prompt: Optional[str] = None,
+    begin_message: Optional[str] = None,
+    voice_id: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await agents.aupdate_agent(
+        _get_client(), agent_id,
+        agent_name=agent_name, prompt=prompt,
+        begin_message=begin_message, voice_id=voice_id,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_update_agent")
+
+
+@_tool(args_schema=UpdateAgentInput, coroutine=_aretell_update_agent)
 def retell_update_agent(
     agent_id: str,
     agent_name: Optional[str] = None,
     prompt: Optional[str] = None,
     begin_message: Optional[str] = None,
     voice_id: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
 ) -> str:
     """Update an existing voice agent."""
-    return json.dumps(
-        agents.update_agent(
-            _get_client(), agent_id,
-            agent_name=agent_name, prompt=prompt,
-            begin_message=begin_message, voice_id=voice_id,
-        ),
-        indent=2,
+    data = agents.update_agent(
+        _get_client(), agent_id,
+        agent_name=agent_name, prompt=prompt,
+        begin_message=begin_message, voice_id=voice_id,
     )
+    return shape(data, fields, compact, max_bytes, tool="retell_update_agent")
 
 
-class DeleteAgentInput(BaseModel):
+class DeleteAgentInput(ShapingInput):
     agent_id: str = Field(description="Agent ID to delete")
 
 
-@tool(args_schema=DeleteAgentInput)
-def retell_delete_agent(agent_id: str) -> str:
+async def _aretell_delete_agent(
+    agent_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await agents.adelete_agent(_get_client(), agent_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_delete_agent")
+
+
+@_tool(args_schema=DeleteAgentInput, coroutine=_aretell_delete_agent)
+def retell_delete_agent(
+    agent_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """Delete a voice agent."""
-    return json.dumps(agents.delete_agent(_get_client(), agent_id), indent=2)
+    data = agents.delete_agent(_get_client(), agent_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_delete_agent")
 
 
 # =============================================================================
@@ -126,68 +301,328 @@ def retell_delete_agent(agent_id: str) -> str:
 # =============================================================================
 
 
-class CreatePhoneCallInput(BaseModel):
+class CreatePhoneCallInput(ShapingInput):
     agent_id: str = Field(description="Agent ID to handle the call")
     to_number: str = Field(description="Phone number to call (E.164 format: +1234567890)")
     from_number: str = Field(description="Caller ID phone number (must be registered)")
     metadata: Optional[str] = Field(default=None, description="Optional JSON metadata to attach to call")
 
 
-@tool(args_schema=CreatePhoneCallInput)
+async def _aretell_create_phone_call(
+    agent_id: str,
+    to_number: str,
+    from_number: str,
+    metadata: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await calls.acreate_phone_call(
+        _get_client(), agent_id, to_number, from_number, metadata=metadata,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_create_phone_call")
+
+
+@_tool(args_schema=CreatePhoneCallInput, coroutine=_aretell_create_phone_call)
 def retell_create_phone_call(
     agent_id: str,
     to_number: str,
     from_number: str,
     metadata: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
 ) -> str:
     """Initiate an outbound phone call."""
-    return json.dumps(
-        calls.create_phone_call(
-            _get_client(), agent_id, to_number, from_number, metadata=metadata,
-        ),
-        indent=2,
+    data = calls.create_phone_call(
+        _get_client(), agent_id, to_number, from_number, metadata=metadata,
     )
+    return shape(data, fields, compact, max_bytes, tool="retell_create_phone_call")
 
 
-class ListCallsInput(BaseModel):
+class ListCallsInput(ShapingInput):
     agent_id: Optional[str] = Field(default=None, description="Filter by agent ID")
     limit: int = Field(default=50, description="Maximum calls to return")
     sort_order: str = Field(default="descending", description="'ascending' or 'descending' by start time")
+    pagination_key: Optional[str] = Field(
+        default=None, description="call_id of the last call in the previous page, to fetch the next page",
+    )
 
 
-@tool(args_schema=ListCallsInput)
+async def _aretell_list_calls(
+    agent_id: Optional[str] = None,
+    limit: int = 50,
+    sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await calls.alist_calls(
+        _get_client(), agent_id=agent_id, limit=limit, sort_order=sort_order,
+        pagination_key=pagination_key,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_list_calls")
+
+
+@_tool(args_schema=ListCallsInput, coroutine=_aretell_list_calls)
 def retell_list_calls(
     agent_id: Optional[str] = None,
     limit: int = 50,
     sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
 ) -> str:
     """List phone calls."""
-    return json.dumps(
-        calls.list_calls(
-            _get_client(), agent_id=agent_id, limit=limit, sort_order=sort_order,
-        ),
-        indent=2,
+    data = calls.list_calls(
+        _get_client(), agent_id=agent_id, limit=limit, sort_order=sort_order,
+        pagination_key=pagination_key,
     )
+    return shape(data, fields, compact, max_bytes, tool="retell_list_calls")
 
 
-class GetCallInput(BaseModel):
+class GetCallInput(ShapingInput):
     call_id: str = Field(description="The call ID to retrieve")
 
 
-@tool(args_schema=GetCallInput)
-def retell_get_call(call_id: str) -> str:
+async def _aretell_get_call(
+    call_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await calls.aget_call(_get_client(), call_id, archive=_get_archive(), refresh=True)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_call")
+
+
+@_tool(args_schema=GetCallInput, coroutine=_aretell_get_call)
+def retell_get_call(
+    call_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """Get details of a specific call."""
-    return json.dumps(calls.get_call(_get_client(), call_id), indent=2)
+    data = calls.get_call(_get_client(), call_id, archive=_get_archive(), refresh=True)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_call")
+
 
+class GetCallsManyInput(ShapingInput):
+    call_ids: list[str] = Field(description="Call IDs to retrieve")
+    concurrency: int = Field(default=10, description="Maximum calls fetched at once")
 
-class GetCallTranscriptInput(BaseModel):
+
+async def _aretell_get_calls_many(
+    call_ids: list[str],
+    concurrency: int = 10,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await calls.aget_calls_many(
+        _get_client(), call_ids, concurrency=concurrency, archive=_get_archive(),
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_get_calls_many")
+
+
+@_tool(args_schema=GetCallsManyInput, coroutine=_aretell_get_calls_many)
+def retell_get_calls_many(
+    call_ids: list[str],
+    concurrency: int = 10,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """Get many calls concurrently; results keep input order with per-call errors."""
+    data = calls.get_calls_many(_get_client(), call_ids, concurrency=concurrency, archive=_get_archive())
+    return shape(data, fields, compact, max_bytes, tool="retell_get_calls_many")
+
+
+class GetCallTranscriptInput(ShapingInput):
     call_id: str = Field(description="The call ID to get transcript for")
+    start_turn: Optional[int] = Field(default=None, description="First turn index to return")
+    end_turn: Optional[int] = Field(default=None, description="Stop before this turn index")
+    last_n: Optional[int] = Field(default=None, description="Only the last N (matching) turns")
+    speaker: Optional[str] = Field(default=None, description="Only turns by 'agent' or 'user'")
+    max_chars: Optional[int] = Field(default=None, description="Character budget for returned turns")
+    max_tokens: Optional[int] = Field(default=None, description="Approximate token budget for returned turns")
+    cursor: Optional[int] = Field(default=None, description="next_cursor from a previous chunk")
+
+
+async def _aretell_get_call_transcript(
+    call_id: str,
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    last_n: Optional[int] = None,
+    speaker: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[int] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    window = (start_turn, end_turn, last_n, speaker, max_chars, max_tokens, cursor)
+    if all(option is None for option in window):
+        data = await calls.aget_call_transcript(
+            _get_client(), call_id, archive=_get_archive(), refresh=True,
+        )
+    else:
+        data = await calls.aget_transcript_window(
+            _get_client(), call_id, start_turn=start_turn, end_turn=end_turn, last_n=last_n,
+            speaker=speaker, max_chars=max_chars, max_tokens=max_tokens, cursor=cursor,
+            archive=_get_archive(), refresh=True,
+        )
+    return shape(data, fields, compact, max_bytes, tool="retell_get_call_transcript")
+
+
+@_tool(args_schema=GetCallTranscriptInput, coroutine=_aretell_get_call_transcript)
+def retell_get_call_transcript(
+    call_id: str,
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    last_n: Optional[int] = None,
+    speaker: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[int] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """Get the transcript of a call, whole or as a bounded window of turns."""
+    window = (start_turn, end_turn, last_n, speaker, max_chars, max_tokens, cursor)
+    if all(option is None for option in window):
+        data = calls.get_call_transcript(_get_client(), call_id, archive=_get_archive(), refresh=True)
+    else:
+        data = calls.get_transcript_window(
+            _get_client(), call_id, start_turn=start_turn, end_turn=end_turn, last_n=last_n,
+            speaker=speaker, max_chars=max_chars, max_tokens=max_tokens, cursor=cursor,
+            archive=_get_archive(), refresh=True,
+        )
+    return shape(data, fields, compact, max_bytes, tool="retell_get_call_transcript")
+
+
+class SyncCallArchiveInput(ShapingInput):
+    agent_id: Optional[str] = Field(default=None, description="Only sync calls handled by this agent")
+
+
+async def _aretell_sync_call_archive(
+    agent_id: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await arefresh_archive(_get_client(), _require_archive(), agent_id=agent_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_sync_call_archive")
+
+
+@_tool(args_schema=SyncCallArchiveInput, coroutine=_aretell_sync_call_archive)
+def retell_sync_call_archive(
+    agent_id: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """Incrementally sync the local call archive with Retell: new calls, plus calls not yet final."""
+    data = refresh_archive(_get_client(), _require_archive(), agent_id=agent_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_sync_call_archive")
+
+
+class SearchTranscriptsInput(ShapingInput):
+    query: str = Field(description='Search query: words, "exact phrases", OR, NOT, prefix*')
+    agent_id: Optional[str] = Field(default=None, description="Only calls handled by this agent")
+    start_after: Optional[int] = Field(default=None, description="Only calls started after this time (ms since epoch)")
+    start_before: Optional[int] = Field(default=None, description="Only calls started before this time (ms since epoch)")
+    limit: int = Field(default=20, description="Maximum results to return")
+    offset: int = Field(default=0, description="Result offset; use next_offset from a previous page")
+
+
+async def _aretell_search_transcripts(
+    query: str,
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    # Local SQLite reads; keep them off the event loop.
+    data = await asyncio.to_thread(
+        _require_archive().search_transcripts,
+        query, agent_id=agent_id, start_after=start_after, start_before=start_before,
+        limit=limit, offset=offset,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_search_transcripts")
 
 
-@tool(args_schema=GetCallTranscriptInput)
-def retell_get_call_transcript(call_id: str) -> str:
-    """Get the transcript of a call."""
-    return json.dumps(calls.get_call_transcript(_get_client(), call_id), indent=2)
+@_tool(args_schema=SearchTranscriptsInput, coroutine=_aretell_search_transcripts)
+def retell_search_transcripts(
+    query: str,
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """Full-text search over archived call transcripts, best matches first.
+
+    Only calls in the local archive are searched; run retell_sync_call_archive
+    to index new ones.
+    """
+    data = _require_archive().search_transcripts(
+        query, agent_id=agent_id, start_after=start_after, start_before=start_before,
+        limit=limit, offset=offset,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_search_transcripts")
+
+
+class AnalyzeCallsInput(ShapingInput):
+    agent_id: Optional[str] = Field(default=None, description="Only calls handled by this agent")
+    start_after: Optional[int] = Field(default=None, description="Only calls started after this time (ms since epoch)")
+    start_before: Optional[int] = Field(default=None, description="Only calls started before this time (ms since epoch)")
+    from_archive: bool = Field(default=False, description="Scan the local call archive instead of the API")
+
+
+async def _aretell_analyze_calls(
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    from_archive: bool = False,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await aanalyze_calls(
+        _get_client(), agent_id=agent_id, start_after=start_after, start_before=start_before,
+        archive=_require_archive() if from_archive else None,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_analyze_calls")
+
+
+@_tool(args_schema=AnalyzeCallsInput, coroutine=_aretell_analyze_calls)
+def retell_analyze_calls(
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    from_archive: bool = False,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """Aggregate call statistics over a time range: duration percentiles, outcomes, per-agent/number rollups."""
+    data = analyze_calls(
+        _get_client(), agent_id=agent_id, start_after=start_after, start_before=start_before,
+        archive=_require_archive() if from_archive else None,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_analyze_calls")
 
 
 # =============================================================================
@@ -195,32 +630,62 @@ def retell_get_call_transcript(call_id: str) -> str:
 # =============================================================================
 
 
-@tool
-def retell_list_phone_numbers() -> str:
+async def _aretell_list_phone_numbers(
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await phones.alist_phone_numbers(_get_client())
+    return shape(data, fields, compact, max_bytes, tool="retell_list_phone_numbers")
+
+
+@_tool(args_schema=ShapingInput, coroutine=_aretell_list_phone_numbers)
+def retell_list_phone_numbers(
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """List all registered phone numbers."""
-    return json.dumps(phones.list_phone_numbers(_get_client()), indent=2)
+    data = phones.list_phone_numbers(_get_client())
+    return shape(data, fields, compact, max_bytes, tool="retell_list_phone_numbers")
 
 
-class UpdatePhoneNumberInput(BaseModel):
+class UpdatePhoneNumberInput(ShapingInput):
     phone_number: str = Field(description="Phone number to update (E.164 format)")
     inbound_agent_id: Optional[str] = Field(default=None, description="Agent to handle inbound calls")
     nickname: Optional[str] = Field(default=None, description="Friendly name for the number")
 
 
-@tool(args_schema=UpdatePhoneNumberInput)
+async def _aretell_update_phone_number(
+    phone_number: str,
+    inbound_agent_id: Optional[str] = None,
+    nickname: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await phones.aupdate_phone_number(
+        _get_client(), phone_number,
+        inbound_agent_id=inbound_agent_id, nickname=nickname,
+    )
+    return shape(data, fields, compact, max_bytes, tool="retell_update_phone_number")
+
+
+@_tool(args_schema=UpdatePhoneNumberInput, coroutine=_aretell_update_phone_number)
 def retell_update_phone_number(
     phone_number: str,
     inbound_agent_id: Optional[str] = None,
     nickname: Optional[str] = None,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
 ) -> str:
     """Update a phone number configuration."""
-    return json.dumps(
-        phones.update_phone_number(
-            _get_client(), phone_number,
-            inbound_agent_id=inbound_agent_id, nickname=nickname,
-        ),
-        indent=2,
+    data = phones.update_phone_number(
+        _get_client(), phone_number,
+        inbound_agent_id=inbound_agent_id, nickname=nickname,
     )
+    return shape(data, fields, compact, max_bytes, tool="retell_update_phone_number")
 
 
 # =============================================================================
@@ -228,20 +693,50 @@ def retell_update_phone_number(
 # =============================================================================
 
 
-@tool
-def retell_list_voices() -> str:
+async def _aretell_list_voices(
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await voices.alist_voices(_get_client())
+    return shape(data, fields, compact, max_bytes, tool="retell_list_voices")
+
+
+@_tool(args_schema=ShapingInput, coroutine=_aretell_list_voices)
+def retell_list_voices(
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """List available voices from Retell's voice library."""
-    return json.dumps(voices.list_voices(_get_client()), indent=2)
+    data = voices.list_voices(_get_client())
+    return shape(data, fields, compact, max_bytes, tool="retell_list_voices")
 
 
-class GetVoiceInput(BaseModel):
+class GetVoiceInput(ShapingInput):
     voice_id: str = Field(description="Voice ID to retrieve")
 
 
-@tool(args_schema=GetVoiceInput)
-def retell_get_voice(voice_id: str) -> str:
+async def _aretell_get_voice(
+    voice_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    data = await voices.aget_voice(_get_client(), voice_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_voice")
+
+
+@_tool(args_schema=GetVoiceInput, coroutine=_aretell_get_voice)
+def retell_get_voice(
+    voice_id: str,
+    fields: Optional[str] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
     """Get details of a specific voice."""
-    return json.dumps(voices.get_voice(_get_client(), voice_id), indent=2)
+    data = voices.get_voice(_get_client(), voice_id)
+    return shape(data, fields, compact, max_bytes, tool="retell_get_voice")
 
 
 # =============================================================================
@@ -252,6 +747,7 @@ TOOLS = [
     # Agents
     retell_list_agents,
     retell_get_agent,
+    retell_get_agents_many,
     retell_create_agent,
     retell_update_agent,
     retell_delete_agent,
@@ -259,7 +755,11 @@ TOOLS = [
     retell_create_phone_call,
     retell_list_calls,
     retell_get_call,
+    retell_get_calls_many,
+    retell_sync_call_archive,
     retell_get_call_transcript,
+    retell_search_transcripts,
+    retell_analyze_calls,
     # Phone Numbers
     retell_list_phone_numbers,
     retell_update_phone_number,
@@ -0,0 +1,123 @@
+"""Run several tool invocations in one request.
+
+Each entry is ``{"tool": name, "args": {...}, "id": optional name}``. An
+argument value (at any depth) that is a string of the form ``$<id>.<path>``
+is replaced by part of an earlier entry's result: ``<id>`` is the entry's
+``id`` or its index (so custom ids may not be numeric), ``<path>`` is a dotted path of keys and list indexes,
+and ``*`` maps the rest of the path over a list. For example
+``"$calls.*.call_id"`` is the list of call IDs returned by the entry named
+``calls``; ``"$0"`` is the whole result of the first entry.
+
+Entries run concurrently unless one references another, in which case it
+waits for the entries it depends on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+Tool = Callable[..., Awaitable[str]]
+
+_REF = re.compile(r"^\$([A-Za-z0-9_-]+)((?:\.[^.]+)*)$")
+
+
+def _refs(value: Any) -> set[str]:
+    if isinstance(value, str):
+        match = _REF.match(value)
+        return {match.group(1)} if match else set()
+    if isinstance(value, dict):
+        return set().union(*(_refs(v) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_refs(v) for v in value))
+    return set()
+
+
+def _walk(value: Any, parts: list[str], ref: str) -> Any:
+    for i, part in enumerate(parts):
+        if part == "*":
+            if not isinstance(value, list):
+                raise ValueError(f"{ref}: '*' applied to a non-list")
+            return [_walk(item, parts[i + 1:], ref) for item in value]
+        if isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        elif isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            raise ValueError(f"{ref}: no '{part}' in result")
+    return value
+
+
+def _resolve(value: Any, results: dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        match = _REF.match(value)
+        if not match:
+            return value
+        parts = [p for p in match.group(2).split(".") if p]
+        return _walk(results[match.group(1)], parts, value)
+    if isinstance(value, dict):
+        return {k: _resolve(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve(v, results) for v in value]
+    return value
+
+
+def _decode(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text  # e.g. a response cut by max_bytes
+
+
+async def run_batch(
+    entries: list[dict],
+    tools: dict[str, Tool],
+    concurrency: int = 8,
+) -> list[dict]:
+    """Run ``entries`` against ``tools`` and return one result per entry, in order.
+
+    Each result is ``{"id", "tool", "result"}`` or ``{"id", "tool", "error"}``.
+    An entry whose references point at a failed entry fails without running.
+    """
+    for entry in entries:
+        if "id" in entry and str(entry["id"]).isdigit():
+            raise ValueError(f"batch entry id {entry['id']!r} is numeric; numbers refer to entry indexes")
+    ids = [str(entry.get("id", i)) for i, entry in enumerate(entries)]
+    if len(set(ids)) != len(ids):
+        raise ValueError("batch entry ids must be unique")
+    # An entry can be referenced by its id or by its index.
+    position = {str(i): i for i in range(len(entries))}
+    position.update({entry_id: i for i, entry_id in enumerate(ids)})
+    for i, entry in enumerate(entries):
+        for ref in _refs(entry.get("args", {})):
+            if position.get(ref, i) >= i:
+                raise ValueError(f"entry {ids[i]!r} references {ref!r}, which is not an earlier entry")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results: dict[str, Any] = {}
+    tasks: list[asyncio.Task] = []
+
+    async def run(i: int, entry: dict) -> dict:
+        name, args = entry.get("tool"), entry.get("args", {})
+        outcome = {"id": ids[i], "tool": name}
+        for ref in _refs(args):
+            if "error" in await tasks[position[ref]]:
+                return {**outcome, "error": f"depends on failed entry {ref!r}"}
+        tool = tools.get(name)
+        if tool is None:
+            return {**outcome, "error": f"unknown tool {name!r}"}
+        try:
+            resolved = _resolve(args, results)
+            async with semaphore:
+                text = await tool(**resolved)
+        except Exception as exc:  # reported per entry; the batch carries on
+            return {**outcome, "error": f"{type(exc).__name__}: {exc}"}
+        results[ids[i]] = results[str(i)] = _decode(text)
+        return {**outcome, "result": results[ids[i]]}
+
+    for i, entry in enumerate(entries):
+        tasks.append(asyncio.ensure_future(run(i, entry)))
+    return list(await asyncio.gather(*tasks))
@@ -1,36 +1,31 @@
-"""Agent operations — list, get, create, update, delete."""
+"""Agent operations — list, get, create, update, delete (sync and async)."""
 
 from __future__ import annotations
 
 from typing import Optional
 
 from ..client import RetellClient
+from .batch import afetch_many, fetch_many
 
 
-def list_agents(client: RetellClient) -> list[dict]:
-    """List all voice agents (sync)."""
-    agents = client.get_sync("/list-agents")
+def summarize_agent(a: dict) -> dict:
+    """Project a raw agent object onto the fields returned by ``list_agents``."""
+    return {
+        "agent_id": a.get("agent_id"),
+        "agent_name": a.get("agent_name"),
+        "voice_id": a.get("voice_id"),
+        "language": a.get("language"),
+        "created_at": a.get("last_modification_timestamp"),
+    }
+
+
+def _summarize_agents(agents: dict | list) -> list[dict]:
     if not isinstance(agents, list):
         agents = [agents]
-    return [
-        {
-            "agent_id": a.get("agent_id"),
-            "agent_name": a.get("agent_name"),
-            "voice_id": a.get("voice_id"),
-            "language": a.get("language"),
-            "created_at": a.get("last_modification_timestamp"),
-        }
-        for a in agents
-    ]
-
-
-def get_agent(client: RetellClient, agent_id: str) -> dict:
-    """Get details of a specific agent (sync)."""
-    return client.get_sync(f"/get-agent/{agent_id}")
+    return [summarize_agent(a) for a in agents]
 
 
-def create_agent(
-    client: RetellClient,
+def agent_payload(
     agent_name: str,
     voice_id: str,
     prompt: str,
@@ -41,7 +36,7 @@ def create_agent(
     interruption_sensitivity: float = 1.0,
     enable_backchannel: bool = True,
 ) -> dict:
-    """Create a new voice agent (sync)."""
+    """Build the ``/create-agent`` body."""
     payload: dict = {
         "agent_name": agent_name,
         "voice_id": voice_id,
@@ -59,19 +54,25 @@ def create_agent(
     }
     if begin_message:
         payload["begin_message"] = begin_message
+    return payload
 
-    return client.post_sync("/create-agent", json=payload)
 
-
-def update_agent(
-    client: RetellClient,
-    agent_id: str,
+def agent_update_payload(
     agent_name: Optional[str] = None,
     prompt: Optional[str] = None,
     begin_message: Optional[str] = None,
     voice_id: Optional[str] = None,
+    language: Optional[str] = None,
+    voice_model: Optional[str] = None,
+    responsiveness: Optional[float] = None,
+    interruption_sensitivity: Optional[float] = None,
+    enable_backchannel: Optional[bool] = None,
+    extra: Optional[dict] = None,
 ) -> dict:
-    """Update an existing agent (sync)."""
+    """Build the ``/update-agent`` body from the fields that are set.
+
+    ``extra`` passes any other agent fields through unchanged.
+    """
     payload: dict = {}
     if agent_name:
         payload["agent_name"] = agent_name
@@ -81,11 +82,162 @@ def update_agent(
         payload["begin_message"] = begin_message
     if voice_id:
         payload["voice_id"] = voice_id
+    if language:
+        payload["language"] = language
+    if voice_model:
+        payload["voice_model"] = voice_model
+    if responsiveness is not None:
+        payload["responsiveness"] = responsiveness
+    if interruption_sensitivity is not None:
+        payload["interruption_sensitivity"] = interruption_sensitivity
+    if enable_backchannel is not None:
+        payload["enable_backchannel"] = enable_backchannel
+    if extra:
+        payload.update(extra)
+    return payload
+
 
+def list_agents(client: RetellClient, bypass_cache: bool = False) -> list[dict]:
+    """List all voice agents (sync)."""
+    return _summarize_agents(client.get_sync("/list-agents", bypass_cache=bypass_cache))
+
+
+async def alist_agents(client: RetellClient, bypass_cache: bool = False) -> list[dict]:
+    """List all voice agents (async)."""
+    return _summarize_agents(await client.get("/list-agents", bypass_cache=bypass_cache))
+
+
+def get_agent(client: RetellClient, agent_id: str, bypass_cache: bool = False) -> dict:
+    """Get details of a specific agent (sync)."""
+    return client.get_sync(f"/get-agent/{agent_id}", bypass_cache=bypass_cache)
+
+
+async def aget_agent(client: RetellClient, agent_id: str, bypass_cache: bool = False) -> dict:
+    """Get details of a specific agent (async)."""
+    return await client.get(f"/get-agent/{agent_id}", bypass_cache=bypass_cache)
+
+
+def get_agents_many(
+    client: RetellClient,
+    agent_ids: list[str],
+    concurrency: int = 10,
+    bypass_cache: bool = False,
+) -> dict:
+    """Get many agents concurrently (sync).
+
+    Returns ``{"results", "summary"}``; results follow ``agent_ids`` order and
+    each holds the agent under ``data`` or a per-agent ``error``.
+    """
+    return fetch_many(
+        agent_ids, lambda agent_id: get_agent(client, agent_id, bypass_cache=bypass_cache),
+        id_key="agent_id", concurrency=concurrency,
+    )
+
+
+async def aget_agents_many(
+    client: RetellClient,
+    agent_ids: list[str],
+    concurrency: int = 10,
+    bypass_cache: bool = False,
+) -> dict:
+    """Get many agents concurrently (async). See ``get_agents_many``."""
+    return await afetch_many(
+        agent_ids, lambda agent_id: aget_agent(client, agent_id, bypass_cache=bypass_cache),
+        id_key="agent_id", concurrency=concurrency,
+    )
+
+
+def create_agent(
+    client: RetellClient,
+    agent_name: str,
+    voice_id: str,
+    prompt: str,
+    language: str = "en-US",
+    begin_message: Optional[str] = None,
+    model: str = "gpt-4o-mini",
+    responsiveness: float = 1.0,
+    interruption_sensitivity: float = 1.0,
+    enable_backchannel: bool = True,
+) -> dict:
+    """Create a new voice agent (sync)."""
+    payload = agent_payload(
+        agent_name, voice_id, prompt, language, begin_message, model,
+        responsiveness, interruption_sensitivity, enable_backchannel,
+    )
+    return client.post_sync("/create-agent", json=payload)
+
+
+async def acreate_agent(
+    client: RetellClient,
+    agent_name: str,
+    voice_id: str,
+    prompt: str,
+    language: str = "en-US",
+    begin_message: Optional[str] = None,
+    model: str = "gpt-4o-mini",
+    responsiveness: float = 1.0,
+    interruption_sensitivity: float = 1.0,
+    enable_backchannel: bool = True,
+) -> dict:
+    """Create a new voice agent (async)."""
+    payload = agent_payload(
+        agent_name, voice_id, prompt, language, begin_message, model,
+        responsiveness, interruption_sensitivity, enable_backchannel,
+    )
+    return await client.post("/create-agent", json=payload)
+
+
+def update_agent(
+    client: RetellClient,
+    agent_id: str,
+    agent_name: Optional[str] = None,
+    prompt: Optional[str] = None,
+    begin_message: Optional[str] = None,
+    voice_id: Optional[str] = None,
+    language: Optional[str] = None,
+    voice_model: Optional[str] = None,
+    responsiveness: Optional[float] = None,
+    interruption_sensitivity: Optional[float] = None,
+    enable_backchannel: Optional[bool] = None,
+    extra: Optional[dict] = None,
+) -> dict:
+    """Update an existing agent (sync)."""
+    payload = agent_update_payload(
+        agent_name, prompt, begin_message, voice_id, language, voice_model,
+        responsiveness, interruption_sensitivity, enable_backchannel, extra,
+    )
     return client.patch_sync(f"/update-agent/{agent_id}", json=payload)
 
 
+async def aupdate_agent(
+    client: RetellClient,
+    agent_id: str,
+    agent_name: Optional[str] = None,
+    prompt: Optional[str] = None,
+    begin_message: Optional[str] = None,
+    voice_id: Optional[str] = None,
+    language: Optional[str] = None,
+    voice_model: Optional[str] = None,
+    responsiveness: Optional[float] = None,
+    interruption_sensitivity: Optional[float] = None,
+    enable_backchannel: Optional[bool] = None,
+    extra: Optional[dict] = None,
+) -> dict:
+    """Update an existing agent (async)."""
+    payload = agent_update_payload(
+        agent_name, prompt, begin_message, voice_id, language, voice_model,
+        responsiveness, interruption_sensitivity, enable_backchannel, extra,
+    )
+    return await client.patch(f"/update-agent/{agent_id}", json=payload)
+
+
 def delete_agent(client: RetellClient, agent_id: str) -> dict:
     """Delete an agent (sync)."""
     client.delete_sync(f"/delete-agent/{agent_id}")
     return {"status": "deleted", "agent_id": agent_id}
+
+
+async def adelete_agent(client: RetellClient, agent_id: str) -> dict:
+    """Delete an agent (async)."""
+    await client.delete(f"/delete-agent/{agent_id}")
+    return {"status": "deleted", "agent_id": agent_id}
@@ -0,0 +1,89 @@
+"""Concurrent batch fetches — bounded concurrency, per-item errors, input order kept."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+
+def describe_error(exc: Exception) -> str:
+    """Short, stable description of a failed request."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"HTTP {exc.response.status_code}"
+    return type(exc).__name__
+
+
+def _entry(id_key: str, item_id: str, data: object = None, exc: Exception | None = None) -> dict:
+    if exc is not None:
+        return {id_key: item_id, "error": describe_error(exc)}
+    return {id_key: item_id, "data": data}
+
+
+def _report(results: list[dict], started: float) -> dict:
+    failed = sum(1 for r in results if "error" in r)
+    return {
+        "results": results,
+        "summary": {
+            "requested": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "elapsed_s": round(time.monotonic() - started, 3),
+        },
+    }
+
+
+async def afetch_many(
+    ids: Iterable[str],
+    fetch: Callable[[str], Awaitable[object]],
+    id_key: str = "id",
+    concurrency: int = 10,
+) -> dict:
+    """Run ``fetch`` for every id with at most ``concurrency`` in flight (async).
+
+    Results keep the input order; each is ``{id_key, "data"}`` on success or
+    ``{id_key, "error"}`` when the request failed, the id was rejected or the
+    body was not valid JSON.
+    """
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(item_id: str) -> dict:
+        async with semaphore:
+            try:
+                return _entry(id_key, item_id, await fetch(item_id))
+            except (httpx.HTTPError, OSError, ValueError) as exc:
+                return _entry(id_key, item_id, exc=exc)
+
+    results = await asyncio.gather(*(one(item_id) for item_id in ids))
+    return _report(list(results), started)
+
+
+def fetch_many(
+    ids: Iterable[str],
+    fetch: Callable[[str], object],
+    id_key: str = "id",
+    concurrency: int = 10,
+) -> dict:
+    """Run ``fetch`` for every id on a pool of ``concurrency`` threads (sync).
+
+    See ``afetch_many`` for the result format.
+    """
+    started = time.monotonic()
+
+    def one(item_id: str) -> dict:
+        try:
+            return _entry(id_key, item_id, fetch(item_id))
+        except (httpx.HTTPError, OSError, ValueError) as exc:
+            return _entry(id_key, item_id, exc=exc)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="retell-batch") as pool:
+        # Each worker runs in a copy of the caller's context, so an active
+        # deadline applies to its requests too.
+        futures = [pool.submit(contextvars.copy_context().run, one, item_id) for item_id in ids]
+        results = [future.result() for future in futures]
+    return _report(results, started)
@@ -1,76 +1,339 @@
-"""Call operations — create, list, get, get transcript."""
+"""Call operations — create, list, iterate, get, get transcript (whole or windowed), sync and async."""
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
-from typing import Optional
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
 from ..client import RetellClient
+from .batch import afetch_many, fetch_many
 
+if TYPE_CHECKING:
+    from ..archive import CallArchive
 
-def create_phone_call(
-    client: RetellClient,
+TERMINAL_STATUSES = frozenset({"ended", "error"})
+
+
+def is_terminal(call: dict) -> bool:
+    """Whether a call has reached a status it will never leave."""
+    return call.get("call_status") in TERMINAL_STATUSES
+
+
+def phone_call_payload(
     agent_id: str,
     to_number: str,
     from_number: str,
-    metadata: Optional[str] = None,
+    metadata: Optional[str | dict] = None,
 ) -> dict:
-    """Initiate an outbound phone call (sync)."""
+    """Build the ``/create-phone-call`` body; ``metadata`` may be a dict or JSON text."""
     payload: dict = {
         "agent_id": agent_id,
         "to_number": to_number,
         "from_number": from_number,
     }
     if metadata:
-        payload["metadata"] = json.loads(metadata)
+        payload["metadata"] = json.loads(metadata) if isinstance(metadata, str) else metadata
+    return payload
 
+
+def create_phone_call(
+    client: RetellClient,
+    agent_id: str,
+    to_number: str,
+    from_number: str,
+    metadata: Optional[str] = None,
+) -> dict:
+    """Initiate an outbound phone call (sync)."""
+    payload = phone_call_payload(agent_id, to_number, from_number, metadata)
     return client.post_sync("/create-phone-call", json=payload)
 
 
+async def acreate_phone_call(
+    client: RetellClient,
+    agent_id: str,
+    to_number: str,
+    from_number: str,
+    metadata: Optional[str] = None,
+) -> dict:
+    """Initiate an outbound phone call (async)."""
+    payload = phone_call_payload(agent_id, to_number, from_number, metadata)
+    return await client.post("/create-phone-call", json=payload)
+
+
+def _list_calls_params(
+    agent_id: Optional[str],
+    limit: int,
+    sort_order: str,
+    pagination_key: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+) -> dict:
+    params: dict = {"limit": limit, "sort_order": sort_order}
+    criteria = []
+    if agent_id:
+        criteria.append({"member": "agent_id", "operator": "eq", "value": agent_id})
+    # Bound the start time server-side so scanning an old window does not
+    # page through every newer call first.
+    if start_after is not None:
+        criteria.append({"member": "start_timestamp", "operator": "gt", "value": start_after})
+    if start_before is not None:
+        criteria.append({"member": "start_timestamp", "operator": "lt", "value": start_before})
+    if criteria:
+        params["filter_criteria"] = json.dumps(criteria)
+    if pagination_key:
+        params["pagination_key"] = pagination_key
+    return params
+
+
+def summarize_call(c: dict) -> dict:
+    """Project a raw call object onto the fields returned by ``list_calls``."""
+    return {
+        "call_id": c.get("call_id"),
+        "agent_id": c.get("agent_id"),
+        "call_type": c.get("call_type"),
+        "call_status": c.get("call_status"),
+        "from_number": c.get("from_number"),
+        "to_number": c.get("to_number"),
+        "start_timestamp": c.get("start_timestamp"),
+        "end_timestamp": c.get("end_timestamp"),
+        "duration_ms": (c.get("end_timestamp", 0) - c.get("start_timestamp", 0))
+        if c.get("end_timestamp") else None,
+        "disconnection_reason": c.get("disconnection_reason"),
+    }
+
+
+def _as_page(calls: dict | list) -> list[dict]:
+    return calls if isinstance(calls, list) else [calls]
+
+
 def list_calls(
     client: RetellClient,
     agent_id: Optional[str] = None,
     limit: int = 50,
     sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    archive: Optional[CallArchive] = None,
 ) -> list[dict]:
-    """List phone calls (sync)."""
-    params: dict = {"limit": limit, "sort_order": sort_order}
-    if agent_id:
-        params["filter_criteria"] = json.dumps([{
-            "member": "agent_id",
-            "operator": "eq",
-            "value": agent_id,
-        }])
-
-    calls = client.get_sync("/list-calls", params=params)
-    if not isinstance(calls, list):
-        calls = [calls]
-    return [
-        {
-            "call_id": c.get("call_id"),
-            "agent_id": c.get("agent_id"),
-            "call_type": c.get("call_type"),
-            "call_status": c.get("call_status"),
-            "from_number": c.get("from_number"),
-            "to_number": c.get("to_number"),
-            "start_timestamp": c.get("start_timestamp"),
-            "end_timestamp": c.get("end_timestamp"),
-            "duration_ms": (c.get("end_timestamp", 0) - c.get("start_timestamp", 0))
-            if c.get("end_timestamp") else None,
-            "disconnection_reason": c.get("disconnection_reason"),
-        }
-        for c in calls
-    ]
-
-
-def get_call(client: RetellClient, call_id: str) -> dict:
-    """Get details of a specific call (sync)."""
-    return client.get_sync(f"/get-call/{call_id}")
-
-
-def get_call_transcript(client: RetellClient, call_id: str) -> dict:
-    """Get the transcript of a call (sync)."""
-    call_data = client.get_sync(f"/get-call/{call_id}")
+    """List phone calls (sync).
+
+    Pass the ``call_id`` of the last call in a page as ``pagination_key`` to
+    fetch the following page. With an ``archive``, calls are read from the
+    local store instead of the API.
+    """
+    if archive is not None:
+        calls = archive.list_calls(
+            agent_id=agent_id, limit=limit, sort_order=sort_order, pagination_key=pagination_key,
+        )
+    else:
+        params = _list_calls_params(agent_id, limit, sort_order, pagination_key)
+        calls = _as_page(client.get_sync("/list-calls", params=params))
+    return [summarize_call(c) for c in calls]
+
+
+async def alist_calls(
+    client: RetellClient,
+    agent_id: Optional[str] = None,
+    limit: int = 50,
+    sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    archive: Optional[CallArchive] = None,
+) -> list[dict]:
+    """List phone calls (async). See ``list_calls``."""
+    if archive is not None:
+        calls = archive.list_calls(
+            agent_id=agent_id, limit=limit, sort_order=sort_order, pagination_key=pagination_key,
+        )
+    else:
+        params = _list_calls_params(agent_id, limit, sort_order, pagination_key)
+        calls = _as_page(await client.get("/list-calls", params=params))
+    return [summarize_call(c) for c in calls]
+
+
+def _start_filter(
+    sort_order: str, start_after: Optional[int], start_before: Optional[int],
+) -> Callable[[dict], Optional[bool]]:
+    """Classify a call as in range (True), skipped (False) or past the range (None).
+
+    The range is also sent as ``filter_criteria``; this guards against a
+    server that ignores it. Undated calls fall outside any bounded range.
+    """
+    descending = sort_order != "ascending"
+    bounded = start_after is not None or start_before is not None
+
+    def check(call: dict) -> Optional[bool]:
+        start = call.get("start_timestamp")
+        if start is None:
+            return not bounded
+        if start_after is not None and start <= start_after:
+            return None if descending else False
+        if start_before is not None and start >= start_before:
+            return False if descending else None
+        return True
+
+    return check
+
+
+def iter_calls(
+    client: RetellClient,
+    agent_id: Optional[str] = None,
+    page_size: int = 100,
+    sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+) -> Iterator[dict]:
+    """Iterate raw call objects across every page (sync).
+
+    The next page is fetched on a background thread while the caller consumes
+    the current one, so at most two pages are held in memory. With
+    ``start_after``/``start_before`` (ms since epoch, exclusive) only calls
+    started in that range are requested and yielded, and paging stops once
+    it is passed.
+    """
+    def fetch(key: Optional[str]) -> list[dict]:
+        params = _list_calls_params(agent_id, page_size, sort_order, key, start_after, start_before)
+        return _as_page(client.get_sync("/list-calls", params=params))
+
+    check = _start_filter(sort_order, start_after, start_before)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="retell-iter-calls")
+    # Each prefetch runs in a copy of the consumer's context at that point, so
+    # an active deadline applies to it as it does in fetch_many.
+    try:
+        pending = executor.submit(contextvars.copy_context().run, fetch, pagination_key)
+        while pending is not None:
+            page = pending.result()
+            pending = None
+            if len(page) >= page_size and page[-1].get("call_id") and check(page[-1]) is not None:
+                pending = executor.submit(contextvars.copy_context().run, fetch, page[-1]["call_id"])
+            for call in page:
+                keep = check(call)
+                if keep is None:
+                    return
+                if keep:
+                    yield call
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_calls(
+    client: RetellClient,
+    agent_id: Optional[str] = None,
+    page_size: int = 100,
+    sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+) -> AsyncIterator[dict]:
+    """Iterate raw call objects across every page (async). See ``iter_calls``.
+
+    The next page is requested while the caller consumes the current one, so
+    at most two pages are held in memory.
+    """
+    async def fetch(key: Optional[str]) -> list[dict]:
+        params = _list_calls_params(agent_id, page_size, sort_order, key, start_after, start_before)
+        return _as_page(await client.get("/list-calls", params=params))
+
+    check = _start_filter(sort_order, start_after, start_before)
+    pending: Optional[asyncio.Task] = asyncio.ensure_future(fetch(pagination_key))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            if len(page) >= page_size and page[-1].get("call_id") and check(page[-1]) is not None:
+                pending = asyncio.ensure_future(fetch(page[-1]["call_id"]))
+            for call in page:
+                keep = check(call)
+                if keep is None:
+                    return
+                if keep:
+                    yield call
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _archived_call(
+    archive: Optional[CallArchive], call_id: str, refresh: bool,
+) -> Optional[dict]:
+    if archive is None or refresh:
+        return None
+    call = archive.get_call(call_id)
+    return call if call is not None and archive.is_final(call) else None
+
+
+def _write_through(archive: Optional[CallArchive], call: dict) -> dict:
+    if archive is not None:
+        archive.upsert_calls([call])
+    return call
+
+
+def get_call(
+    client: RetellClient,
+    call_id: str,
+    archive: Optional[CallArchive] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get details of a specific call (sync).
+
+    With an ``archive``, a call archived once final (ended with its analysis,
+    or settled; see ``CallArchive.is_final``) is returned without a request
+    (unless ``refresh``); otherwise the fetched call is written to the archive.
+    """
+    call = _archived_call(archive, call_id, refresh)
+    if call is not None:
+        return call
+    return _write_through(archive, client.get_sync(f"/get-call/{call_id}"))
+
+
+async def aget_call(
+    client: RetellClient,
+    call_id: str,
+    archive: Optional[CallArchive] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get details of a specific call (async). See ``get_call``."""
+    call = _archived_call(archive, call_id, refresh)
+    if call is not None:
+        return call
+    return _write_through(archive, await client.get(f"/get-call/{call_id}"))
+
+
+def get_calls_many(
+    client: RetellClient,
+    call_ids: list[str],
+    concurrency: int = 10,
+    archive: Optional[CallArchive] = None,
+) -> dict:
+    """Get many calls concurrently (sync).
+
+    Returns ``{"results", "summary"}``; results follow ``call_ids`` order and
+    each holds the call under ``data`` or a per-call ``error``.
+    """
+    return fetch_many(
+        call_ids, lambda call_id: get_call(client, call_id, archive=archive),
+        id_key="call_id", concurrency=concurrency,
+    )
+
+
+async def aget_calls_many(
+    client: RetellClient,
+    call_ids: list[str],
+    concurrency: int = 10,
+    archive: Optional[CallArchive] = None,
+) -> dict:
+    """Get many calls concurrently (async). See ``get_calls_many``."""
+    return await afetch_many(
+        call_ids, lambda call_id: aget_call(client, call_id, archive=archive),
+        id_key="call_id", concurrency=concurrency,
+    )
+
+
+def transcript_summary(call_id: str, call_data: dict) -> dict:
+    """The transcript, analysis and duration of a call."""
     return {
         "call_id": call_id,
         "transcript": call_data.get("transcript", ""),
@@ -78,3 +341,145 @@ def get_call_transcript(client: RetellClient, call_id: str) -> dict:
         "duration_ms": (call_data.get("end_timestamp", 0) - call_data.get("start_timestamp", 0))
         if call_data.get("end_timestamp") else None,
     }
+
+
+def get_call_transcript(
+    client: RetellClient,
+    call_id: str,
+    archive: Optional[CallArchive] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get the transcript of a call (sync)."""
+    return transcript_summary(call_id, get_call(client, call_id, archive=archive, refresh=refresh))
+
+
+async def aget_call_transcript(
+    client: RetellClient,
+    call_id: str,
+    archive: Optional[CallArchive] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get the transcript of a call (async)."""
+    call_data = await aget_call(client, call_id, archive=archive, refresh=refresh)
+    return transcript_summary(call_id, call_data)
+
+
+# Rough characters-per-token ratio used to turn a token budget into characters.
+CHARS_PER_TOKEN = 4
+
+
+def transcript_turns(call_data: dict) -> list[dict]:
+    """Speaker turns from ``transcript_object``, or parsed from the plain transcript.
+
+    Word-level timings are dropped; each turn is ``{"index", "role", "content"}``.
+    """
+    structured = call_data.get("transcript_object")
+    if structured:
+        return [
+            {"index": i, "role": t.get("role"), "content": t.get("content", "")}
+            for i, t in enumerate(structured)
+        ]
+    turns: list[dict] = []
+    for line in (call_data.get("transcript") or "").splitlines():
+        speaker, sep, content = line.partition(": ")
+        if sep and speaker.lower() in ("agent", "user"):
+            turns.append({"index": len(turns), "role": speaker.lower(), "content": content})
+        elif turns:
+            turns[-1]["content"] += "\n" + line
+        elif line.strip():
+            turns.append({"index": 0, "role": None, "content": line})
+    return turns
+
+
+def transcript_window(
+    call_data: dict,
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    last_n: Optional[int] = None,
+    speaker: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[int] = None,
+) -> dict:
+    """Select a bounded slice of a call's transcript.
+
+    Turns are chosen by index range ``[start_turn, end_turn)``, optionally
+    restricted to one ``speaker`` ("agent" or "user") and to the ``last_n``
+    matching turns, then cut to fit ``max_chars`` (or ``max_tokens``). The
+    first selected turn is always returned whole so a stream makes progress.
+    ``next_cursor`` is the turn index to pass as ``cursor`` for the next
+    chunk, or ``None`` once the selection is exhausted.
+    """
+    turns = transcript_turns(call_data)
+    total = len(turns)
+    selected = turns[start_turn or 0:end_turn]
+    if speaker:
+        selected = [t for t in selected if t["role"] == speaker.lower()]
+    if last_n is not None:
+        selected = selected[-last_n:] if last_n > 0 else []
+    if cursor is not None:
+        selected = [t for t in selected if t["index"] >= cursor]
+
+    budget = max_chars
+    if max_tokens is not None:
+        token_chars = max_tokens * CHARS_PER_TOKEN
+        budget = token_chars if budget is None else min(budget, token_chars)
+
+    window: list[dict] = []
+    used = 0
+    for turn in selected:
+        size = len(turn["content"])
+        if window and budget is not None and used + size > budget:
+            break
+        window.append(turn)
+        used += size
+    remaining = selected[len(window):]
+    return {
+        "call_id": call_data.get("call_id"),
+        "total_turns": total,
+        "turns": window,
+        "chars": used,
+        "next_cursor": remaining[0]["index"] if remaining else None,
+    }
+
+
+def get_transcript_window(
+    client: RetellClient,
+    call_id: str,
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    last_n: Optional[int] = None,
+    speaker: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[int] = None,
+    archive: Optional[CallArchive] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get a bounded window of a call's transcript (sync). See ``transcript_window``."""
+    return transcript_window(
+        get_call(client, call_id, archive=archive, refresh=refresh),
+        start_turn=start_turn, end_turn=end_turn, last_n=last_n, speaker=speaker,
+        max_chars=max_chars, max_tokens=max_tokens, cursor=cursor,
+    )
+
+
+async def aget_transcript_window(
+    client: RetellClient,
+    call_id: str,
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    last_n: Optional[int] = None,
+    speaker: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[int] = None,
+    archive: Optional[CallArchive] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get a bounded window of a call's transcript (async). See ``transcript_window``."""
+    return transcript_window(
+        await aget_call(client, call_id, archive=archive, refresh=refresh),
+        start_turn=start_turn, end_turn=end_turn, last_n=last_n, speaker=speaker,
+        max_chars=max_chars, max_tokens=max_tokens, cursor=cursor,
+    )
@@ -0,0 +1,277 @@
+"""Bulk outbound dialing — bounded concurrency, per-caller-ID caps, resumable."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import itertools
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from typing import IO, Optional
+
+import httpx
+
+from ..client import RetellClient
+from ..config import get_settings
+from ..retry import NOT_SENT_ERRORS
+from ..timeouts import DeadlineExceeded
+from .calls import phone_call_payload
+
+# Checkpoint states. A row is "pending" from just before its request is sent
+# until the outcome is known; "uncertain" rows may or may not have been dialed
+# and are never redialed automatically. Requests that provably never left
+# (no connection, or the deadline passed first) are "failed" and retried.
+PENDING = "pending"
+DIALED = "dialed"
+FAILED = "failed"
+UNCERTAIN = "uncertain"
+SKIPPED = "skipped"
+INVALID = "invalid"
+
+
+def default_dial_dir() -> Path:
+    """``RETELL_DIAL_DIR``, or ``~/.cache/mcp-retell/dials``."""
+    configured = get_settings().dial_dir
+    return Path(configured).expanduser() if configured else Path.home() / ".cache" / "mcp-retell" / "dials"
+
+
+def dial_path(name: str, root: Optional[str | Path] = None) -> Path:
+    """``name`` resolved inside ``root`` (the dial directory by default).
+
+    Raises ``ValueError`` for names that resolve outside it, such as
+    absolute paths or ``../`` segments, so tool arguments cannot reach
+    other files.
+    """
+    base = Path(root or default_dial_dir()).expanduser().resolve()
+    path = (base / name).resolve()
+    if path == base or not path.is_relative_to(base):
+        raise ValueError(f"{name!r} is not a file inside the dial directory {base}")
+    return path
+
+
+def load_dial_rows(source: str | Path | IO[str]) -> Iterator[dict]:
+    """Stream dial rows from a CSV or JSONL file path or open text stream.
+
+    CSV files need a header row with at least ``to_number``; ``agent_id``,
+    ``from_number``, ``metadata`` (JSON text) and ``id`` are optional columns.
+    The format is chosen by file extension, or for a stream by whether the
+    first line is a JSON object.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, encoding="utf-8", newline="") as fh:
+            is_csv = Path(source).suffix.lower() == ".csv"
+            yield from (_read_csv(fh) if is_csv else _read_jsonl(fh))
+        return
+    first = source.readline()
+    lines = itertools.chain([first], source)
+    yield from (_read_jsonl(lines) if first.lstrip().startswith("{") else _read_csv(lines))
+
+
+def _read_jsonl(lines: Iterable[str]) -> Iterator[dict]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[dict]:
+    for row in csv.DictReader(lines):
+        yield {k: v for k, v in row.items() if k and v not in (None, "")}
+
+
+def row_key(row: dict) -> str:
+    """Stable identity of a dial row, used for checkpointing."""
+    if row.get("id"):
+        return str(row["id"])
+    return f"{row.get('from_number')}|{row.get('to_number')}|{row.get('agent_id')}"
+
+
+class DialCheckpoint:
+    """Append-only JSONL log of row states, replayed on resume."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.states: dict[str, str] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as fh:
+                for record in _read_jsonl(fh):
+                    self.states[record["key"]] = record["state"]
+        self._fh = open(self.path, "a", encoding="utf-8")
+
+    def state(self, key: str) -> Optional[str]:
+        return self.states.get(key)
+
+    def mark(self, key: str, state: str, **extra: object) -> None:
+        self.states[key] = state
+        self._fh.write(json.dumps({"key": key, "state": state, **extra}) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class BulkDialer:
+    """Dispatches ``/create-phone-call`` for many rows.
+
+    At most ``concurrency`` calls are in flight overall and at most
+    ``per_number_concurrency`` per ``from_number``. Rows are pulled lazily
+    from the input, so arbitrarily large CSV/JSONL streams use constant
+    memory apart from the keys of rows seen. A row whose key repeats an
+    earlier row of the same run is skipped. With a ``checkpoint_path``, rows
+    already dialed (or whose outcome is unknown because a previous run
+    crashed mid-request) are skipped on resume; only rows that definitively
+    failed, or whose request was never sent, are retried.
+    """
+
+    def __init__(
+        self,
+        client: RetellClient,
+        from_number: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        concurrency: int = 5,
+        per_number_concurrency: int = 1,
+        checkpoint_path: Optional[str | Path] = None,
+    ) -> None:
+        self.client = client
+        self.from_number = from_number
+        self.agent_id = agent_id
+        self.concurrency = max(1, concurrency)
+        self.per_number_concurrency = max(1, per_number_concurrency)
+        self.checkpoint_path = checkpoint_path
+        self._number_slots: dict[str, asyncio.Semaphore] = {}
+        self._claimed: set[str] = set()
+        self._counts: Counter = Counter()
+        self._errors: Counter = Counter()
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    async def run(self, rows: Iterable[dict]) -> AsyncIterator[dict]:
+        """Dial every row, yielding one result dict per row as it completes."""
+        checkpoint = DialCheckpoint(self.checkpoint_path) if self.checkpoint_path else None
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        source = enumerate(rows)
+        self._claimed.clear()
+        self._started = time.monotonic()
+
+        async def worker() -> None:
+            for index, row in source:
+                await results.put(await self._dial(index, row, checkpoint))
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        done = asyncio.gather(*workers)
+        try:
+            while not (done.done() and results.empty()):
+                getter = asyncio.ensure_future(results.get())
+                await asyncio.wait({getter, done}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            await done
+        finally:
+            for task in workers:
+                task.cancel()
+            self._finished = time.monotonic()
+            if checkpoint is not None:
+                checkpoint.close()
+
+    async def _dial(self, index: int, row: dict, checkpoint: Optional[DialCheckpoint]) -> dict:
+        row = {**row}
+        row.setdefault("from_number", self.from_number)
+        row.setdefault("agent_id", self.agent_id)
+        key = row_key(row)
+        result: dict = {"index": index, "key": key, "to_number": row.get("to_number")}
+
+        missing = [f for f in ("to_number", "agent_id", "from_number") if not row.get(f)]
+        if missing:
+            return self._record(result, INVALID, error=f"missing {', '.join(missing)}")
+
+        previous = checkpoint.state(key) if checkpoint else None
+        if previous in (DIALED, PENDING, UNCERTAIN):
+            reason = "already dialed" if previous == DIALED else "outcome unknown from previous run"
+            return self._record(result, SKIPPED, error=reason)
+        # Claim the key before the first await so a duplicate row in the same
+        # run cannot pass the checks above while this one waits for a slot.
+        if key in self._claimed:
+            return self._record(result, SKIPPED, error="duplicate row")
+        self._claimed.add(key)
+
+        slot = self._number_slots.setdefault(
+            row["from_number"], asyncio.Semaphore(self.per_number_concurrency),
+        )
+        async with slot:
+            try:
+                payload = phone_call_payload(
+                    row["agent_id"], row["to_number"], row["from_number"], row.get("metadata"),
+                )
+            except ValueError as exc:
+                return self._record(result, INVALID, error=f"bad metadata: {exc}")
+            if checkpoint:
+                checkpoint.mark(key, PENDING)
+            try:
+                data = await self.client.post("/create-phone-call", json=payload)
+            except httpx.HTTPStatusError as exc:
+                # 4xx: Retell rejected the request, nothing was dialed.
+                state = FAILED if exc.response.status_code < 500 else UNCERTAIN
+                error = f"HTTP {exc.response.status_code}"
+            except (DeadlineExceeded, *NOT_SENT_ERRORS) as exc:
+                # Nothing reached Retell; safe to dial on the next run.
+                state, error = FAILED, type(exc).__name__
+            except (httpx.HTTPError, OSError) as exc:
+                state, error = UNCERTAIN, type(exc).__name__
+            else:
+                if checkpoint:
+                    checkpoint.mark(key, DIALED, call_id=data.get("call_id"))
+                return self._record(result, DIALED, call_id=data.get("call_id"))
+        if checkpoint:
+            checkpoint.mark(key, state, error=error)
+        return self._record(result, state, error=error)
+
+    def _record(self, result: dict, status: str, **extra: object) -> dict:
+        self._counts[status] += 1
+        if extra.get("error") and status != SKIPPED:
+            self._errors[extra["error"]] += 1
+        result.update(status=status, **extra)
+        return result
+
+    def summary(self) -> dict:
+        """Counts per status, error histogram and dial throughput."""
+        end = self._finished or time.monotonic()
+        elapsed = end - self._started if self._started else 0.0
+        total = sum(self._counts.values())
+        return {
+            "total": total,
+            **{status: self._counts[status] for status in (DIALED, FAILED, UNCERTAIN, SKIPPED, INVALID)},
+            "elapsed_s": round(elapsed, 3),
+            "dialed_per_s": round(self._counts[DIALED] / elapsed, 3) if elapsed else None,
+            "errors": dict(self._errors),
+        }
+
+
+async def adial_many(
+    client: RetellClient,
+    rows: Iterable[dict],
+    from_number: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    concurrency: int = 5,
+    per_number_concurrency: int = 1,
+    checkpoint_path: Optional[str | Path] = None,
+) -> dict:
+    """Dial every row and collect all results plus the run summary (async)."""
+    dialer = BulkDialer(
+        client, from_number=from_number, agent_id=agent_id, concurrency=concurrency,
+        per_number_concurrency=per_number_concurrency, checkpoint_path=checkpoint_path,
+    )
+    results = [r async for r in dialer.run(rows)]
+    results.sort(key=lambda r: r["index"])
+    return {"results": results, "summary": dialer.summary()}
+
+
+def dial_many(client: RetellClient, rows: Iterable[dict], **kwargs) -> dict:
+    """Dial every row and collect all results plus the run summary (sync)."""
+    return client.run(adial_many(client, rows, **kwargs))
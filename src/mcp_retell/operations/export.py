@@ -0,0 +1,288 @@
+"""Streaming export of calls and transcripts to JSONL, CSV or Parquet.
+
+Calls in a time range are listed newest first, enriched with ``get_call``
+details concurrently one batch at a time, and appended to the output, so
+memory is bounded by ``batch_size`` however large the range is. After each
+batch the output is flushed and a checkpoint records the last exported call
+and the output size; re-running with the same checkpoint truncates anything
+written after it and continues from the next call.
+
+Parquet output needs ``pyarrow`` (``pip install 'mcp-retell[parquet]'``).
+A Parquet file is only readable once its footer is written on close, so a
+checkpointed Parquet export rotates to a new ``<name>.partN.parquet`` file
+every ``part_batches`` batches and advances the checkpoint only when a part
+is closed. After a crash, rows of the unfinished part are exported again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Optional
+
+from ..client import RetellClient
+from .calls import aget_calls_many, aiter_calls
+
+if TYPE_CHECKING:
+    from ..archive import CallArchive
+
+FORMATS = ("jsonl", "csv", "parquet")
+
+# Flat columns for CSV and Parquet; nested values are JSON-encoded.
+COLUMNS = (
+    "call_id", "agent_id", "call_type", "direction", "call_status",
+    "from_number", "to_number", "start_timestamp", "end_timestamp", "duration_ms",
+    "disconnection_reason", "transcript", "call_analysis", "metadata", "recording_url",
+)
+_INT_COLUMNS = frozenset({"start_timestamp", "end_timestamp", "duration_ms"})
+
+
+def flatten_call(call: dict) -> dict:
+    """Project a call onto :data:`COLUMNS`."""
+    start, end = call.get("start_timestamp"), call.get("end_timestamp")
+    row = {column: call.get(column) for column in COLUMNS}
+    row["duration_ms"] = end - start if start is not None and end else None
+    for column in ("call_analysis", "metadata"):
+        if row[column] is not None:
+            row[column] = json.dumps(row[column], ensure_ascii=False)
+    return row
+
+
+class _TextSink:
+    """Append-only JSONL/CSV writer that can be truncated back to a checkpoint."""
+
+    def __init__(self, path: Path, fmt: str, offset: Optional[int]) -> None:
+        self.path, self.fmt = path, fmt
+        self._file: IO[str] = open(path, "r+" if offset is not None else "w", encoding="utf-8", newline="")
+        if offset is not None:
+            self._file.seek(offset)
+            self._file.truncate()
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=COLUMNS)
+            if not offset:
+                self._csv.writeheader()
+
+    def write(self, calls: list[dict]) -> None:
+        if self._csv is not None:
+            self._csv.writerows(flatten_call(c) for c in calls)
+        else:
+            self._file.writelines(json.dumps(c, ensure_ascii=False) + "\n" for c in calls)
+
+    def flush(self) -> Optional[dict]:
+        """Make written rows durable; returns the checkpoint state to save."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"offset": self._file.tell()}
+
+    def close(self) -> Optional[dict]:
+        self._file.close()
+        return None
+
+
+class _ParquetSink:
+    """Parquet writer emitting one row group per batch, optionally split into parts.
+
+    Part 0 is written to ``path`` and part ``N`` to ``<stem>.partN<suffix>``.
+    With ``part_batches``, the current part is closed (and so readable) after
+    that many batches and the next batch opens the next part.
+    """
+
+    def __init__(self, path: Path, first_part: int = 0, part_batches: Optional[int] = None) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export needs pyarrow; install with: pip install 'mcp-retell[parquet]'"
+            ) from exc
+        self._pa, self._pq = pa, pq
+        self.path = path
+        self.part = first_part
+        self.part_batches = part_batches
+        self.paths: list[str] = []
+        self._schema = pa.schema([
+            (c, pa.int64() if c in _INT_COLUMNS else pa.string()) for c in COLUMNS
+        ])
+        self._writer = None
+        self._batches = 0
+
+    def part_path(self, part: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.part{part}{self.path.suffix}") if part else self.path
+
+    def write(self, calls: list[dict]) -> None:
+        if self._writer is None:
+            out = self.part_path(self.part)
+            self._writer = self._pq.ParquetWriter(str(out), self._schema)
+            self.paths.append(str(out))
+        rows = [flatten_call(c) for c in calls]
+        columns = {c: [r[c] for r in rows] for c in COLUMNS}
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+        self._batches += 1
+
+    def flush(self) -> Optional[dict]:
+        """Close the current part once it is full; returns its checkpoint state."""
+        if self.part_batches is None or self._batches < self.part_batches:
+            return None
+        return self.close()
+
+    def close(self) -> Optional[dict]:
+        """Close the current part (writing its footer), if one is open."""
+        if self._writer is None:
+            return None
+        self._writer.close()
+        self._writer, self._batches = None, 0
+        self.part += 1
+        return {"part": self.part - 1}
+
+
+class ExportCheckpoint:
+    """Progress of one export, rewritten atomically after every batch."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.state: dict = json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def save(self, **state: object) -> None:
+        self.state.update(state)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+async def _batches(calls: AsyncIterator[dict], size: int) -> AsyncIterator[list[dict]]:
+    batch: list[dict] = []
+    async for call in calls:
+        batch.append(call)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _archive_pages(
+    archive: CallArchive,
+    agent_id: Optional[str],
+    start_after: Optional[int],
+    start_before: Optional[int],
+    pagination_key: Optional[str],
+    page_size: int,
+) -> AsyncIterator[dict]:
+    key = pagination_key
+    while True:
+        page = await asyncio.to_thread(
+            archive.list_calls, agent_id=agent_id, limit=page_size, pagination_key=key,
+            start_after=start_after, start_before=start_before,
+        )
+        for call in page:
+            yield call
+        if len(page) < page_size:
+            return
+        key = page[-1]["call_id"]
+
+
+def _timing(report: dict, started: float) -> dict:
+    elapsed = time.monotonic() - started
+    report["elapsed_s"] = round(elapsed, 3)
+    report["rows_per_s"] = round(report["exported"] / elapsed, 1) if elapsed else None
+    return report
+
+
+async def aexport_calls(
+    client: RetellClient,
+    path: str | Path,
+    fmt: str = "jsonl",
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    details: bool = True,
+    concurrency: int = 8,
+    batch_size: int = 200,
+    checkpoint_path: Optional[str | Path] = None,
+    archive: Optional[CallArchive] = None,
+    progress: Optional[Callable[[dict], None]] = None,
+    part_batches: int = 10,
+) -> dict:
+    """Export every call started in ``(start_after, start_before)`` to ``path`` (async).
+
+    ``fmt`` is one of :data:`FORMATS`. With ``details``, each listed call is
+    replaced by its full ``get_call`` object (fetched ``concurrency`` at a
+    time); calls whose details fail keep their listed form and are counted in
+    ``detail_errors``. With an ``archive``, calls are read from the local store
+    and no requests are made. ``progress`` is called with the running report
+    after every batch. A checkpointed Parquet export starts a new part file
+    every ``part_batches`` batches (see the module docstring).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    started = time.monotonic()
+    path = Path(path)
+    checkpoint = ExportCheckpoint(checkpoint_path) if checkpoint_path else None
+    state = checkpoint.state if checkpoint else {}
+    resumed = bool(state.get("last_call_id"))
+    rows = state.get("rows", 0) if resumed else 0
+    report = {
+        "path": str(path), "format": fmt, "rows": rows, "exported": 0, "detail_errors": 0,
+        "resumed": resumed, "last_call_id": state.get("last_call_id"),
+    }
+
+    if fmt == "parquet":
+        sink = _ParquetSink(
+            path, state.get("part", -1) + 1 if resumed else 0,
+            max(1, part_batches) if checkpoint else None,
+        )
+        report["path"] = str(sink.part_path(sink.part))
+        report["parts"] = sink.paths
+    else:
+        sink = _TextSink(path, fmt, state.get("offset") if resumed and path.exists() else None)
+
+    def save(saved: Optional[dict]) -> None:
+        if checkpoint and saved is not None:
+            checkpoint.save(last_call_id=report["last_call_id"], rows=report["rows"], **saved)
+
+    if archive is not None:
+        calls = _archive_pages(
+            archive, agent_id, start_after, start_before, report["last_call_id"], batch_size,
+        )
+        details = False
+    else:
+        calls = aiter_calls(
+            client, agent_id=agent_id, page_size=min(batch_size, 1000),
+            pagination_key=report["last_call_id"], start_after=start_after, start_before=start_before,
+        )
+
+    try:
+        async for batch in _batches(calls, batch_size):
+            if details:
+                fetched = await aget_calls_many(
+                    client, [c["call_id"] for c in batch], concurrency=concurrency,
+                )
+                for i, result in enumerate(fetched["results"]):
+                    if "data" in result:
+                        batch[i] = result["data"]
+                    else:
+                        report["detail_errors"] += 1
+            sink.write(batch)
+            report["rows"] += len(batch)
+            report["exported"] += len(batch)
+            report["last_call_id"] = batch[-1].get("call_id")
+            save(sink.flush())
+            if progress:
+                progress(dict(_timing(report, started)))
+    finally:
+        save(sink.close())
+    return _timing(report, started)
+
+
+def export_calls(client: RetellClient, path: str | Path, **kwargs) -> dict:
+    """Export calls to ``path`` (sync). See ``aexport_calls``."""
+    return client.run(aexport_calls(client, path, **kwargs))
@@ -1,4 +1,4 @@
-"""Phone number operations — list, update."""
+"""Phone number operations — list, update (sync and async)."""
 
 from __future__ import annotations
 
@@ -7,34 +7,63 @@ from typing import Optional
 from ..client import RetellClient
 
 
-def list_phone_numbers(client: RetellClient) -> list[dict]:
-    """List all registered phone numbers (sync)."""
-    numbers = client.get_sync("/list-phone-numbers")
+def summarize_phone_number(n: dict) -> dict:
+    """Project a raw phone number object onto the fields returned by ``list_phone_numbers``."""
+    return {
+        "phone_number": n.get("phone_number"),
+        "phone_number_pretty": n.get("phone_number_pretty"),
+        "inbound_agent_id": n.get("inbound_agent_id"),
+        "area_code": n.get("area_code"),
+        "nickname": n.get("nickname"),
+    }
+
+
+def _summarize_phone_numbers(numbers: dict | list) -> list[dict]:
     if not isinstance(numbers, list):
         numbers = [numbers]
-    return [
-        {
-            "phone_number": n.get("phone_number"),
-            "phone_number_pretty": n.get("phone_number_pretty"),
-            "inbound_agent_id": n.get("inbound_agent_id"),
-            "area_code": n.get("area_code"),
-            "nickname": n.get("nickname"),
-        }
-        for n in numbers
-    ]
+    return [summarize_phone_number(n) for n in numbers]
 
 
-def update_phone_number(
-    client: RetellClient,
-    phone_number: str,
+def phone_number_update_payload(
     inbound_agent_id: Optional[str] = None,
     nickname: Optional[str] = None,
 ) -> dict:
-    """Update a phone number configuration (sync)."""
+    """Build the ``/update-phone-number`` body from the fields that are set."""
     payload: dict = {}
     if inbound_agent_id:
         payload["inbound_agent_id"] = inbound_agent_id
     if nickname:
         payload["nickname"] = nickname
+    return payload
 
+
+def list_phone_numbers(client: RetellClient, bypass_cache: bool = False) -> list[dict]:
+    """List all registered phone numbers (sync)."""
+    return _summarize_phone_numbers(client.get_sync("/list-phone-numbers", bypass_cache=bypass_cache))
+
+
+async def alist_phone_numbers(client: RetellClient, bypass_cache: bool = False) -> list[dict]:
+    """List all registered phone numbers (async)."""
+    return _summarize_phone_numbers(await client.get("/list-phone-numbers", bypass_cache=bypass_cache))
+
+
+def update_phone_number(
+    client: RetellClient,
+    phone_number: str,
+    inbound_agent_id: Optional[str] = None,
+    nickname: Optional[str] = None,
+) -> dict:
+    """Update a phone number configuration (sync)."""
+    payload = phone_number_update_payload(inbound_agent_id, nickname)
     return client.patch_sync(f"/update-phone-number/{phone_number}", json=payload)
+
+
+async def aupdate_phone_number(
+    client: RetellClient,
+    phone_number: str,
+    inbound_agent_id: Optional[str] = None,
+    nickname: Optional[str] = None,
+) -> dict:
+    """Update a phone number configuration (async)."""
+    payload = phone_number_update_payload(inbound_agent_id, nickname)
+    return await client.patch(f"/update-phone-number/{phone_number}", json=payload)
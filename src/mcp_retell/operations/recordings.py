@@ -0,0 +1,265 @@
+"""Call recording downloads — parallel, resumable, content-addressed cache.
+
+Recordings are streamed to disk in chunks (never held in memory whole) and
+stored once per content hash under ``<cache_dir>/objects``. A small ref file
+per call (``<cache_dir>/refs/<call_id>``) maps the call to its object, so a
+call that was already downloaded is answered from disk without any request.
+Interrupted downloads leave a ``.part`` file that the next attempt resumes
+with an HTTP ``Range`` request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..client import RetellClient
+from ..config import get_settings
+from ..retry import RetryPolicy
+from ..timeouts import clamp, remaining
+from .batch import describe_error
+from .calls import aget_call
+
+if TYPE_CHECKING:
+    from ..archive import CallArchive
+
+CHUNK_SIZE = 1 << 16
+
+_CALL_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def default_cache_dir() -> Path:
+    """``RETELL_RECORDINGS_DIR``, or ``~/.cache/mcp-retell/recordings``."""
+    configured = get_settings().recordings_dir
+    return Path(configured).expanduser() if configured else Path.home() / ".cache" / "mcp-retell" / "recordings"
+
+
+def _suffix(url: str) -> str:
+    suffix = PurePosixPath(urlsplit(url).path).suffix.lower()
+    return suffix if suffix and len(suffix) <= 5 else ".wav"
+
+
+def valid_call_id(call_id: str) -> bool:
+    """Whether ``call_id`` is safe to use as a file name in the cache."""
+    return bool(_CALL_ID.fullmatch(call_id or ""))
+
+
+class _Incomplete(Exception):
+    """The server closed the body before Content-Length bytes arrived."""
+
+
+def _checked(call_id: str) -> str:
+    # Call IDs become file names; anything else could escape the cache.
+    if not valid_call_id(call_id):
+        raise ValueError(f"Invalid call ID {call_id!r}")
+    return call_id
+
+
+class RecordingCache:
+    """Content-addressed store of recordings, keyed by call."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        for sub in ("objects", "refs", "partial"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+
+    def _ref(self, call_id: str) -> Path:
+        return self.root / "refs" / _checked(call_id)
+
+    def object_path(self, digest: str, suffix: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{suffix}"
+
+    def partial_path(self, call_id: str) -> Path:
+        return self.root / "partial" / f"{_checked(call_id)}.part"
+
+    def lookup(self, call_id: str) -> Optional[Path]:
+        """The cached recording of ``call_id``, if present."""
+        try:
+            name = self._ref(call_id).read_text().strip()
+        except FileNotFoundError:
+            return None
+        path = self.root / "objects" / name[:2] / name
+        return path if name and path.exists() else None
+
+    def commit(self, call_id: str, partial: Path, digest: str, suffix: str) -> Path:
+        """Move a finished download into the store and point ``call_id`` at it."""
+        path = self.object_path(digest, suffix)
+        path.parent.mkdir(exist_ok=True)
+        if path.exists():
+            partial.unlink()  # identical content already stored
+        else:
+            os.replace(partial, path)
+        tmp = self._ref(call_id).with_suffix(".tmp")
+        tmp.write_text(path.name)
+        os.replace(tmp, self._ref(call_id))
+        return path
+
+
+def _total_size(response: httpx.Response) -> Optional[int]:
+    """The object size from a ``Content-Range: bytes */<size>`` header."""
+    _, _, total = response.headers.get("Content-Range", "").rpartition("/")
+    return int(total) if total.isdigit() else None
+
+
+def _hash_file(path: Path) -> hashlib._Hash:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as existing:
+        for chunk in iter(lambda: existing.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher
+
+
+async def _receive(response: httpx.Response, partial: Path, offset: int) -> tuple[str, bool]:
+    """Stream ``response`` into ``partial``, appending to it for a ``206``."""
+    resumed = offset > 0 and response.status_code == 206
+    hasher = _hash_file(partial) if resumed else hashlib.sha256()
+    expected = response.headers.get("Content-Length")
+    received = 0
+    with open(partial, "ab" if resumed else "wb") as out:
+        async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            out.write(chunk)
+            hasher.update(chunk)
+            received += len(chunk)
+    if expected is not None and received < int(expected):
+        raise _Incomplete(f"received {received} of {expected} bytes")
+    return hasher.hexdigest(), resumed
+
+
+class RecordingDownloader:
+    """Download recordings with bounded concurrency into a :class:`RecordingCache`."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        concurrency: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: float = 60.0,
+    ) -> None:
+        settings = get_settings()
+        self.cache = RecordingCache(cache_dir or default_cache_dir())
+        self.concurrency = max(1, concurrency)
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(settings)
+        self._limits = httpx.Limits(
+            max_connections=self.concurrency, max_keepalive_connections=self.concurrency,
+        )
+        self._timeout = httpx.Timeout(timeout)
+
+    async def _stream_once(self, http: httpx.AsyncClient, url: str, partial: Path) -> tuple[str, bool]:
+        """One attempt: resume ``partial`` if possible; return (sha256, resumed)."""
+        offset = partial.stat().st_size if partial.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        async with http.stream("GET", url, headers=headers, timeout=clamp(self._timeout)) as response:
+            if response.status_code != 416 or not offset:
+                response.raise_for_status()
+                return await _receive(response, partial, offset)
+            if _total_size(response) == offset:  # partial already holds every byte
+                return _hash_file(partial).hexdigest(), True
+        # The remote object is not the one the partial came from; start over.
+        partial.unlink()
+        return await self._stream_once(http, url, partial)
+
+    async def _download(self, http: httpx.AsyncClient, call_id: str, url: str) -> dict:
+        partial = self.cache.partial_path(call_id)
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            attempt += 1
+            try:
+                digest, resumed = await self._stream_once(http, url, partial)
+                break
+            except (httpx.HTTPError, _Incomplete) as exc:
+                response = exc.response if isinstance(exc, httpx.HTTPStatusError) else None
+                error = None if response is not None else (
+                    exc if isinstance(exc, httpx.HTTPError) else httpx.ReadError(str(exc))
+                )
+                delay = self.retry_policy.next_delay(
+                    "GET", attempt, time.monotonic() - started, response=response, exc=error,
+                )
+                left = remaining()
+                if delay is None or (left is not None and delay >= left):
+                    raise
+                await asyncio.sleep(delay)
+        size = partial.stat().st_size
+        path = self.cache.commit(call_id, partial, digest, _suffix(url))
+        return {"call_id": call_id, "path": str(path), "sha256": digest, "bytes": size,
+                "cached": False, "resumed": resumed}
+
+    async def download(
+        self,
+        client: RetellClient,
+        call_ids: list[str],
+        urls: Optional[dict[str, str]] = None,
+        archive: Optional[CallArchive] = None,
+    ) -> dict:
+        """Download the recordings of ``call_ids``; results keep input order.
+
+        Each result holds the local ``path`` (plus ``sha256``, ``bytes``,
+        ``cached``, ``resumed``) or an ``error``. Recording URLs are looked up
+        with ``get_call`` unless given in ``urls``.
+        """
+        started = time.monotonic()
+        urls = urls or {}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(http: httpx.AsyncClient, call_id: str) -> dict:
+            if not valid_call_id(call_id):
+                return {"call_id": call_id, "error": "invalid call ID"}
+            async with semaphore:
+                path = self.cache.lookup(call_id)
+                if path is not None:
+                    return {"call_id": call_id, "path": str(path), "bytes": path.stat().st_size,
+                            "cached": True, "resumed": False}
+                try:
+                    url = urls.get(call_id)
+                    if url is None:
+                        url = (await aget_call(client, call_id, archive=archive)).get("recording_url")
+                    if not url:
+                        return {"call_id": call_id, "error": "no recording"}
+                    return await self._download(http, call_id, url)
+                except (httpx.HTTPError, _Incomplete, OSError) as exc:
+                    return {"call_id": call_id, "error": describe_error(exc)}
+
+        async with httpx.AsyncClient(
+            limits=self._limits, timeout=self._timeout, follow_redirects=True,
+        ) as http:
+            results = await asyncio.gather(*(one(http, call_id) for call_id in call_ids))
+        elapsed = time.monotonic() - started
+        downloaded = [r for r in results if "error" not in r and not r["cached"]]
+        total_bytes = sum(r["bytes"] for r in downloaded)
+        return {
+            "results": list(results),
+            "summary": {
+                "requested": len(results),
+                "downloaded": len(downloaded),
+                "cached": sum(1 for r in results if r.get("cached")),
+                "failed": sum(1 for r in results if "error" in r),
+                "bytes": total_bytes,
+                "elapsed_s": round(elapsed, 3),
+                "mb_per_s": round(total_bytes / elapsed / 1e6, 2) if elapsed else None,
+            },
+        }
+
+
+async def adownload_recordings(
+    client: RetellClient,
+    call_ids: list[str],
+    cache_dir: Optional[str | Path] = None,
+    concurrency: int = 8,
+    archive: Optional[CallArchive] = None,
+) -> dict:
+    """Download call recordings into the local cache (async). See ``RecordingDownloader.download``."""
+    downloader = RecordingDownloader(cache_dir, concurrency=concurrency)
+    return await downloader.download(client, call_ids, archive=archive)
+
+
+def download_recordings(client: RetellClient, call_ids: list[str], **kwargs) -> dict:
+    """Download call recordings into the local cache (sync)."""
+    return client.run(adownload_recordings(client, call_ids, **kwargs))
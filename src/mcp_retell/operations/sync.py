@@ -0,0 +1,173 @@
+"""Declarative agent sync — apply a manifest of desired agents, changed fields only.
+
+A manifest lists agents by ``agent_id`` (or by a unique ``agent_name``) with
+the fields they should have::
+
+    agents:
+      - agent_id: agent_123
+        agent_name: Support
+        voice_id: 11labs-Adrian
+        prompt: You are a helpful support agent.
+
+:func:`sync_agents_async` fetches every listed agent concurrently, compares
+each field by the SHA-256 of its canonical JSON, and sends one
+``/update-agent`` PATCH per agent carrying only the fields that differ. Fields left out of the
+manifest are not touched, and nested values (``response_engine``, lists) are
+compared whole. A sync where nothing changed only reads, and ``dry_run``
+reports what would change without writing.
+
+Manifests are JSON, or YAML with PyYAML installed
+(``pip install 'mcp-retell[yaml]'``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from ..client import RetellClient
+from .agents import aget_agents_many, aupdate_agent
+from .batch import describe_error
+
+# Read-only or identifying fields that are never sent in a PATCH.
+IGNORED_FIELDS = frozenset({"agent_id", "last_modification_timestamp"})
+
+
+def load_manifest(path: str | Path) -> list[dict]:
+    """Read the desired agents from a JSON or YAML manifest.
+
+    The file holds either a list of agents or ``{"agents": [...]}``.
+    """
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError(
+                "YAML manifests need PyYAML (pip install 'mcp-retell[yaml]').",
+            ) from None
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as exc:
+            raise ValueError(f"{path}: {exc}") from None
+    else:
+        data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("agents")
+    if not isinstance(data, list) or not all(isinstance(agent, dict) for agent in data):
+        raise ValueError(f"{path}: expected a list of agents or an 'agents' list")
+    for agent in data:
+        if not agent.get("agent_id") and not agent.get("agent_name"):
+            raise ValueError(f"{path}: every agent needs an agent_id or agent_name")
+    return data
+
+
+def field_digest(value: object) -> str:
+    """SHA-256 of ``value``'s canonical JSON, so equal values hash equal."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def diff_agent(desired: dict, current: dict) -> dict:
+    """The fields of ``desired`` whose values differ from ``current``.
+
+    Retell leaves null fields out of agent objects, so a field missing from
+    ``current`` equals a desired ``None``.
+    """
+    return {
+        key: value
+        for key, value in desired.items()
+        if key not in IGNORED_FIELDS and field_digest(value) != field_digest(current.get(key))
+    }
+
+
+async def _resolve_ids(client: RetellClient, agents: list[dict]) -> tuple[list[Optional[str]], int]:
+    """Each agent's ID, looking up those given only by name; also the reads made."""
+    if all(agent.get("agent_id") for agent in agents):
+        return [agent["agent_id"] for agent in agents], 0
+    listed = await client.get("/list-agents", bypass_cache=True)
+    by_name: dict[str, list[str]] = {}
+    for agent in listed if isinstance(listed, list) else [listed]:
+        by_name.setdefault(agent.get("agent_name"), []).append(agent.get("agent_id"))
+    ids = []
+    for agent in agents:
+        matches = by_name.get(agent.get("agent_name"), [])
+        ids.append(agent.get("agent_id") or (matches[0] if len(matches) == 1 else None))
+    return ids, 1
+
+
+async def sync_agents_async(
+    client: RetellClient,
+    agents: list[dict],
+    dry_run: bool = False,
+    concurrency: int = 10,
+) -> dict:
+    """Bring Retell's agents in line with ``agents`` (async).
+
+    Returns ``{"results", "summary"}``. Each result has the agent's
+    ``agent_id``, ``agent_name``, a ``status`` (``unchanged``, ``changed``
+    on a dry run, ``updated``, ``not_found`` or ``failed``), the ``fields``
+    that differ and, on failure, an ``error``. Agents given by a name that
+    matches no agent, or several, are ``not_found``. The summary counts the
+    ``reads`` made and the ``writes`` that succeeded.
+    """
+    started = time.monotonic()
+    ids, reads = await _resolve_ids(client, agents)
+    found = [agent_id for agent_id in ids if agent_id]
+    # Read past the TTL cache so the diff is against Retell's current state.
+    fetched = await aget_agents_many(client, found, concurrency=concurrency, bypass_cache=True)
+    current = {entry["agent_id"]: entry for entry in fetched["results"]}
+    reads += len(found)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    writes = 0
+
+    async def one(desired: dict, agent_id: Optional[str]) -> dict:
+        nonlocal writes
+        result = {"agent_id": agent_id, "agent_name": desired.get("agent_name"), "fields": []}
+        entry = current.get(agent_id) if agent_id else None
+        if entry is None:
+            return {**result, "status": "not_found"}
+        if "error" in entry:
+            status = "not_found" if entry["error"] == "HTTP 404" else "failed"
+            return {**result, "status": status, "error": entry["error"]}
+        changes = diff_agent(desired, entry["data"])
+        result["fields"] = sorted(changes)
+        if not changes:
+            return {**result, "status": "unchanged"}
+        if dry_run:
+            return {**result, "status": "changed"}
+        async with semaphore:
+            try:
+                await aupdate_agent(client, agent_id, extra=changes)
+            except (httpx.HTTPError, OSError) as exc:
+                return {**result, "status": "failed", "error": describe_error(exc)}
+        writes += 1
+        return {**result, "status": "updated"}
+
+    results = list(await asyncio.gather(*(one(agent, agent_id) for agent, agent_id in zip(agents, ids))))
+    counts = {status: 0 for status in ("unchanged", "changed", "updated", "not_found", "failed")}
+    for result in results:
+        counts[result["status"]] += 1
+    return {
+        "results": results,
+        "summary": {
+            "agents": len(results),
+            **counts,
+            "dry_run": dry_run,
+            "reads": reads,
+            "writes": writes,
+            "elapsed_s": round(time.monotonic() - started, 3),
+        },
+    }
+
+
+def sync_agents(client: RetellClient, agents: list[dict], **kwargs) -> dict:
+    """Bring Retell's agents in line with ``agents`` (sync). See ``sync_agents_async``."""
+    return client.run(sync_agents_async(client, agents, **kwargs))
@@ -1,27 +1,42 @@
-"""Voice operations — list, get."""
+"""Voice operations — list, get (sync and async)."""
 
 from __future__ import annotations
 
 from ..client import RetellClient
 
 
-def list_voices(client: RetellClient) -> list[dict]:
-    """List available voices from Retell's voice library (sync)."""
-    voices = client.get_sync("/list-voices")
+def summarize_voice(v: dict) -> dict:
+    """Project a raw voice object onto the fields returned by ``list_voices``."""
+    return {
+        "voice_id": v.get("voice_id"),
+        "voice_name": v.get("voice_name"),
+        "provider": v.get("provider"),
+        "gender": v.get("gender"),
+        "accent": v.get("accent"),
+    }
+
+
+def _summarize_voices(voices: dict | list) -> list[dict]:
     if not isinstance(voices, list):
         voices = [voices]
-    return [
-        {
-            "voice_id": v.get("voice_id"),
-            "voice_name": v.get("voice_name"),
-            "provider": v.get("provider"),
-            "gender": v.get("gender"),
-            "accent": v.get("accent"),
-        }
-        for v in voices
-    ]
-
-
-def get_voice(client: RetellClient, voice_id: str) -> dict:
+    return [summarize_voice(v) for v in voices]
+
+
+def list_voices(client: RetellClient, bypass_cache: bool = False) -> list[dict]:
+    """List available voices from Retell's voice library (sync)."""
+    return _summarize_voices(client.get_sync("/list-voices", bypass_cache=bypass_cache))
+
+
+async def alist_voices(client: RetellClient, bypass_cache: bool = False) -> list[dict]:
+    """List available voices from Retell's voice library (async)."""
+    return _summarize_voices(await client.get("/list-voices", bypass_cache=bypass_cache))
+
+
+def get_voice(client: RetellClient, voice_id: str, bypass_cache: bool = False) -> dict:
     """Get details of a specific voice (sync)."""
-    return client.get_sync(f"/get-voice/{voice_id}")
+    return client.get_sync(f"/get-voice/{voice_id}", bypass_cache=bypass_cache)
+
+
+async def aget_voice(client: RetellClient, voice_id: str, bypass_cache: bool = False) -> dict:
+    """Get details of a specific voice (async)."""
+    return await client.get(f"/get-voice/{voice_id}", bypass_cache=bypass_cache)
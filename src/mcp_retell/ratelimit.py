@@ -0,0 +1,139 @@
+"""Client-side token-bucket rate limiting for Retell API requests.
+
+Buckets are shared by the async and sync request paths: a token is reserved
+under a thread lock and the caller then sleeps (``asyncio.sleep`` or
+``time.sleep``) for however long the reservation requires. A caller with a
+deadline passes the time it has left: a token it could not get in time is
+never taken, and the call fails with
+:class:`~mcp_retell.timeouts.DeadlineExceeded` at once. Requests are
+grouped into endpoint classes so a burst of reads cannot starve
+``/create-phone-call`` and vice versa.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from mcp_retell.config import Settings
+from mcp_retell.timeouts import DeadlineExceeded
+
+READ = "read"
+WRITE = "write"
+CREATE_CALL = "create_call"
+
+
+def classify(method: str, endpoint: str) -> str:
+    """Map a request to its rate-limit class."""
+    if endpoint.startswith("/create-phone-call"):
+        return CREATE_CALL
+    if method.upper() == "GET":
+        return READ
+    return WRITE
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.rejected = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Take one token and return the seconds the caller must wait for it.
+
+        Returns ``None`` without taking a token when the wait would be longer
+        than ``max_wait``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                return None
+            self._tokens -= 1
+            self.acquired += 1
+            if wait:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def _reserve_or_raise(self, max_wait: float | None) -> float:
+        wait = self.reserve(max_wait)
+        if wait is None:
+            raise DeadlineExceeded("deadline exceeded waiting for a rate-limit token")
+        return wait
+
+    async def acquire(self, max_wait: float | None = None) -> float:
+        """Wait for a token; raises ``DeadlineExceeded`` if it takes over ``max_wait``."""
+        wait = self._reserve_or_raise(max_wait)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def acquire_sync(self, max_wait: float | None = None) -> float:
+        wait = self._reserve_or_raise(max_wait)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "acquired": self.acquired,
+                "rejected": self.rejected,
+                "waited": self.waited,
+                "total_wait_s": round(self.total_wait, 6),
+                "max_wait_s": round(self.max_wait, 6),
+            }
+
+
+class RateLimiter:
+    """One token bucket per endpoint class; classes without a bucket are unlimited."""
+
+    def __init__(self, buckets: dict[str, TokenBucket]) -> None:
+        self.buckets = buckets
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RateLimiter:
+        limits = {
+            READ: (settings.rate_limit_read_rps, settings.rate_limit_read_burst),
+            WRITE: (settings.rate_limit_write_rps, settings.rate_limit_write_burst),
+            CREATE_CALL: (settings.rate_limit_create_call_rps, settings.rate_limit_create_call_burst),
+        }
+        return cls({
+            name: TokenBucket(rate, burst)
+            for name, (rate, burst) in limits.items()
+            if rate > 0
+        })
+
+    async def acquire(self, method: str, endpoint: str, max_wait: float | None = None) -> float:
+        """Wait for a token for this request; returns the queue-wait in seconds.
+
+        Raises ``DeadlineExceeded`` without waiting if the token would take
+        longer than ``max_wait`` seconds.
+        """
+        bucket = self.buckets.get(classify(method, endpoint))
+        return await bucket.acquire(max_wait) if bucket else 0.0
+
+    def acquire_sync(self, method: str, endpoint: str, max_wait: float | None = None) -> float:
+        bucket = self.buckets.get(classify(method, endpoint))
+        return bucket.acquire_sync(max_wait) if bucket else 0.0
+
+    def snapshot(self) -> dict:
+        """Per-bucket counters, including how long callers queued for tokens."""
+        return {name: bucket.snapshot() for name, bucket in self.buckets.items()}
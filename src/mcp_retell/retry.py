@@ -0,0 +1,148 @@
+"""Retry policy for transient Retell API failures.
+
+Retries use capped exponential backoff with full jitter, honour the
+``Retry-After`` header, and respect per-method idempotency: non-idempotent
+requests (``POST``, e.g. ``/create-phone-call``) are only retried when the
+request provably never reached the server (connect failures) or was
+explicitly rejected before processing (``429``).
+"""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+import httpx
+
+from mcp_retell.config import Settings
+
+# Errors raised before any request bytes were sent — safe for every method.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a request."""
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    max_elapsed: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    unsafe_retry_statuses: frozenset[int] = frozenset({429})
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"}
+    )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RetryPolicy:
+        return cls(
+            max_attempts=settings.retry_max_attempts,
+            backoff_base=settings.retry_backoff_base,
+            backoff_max=settings.retry_backoff_max,
+            max_elapsed=settings.retry_max_elapsed,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number ``attempt`` (1-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def should_retry_status(self, method: str, status: int) -> bool:
+        if method.upper() in self.idempotent_methods:
+            return status in self.retry_statuses
+        return status in self.unsafe_retry_statuses
+
+    def should_retry_error(self, method: str, exc: Exception) -> bool:
+        if isinstance(exc, NOT_SENT_ERRORS):
+            return True
+        return method.upper() in self.idempotent_methods and isinstance(exc, httpx.TransportError)
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        response: httpx.Response | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or ``None`` to give up.
+
+        ``attempt`` is the number of attempts already made.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if response is not None:
+            if not self.should_retry_status(method, response.status_code):
+                return None
+            delay = retry_after(response)
+            if delay is None:
+                delay = self.backoff(attempt)
+        elif exc is not None:
+            if not self.should_retry_error(method, exc):
+                return None
+            delay = self.backoff(attempt)
+        else:
+            return None
+        if elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+@dataclass
+class RetryStats:
+    """Thread-safe counters describing retry behaviour, for tuning the policy."""
+
+    requests: int = 0
+    retries: int = 0
+    giveups: int = 0
+    reasons: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, reason: str) -> None:
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] += 1
+
+    def record_giveup(self) -> None:
+        with self._lock:
+            self.giveups += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "giveups": self.giveups,
+                "reasons": dict(self.reasons),
+            }
+
+
+def retry_reason(response: httpx.Response | None, exc: Exception | None) -> str:
+    if response is not None:
+        return str(response.status_code)
+    return type(exc).__name__
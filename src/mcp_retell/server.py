@@ -1,21 +1,48 @@
 """Retell MCP Server — backward-compatible async @mcp.tool wrappers.
 
-Tool names match the original server.py for drop-in replacement.
+Tool names match the original server.py for drop-in replacement. Each tool is a
+thin wrapper over the async functions in ``operations``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import json
-from typing import Optional
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, Optional
 
 from mcp.server.fastmcp import FastMCP
+from pydantic import Field
 
+from .analytics import aanalyze_calls
+from .archive import CallArchive, arefresh_archive
 from .client import RetellClient
-from .operations import agents, calls, phones, voices
-
-mcp = FastMCP("retell")
+from .config import get_settings
+from .multicall import run_batch
+from .operations import agents, calls, dialer, phones, voices
+from .operations.recordings import adownload_recordings
+from .shaping import shape
+from .timeouts import deadline
+from .warmer import CatalogWarmer
+from .watcher import wait_for_calls_async
+from .webhooks import WebhookReceiver, webhook_server
+
+# Response-shaping parameters accepted by every tool.
+Fields = Annotated[Optional[str], Field(
+    description="Comma-separated fields to return; dotted paths select nested keys",
+)]
+Compact = Annotated[Optional[bool], Field(
+    description="Return compact JSON instead of pretty-printed",
+)]
+MaxBytes = Annotated[Optional[int], Field(
+    description="Truncate the response to at most this many bytes",
+)]
 
 _client: RetellClient | None = None
+_archive: CallArchive | None = None
 
 
 def _get_client() -> RetellClient:
@@ -25,37 +52,119 @@ def _get_client() -> RetellClient:
     return _client
 
 
+def _get_archive() -> CallArchive | None:
+    """The local call archive, if RETELL_ARCHIVE_PATH is configured."""
+    global _archive
+    if _archive is None:
+        settings = get_settings()
+        if settings.archive_path:
+            _archive = CallArchive.from_settings(settings)
+    return _archive
+
+
+def _require_archive() -> CallArchive:
+    archive = _get_archive()
+    if archive is None:
+        raise ValueError("The call archive is disabled; set RETELL_ARCHIVE_PATH to enable it.")
+    return archive
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Start the catalog warmer and webhook receiver if configured; close the pool on shutdown."""
+    settings = get_settings()
+    warmer = webhooks = task = None
+    if settings.warm_catalogs:
+        # Not awaited: reads that arrive before the first warm-up finishes
+        # join its in-flight requests.
+        warmer = CatalogWarmer(_get_client(), interval=settings.warm_interval or None)
+        warmer.start()
+    if settings.webhook_port:
+        receiver = WebhookReceiver.from_settings(_require_archive(), settings)
+        webhooks = webhook_server(
+            receiver, settings.webhook_host, settings.webhook_port, handle_signals=False,
+        )
+        task = asyncio.create_task(webhooks.serve())
+    try:
+        yield
+    finally:
+        if warmer is not None:
+            await warmer.stop()
+        if webhooks is not None:
+            webhooks.should_exit = True
+            await task
+        if _client is not None:
+            await _client.aclose()
+
+
+mcp = FastMCP("retell", lifespan=_lifespan)
+
+
+def _tool(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Register ``fn`` as a tool that runs under the RETELL_TOOL_DEADLINE budget.
+
+    Every request the tool makes, however deeply nested, shares the one
+    deadline; a slow upstream fails with ``DeadlineExceeded`` instead of
+    outliving the caller's own tool timeout.
+    """
+    @functools.wraps(fn)
+    async def run(*args: Any, **kwargs: Any) -> str:
+        with deadline(get_settings().tool_deadline):
+            return await fn(*args, **kwargs)
+
+    mcp.tool()(run)
+    return run
+
+
 # --- Agent Management ---
 
-@mcp.tool()
-async def list_agents() -> str:
-    """List all voice agents."""
-    c = _get_client()
-    data = await c.get("/list-agents")
-    if not isinstance(data, list):
-        data = [data]
-    result = [
-        {
-            "agent_id": a.get("agent_id"),
-            "agent_name": a.get("agent_name"),
-            "voice_id": a.get("voice_id"),
-            "language": a.get("language"),
-            "created_at": a.get("last_modification_timestamp"),
-        }
-        for a in data
-    ]
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-async def get_agent(agent_id: str) -> str:
-    """Get details of a specific agent."""
-    c = _get_client()
-    data = await c.get(f"/get-agent/{agent_id}")
-    return json.dumps(data, indent=2)
-
-
-@mcp.tool()
+@_tool
+async def list_agents(
+    bypass_cache: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """List all voice agents. Set bypass_cache to force a fresh read."""
+    data = await agents.alist_agents(_get_client(), bypass_cache=bypass_cache)
+    return shape(data, fields, compact, max_bytes, tool="list_agents")
+
+
+@_tool
+async def get_agent(
+    agent_id: str,
+    bypass_cache: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Get details of a specific agent. Set bypass_cache to force a fresh read."""
+    data = await agents.aget_agent(_get_client(), agent_id, bypass_cache=bypass_cache)
+    return shape(data, fields, compact, max_bytes, tool="get_agent")
+
+
+@_tool
+async def get_agents_many(
+    agent_ids: list[str],
+    concurrency: int = 10,
+    bypass_cache: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Get many agents in one call, fetched concurrently.
+
+    Results follow the order of agent_ids; each has the agent under data or an
+    error for that agent. fields paths apply to each result (e.g.
+    "results.agent_id,results.data.agent_name").
+    """
+    data = await agents.aget_agents_many(
+        _get_client(), agent_ids, concurrency=concurrency, bypass_cache=bypass_cache,
+    )
+    return shape(data, fields, compact, max_bytes, tool="get_agents_many")
+
+
+@_tool
 async def create_agent(
     agent_name: str,
     voice_id: str,
@@ -66,209 +175,411 @@ async def create_agent(
     responsiveness: float = 1.0,
     interruption_sensitivity: float = 1.0,
     enable_backchannel: bool = True,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
 ) -> str:
     """Create a new voice agent."""
-    c = _get_client()
-    payload: dict = {
-        "agent_name": agent_name,
-        "voice_id": voice_id,
-        "response_engine": {"type": "retell-llm", "llm_id": model},
-        "llm_websocket_url": None,
-        "voice_model": "eleven_turbo_v2",
-        "language": language,
-        "prompt": prompt,
-        "responsiveness": responsiveness,
-        "interruption_sensitivity": interruption_sensitivity,
-        "enable_backchannel": enable_backchannel,
-    }
-    if begin_message:
-        payload["begin_message"] = begin_message
-
-    data = await c.post("/create-agent", json=payload)
-    return json.dumps(data, indent=2)
-
-
-@mcp.tool()
+    data = await agents.acreate_agent(
+        _get_client(), agent_name, voice_id, prompt,
+        language=language, begin_message=begin_message, model=model,
+        responsiveness=responsiveness,
+        interruption_sensitivity=interruption_sensitivity,
+        enable_backchannel=enable_backchannel,
+    )
+    return shape(data, fields, compact, max_bytes, tool="create_agent")
+
+
+@_tool
 async def update_agent(
     agent_id: str,
     agent_name: Optional[str] = None,
     prompt: Optional[str] = None,
     begin_message: Optional[str] = None,
     voice_id: Optional[str] = None,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
 ) -> str:
     """Update an existing agent."""
-    c = _get_client()
-    payload: dict = {}
-    if agent_name:
-        payload["agent_name"] = agent_name
-    if prompt:
-        payload["prompt"] = prompt
-    if begin_message:
-        payload["begin_message"] = begin_message
-    if voice_id:
-        payload["voice_id"] = voice_id
-
-    data = await c.patch(f"/update-agent/{agent_id}", json=payload)
-    return json.dumps(data, indent=2)
-
-
-@mcp.tool()
-async def delete_agent(agent_id: str) -> str:
+    data = await agents.aupdate_agent(
+        _get_client(), agent_id,
+        agent_name=agent_name, prompt=prompt,
+        begin_message=begin_message, voice_id=voice_id,
+    )
+    return shape(data, fields, compact, max_bytes, tool="update_agent")
+
+
+@_tool
+async def delete_agent(
+    agent_id: str,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
     """Delete an agent."""
-    c = _get_client()
-    await c.delete(f"/delete-agent/{agent_id}")
-    return json.dumps({"status": "deleted", "agent_id": agent_id}, indent=2)
+    data = await agents.adelete_agent(_get_client(), agent_id)
+    return shape(data, fields, compact, max_bytes, tool="delete_agent")
 
 
 # --- Call Management ---
 
-@mcp.tool()
+@_tool
 async def create_phone_call(
     agent_id: str,
     to_number: str,
     from_number: str,
     metadata: Optional[str] = None,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
 ) -> str:
     """Initiate an outbound phone call."""
-    c = _get_client()
-    payload: dict = {
-        "agent_id": agent_id,
-        "to_number": to_number,
-        "from_number": from_number,
-    }
-    if metadata:
-        payload["metadata"] = json.loads(metadata)
+    data = await calls.acreate_phone_call(
+        _get_client(), agent_id, to_number, from_number, metadata=metadata,
+    )
+    return shape(data, fields, compact, max_bytes, tool="create_phone_call")
+
+
+@_tool
+async def bulk_create_phone_calls(
+    rows: Optional[str] = None,
+    rows_file: Optional[str] = None,
+    from_number: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    concurrency: int = 5,
+    per_number_concurrency: int = 1,
+    checkpoint_path: Optional[str] = None,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Initiate many outbound phone calls with bounded concurrency.
+
+    Provide rows as a JSON array (or JSONL text) of objects with to_number and
+    optional agent_id, from_number, metadata and id, or rows_file as the name
+    of a CSV/JSONL file in the dial directory (RETELL_DIAL_DIR). from_number
+    and agent_id are defaults for rows that omit them. With checkpoint_path
+    (a file name, also kept in the dial directory), re-running the same rows
+    resumes without redialing numbers that were already called.
+    """
+    if checkpoint_path:
+        checkpoint_path = dialer.dial_path(checkpoint_path)
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    if rows_file:
+        source = dialer.load_dial_rows(dialer.dial_path(rows_file))
+    elif rows and rows.lstrip().startswith("["):
+        source = json.loads(rows)
+    else:
+        source = dialer.load_dial_rows(io.StringIO(rows or ""))
+    data = await dialer.adial_many(
+        _get_client(), source, from_number=from_number, agent_id=agent_id,
+        concurrency=concurrency, per_number_concurrency=per_number_concurrency,
+        checkpoint_path=checkpoint_path,
+    )
+    return shape(data, fields, compact, max_bytes, tool="bulk_create_phone_calls")
+
+
+@_tool
+async def wait_for_calls(
+    call_ids: list[str],
+    timeout_s: float = 300.0,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Wait for calls to end and return how each one ended.
 
-    data = await c.post("/create-phone-call", json=payload)
-    return json.dumps(data, indent=2)
+    Polls all calls in one loop: often at first, then backing off, and often
+    again around typical call end times. Returns finished calls in the order
+    they ended, plus the IDs still live when timeout_s ran out (pending) and
+    calls that could not be polled (failed).
+    """
+    data = await wait_for_calls_async(_get_client(), call_ids, timeout=timeout_s, archive=_get_archive())
+    return shape(data, fields, compact, max_bytes, tool="wait_for_calls")
 
 
-@mcp.tool()
+@_tool
 async def list_calls(
     agent_id: Optional[str] = None,
     limit: int = 50,
     sort_order: str = "descending",
+    pagination_key: Optional[str] = None,
+    from_archive: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """List phone calls.
+
+    To page through older results, pass the call_id of the last call in the
+    previous response as pagination_key. Set from_archive to answer from the
+    local call archive without calling the API.
+    """
+    data = await calls.alist_calls(
+        _get_client(), agent_id=agent_id, limit=limit, sort_order=sort_order,
+        pagination_key=pagination_key, archive=_require_archive() if from_archive else None,
+    )
+    return shape(data, fields, compact, max_bytes, tool="list_calls")
+
+
+@_tool
+async def get_call(
+    call_id: str,
+    from_archive: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Get details of a specific call.
+
+    Set from_archive to return the archived copy when the call has ended.
+    """
+    data = await calls.aget_call(
+        _get_client(), call_id,
+        archive=_require_archive() if from_archive else _get_archive(),
+        refresh=not from_archive,
+    )
+    return shape(data, fields, compact, max_bytes, tool="get_call")
+
+
+@_tool
+async def get_calls_many(
+    call_ids: list[str],
+    concurrency: int = 10,
+    from_archive: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Get many calls in one call, fetched concurrently.
+
+    Results follow the order of call_ids; each has the call under data or an
+    error for that call. Set from_archive to use archived copies of ended
+    calls. fields paths apply to each result (e.g.
+    "results.call_id,results.data.call_status").
+    """
+    data = await calls.aget_calls_many(
+        _get_client(), call_ids, concurrency=concurrency,
+        archive=_require_archive() if from_archive else None,
+    )
+    return shape(data, fields, compact, max_bytes, tool="get_calls_many")
+
+
+@_tool
+async def sync_call_archive(
+    agent_id: Optional[str] = None,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Incrementally sync the local call archive with Retell.
+
+    Fetches only calls newer than the newest archived call, plus calls that
+    were still in progress at the previous sync.
+    """
+    report = await arefresh_archive(_get_client(), _require_archive(), agent_id=agent_id)
+    return shape(report, fields, compact, max_bytes, tool="sync_call_archive")
+
+
+@_tool
+async def get_call_transcript(
+    call_id: str,
+    start_turn: Optional[int] = None,
+    end_turn: Optional[int] = None,
+    last_n: Optional[int] = None,
+    speaker: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    cursor: Optional[int] = None,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Get the transcript of a call.
+
+    Without window options the whole transcript and call analysis are
+    returned. To bound the response, select turns with start_turn/end_turn,
+    last_n, speaker ("agent" or "user") and/or a max_chars/max_tokens budget;
+    the result then lists turns and a next_cursor to pass as cursor for the
+    next chunk of a long transcript.
+    """
+    window = (start_turn, end_turn, last_n, speaker, max_chars, max_tokens, cursor)
+    if all(option is None for option in window):
+        data = await calls.aget_call_transcript(
+            _get_client(), call_id, archive=_get_archive(), refresh=True,
+        )
+    else:
+        data = await calls.aget_transcript_window(
+            _get_client(), call_id, start_turn=start_turn, end_turn=end_turn, last_n=last_n,
+            speaker=speaker, max_chars=max_chars, max_tokens=max_tokens, cursor=cursor,
+            archive=_get_archive(), refresh=True,
+        )
+    return shape(data, fields, compact, max_bytes, tool="get_call_transcript")
+
+
+@_tool
+async def search_transcripts(
+    query: str,
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Full-text search over archived call transcripts, best matches first.
+
+    query supports "exact phrases", OR, NOT, NEAR(a b, 5) and prefix*.
+    start_after/start_before filter on call start time (ms since epoch).
+    Pass next_offset from the response as offset to get the next page.
+    Searches the local call archive; run sync_call_archive to index new calls.
+    """
+    # Local SQLite reads; keep them off the event loop.
+    data = await asyncio.to_thread(
+        _require_archive().search_transcripts,
+        query, agent_id=agent_id, start_after=start_after, start_before=start_before,
+        limit=limit, offset=offset,
+    )
+    return shape(data, fields, compact, max_bytes, tool="search_transcripts")
+
+
+@_tool
+async def analyze_calls(
+    agent_id: Optional[str] = None,
+    start_after: Optional[int] = None,
+    start_before: Optional[int] = None,
+    from_archive: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Aggregate statistics over every call in a time range.
+
+    Returns duration mean/p50/p90/p99, call_status and disconnection_reason
+    counts, per-agent and per-number rollups, and an hourly series (rollups
+    and series are columnar: one list per column). start_after/start_before
+    filter on call start time (ms since epoch). Set from_archive to scan the
+    local call archive instead of paging through the API.
+    """
+    data = await aanalyze_calls(
+        _get_client(), agent_id=agent_id, start_after=start_after, start_before=start_before,
+        archive=_require_archive() if from_archive else None,
+    )
+    return shape(data, fields, compact, max_bytes, tool="analyze_calls")
+
+
+@_tool
+async def download_recordings(
+    call_ids: list[str],
+    concurrency: int = 8,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
 ) -> str:
-    """List phone calls."""
-    c = _get_client()
-    params: dict = {"limit": limit, "sort_order": sort_order}
-    if agent_id:
-        params["filter_criteria"] = json.dumps([{
-            "member": "agent_id", "operator": "eq", "value": agent_id,
-        }])
-
-    data = await c.get("/list-calls", params=params)
-    if not isinstance(data, list):
-        data = [data]
-    result = [
-        {
-            "call_id": call.get("call_id"),
-            "agent_id": call.get("agent_id"),
-            "call_type": call.get("call_type"),
-            "call_status": call.get("call_status"),
-            "from_number": call.get("from_number"),
-            "to_number": call.get("to_number"),
-            "start_timestamp": call.get("start_timestamp"),
-            "end_timestamp": call.get("end_timestamp"),
-            "duration_ms": (call.get("end_timestamp", 0) - call.get("start_timestamp", 0))
-            if call.get("end_timestamp") else None,
-            "disconnection_reason": call.get("disconnection_reason"),
-        }
-        for call in data
-    ]
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-async def get_call(call_id: str) -> str:
-    """Get details of a specific call."""
-    c = _get_client()
-    data = await c.get(f"/get-call/{call_id}")
-    return json.dumps(data, indent=2)
-
-
-@mcp.tool()
-async def get_call_transcript(call_id: str) -> str:
-    """Get the transcript of a call."""
-    c = _get_client()
-    call_data = await c.get(f"/get-call/{call_id}")
-    return json.dumps({
-        "call_id": call_id,
-        "transcript": call_data.get("transcript", ""),
-        "call_analysis": call_data.get("call_analysis"),
-        "duration_ms": (call_data.get("end_timestamp", 0) - call_data.get("start_timestamp", 0))
-        if call_data.get("end_timestamp") else None,
-    }, indent=2)
+    """Download call recordings to the local cache and return their file paths.
+
+    Downloads run concurrently and resume where an interrupted download
+    stopped; recordings already in the cache (RETELL_RECORDINGS_DIR) are
+    returned without a request. Each result has the local path or an error.
+    """
+    data = await adownload_recordings(
+        _get_client(), call_ids, concurrency=concurrency, archive=_get_archive(),
+    )
+    return shape(data, fields, compact, max_bytes, tool="download_recordings")
 
 
 # --- Phone Numbers ---
 
-@mcp.tool()
-async def list_phone_numbers() -> str:
-    """List all registered phone numbers."""
-    c = _get_client()
-    data = await c.get("/list-phone-numbers")
-    if not isinstance(data, list):
-        data = [data]
-    result = [
-        {
-            "phone_number": n.get("phone_number"),
-            "phone_number_pretty": n.get("phone_number_pretty"),
-            "inbound_agent_id": n.get("inbound_agent_id"),
-            "area_code": n.get("area_code"),
-            "nickname": n.get("nickname"),
-        }
-        for n in data
-    ]
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
+@_tool
+async def list_phone_numbers(
+    bypass_cache: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """List all registered phone numbers. Set bypass_cache to force a fresh read."""
+    data = await phones.alist_phone_numbers(_get_client(), bypass_cache=bypass_cache)
+    return shape(data, fields, compact, max_bytes, tool="list_phone_numbers")
+
+
+@_tool
 async def update_phone_number(
     phone_number: str,
     inbound_agent_id: Optional[str] = None,
     nickname: Optional[str] = None,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
 ) -> str:
     """Update a phone number configuration."""
-    c = _get_client()
-    payload: dict = {}
-    if inbound_agent_id:
-        payload["inbound_agent_id"] = inbound_agent_id
-    if nickname:
-        payload["nickname"] = nickname
-
-    data = await c.patch(f"/update-phone-number/{phone_number}", json=payload)
-    return json.dumps(data, indent=2)
+    data = await phones.aupdate_phone_number(
+        _get_client(), phone_number, inbound_agent_id=inbound_agent_id, nickname=nickname,
+    )
+    return shape(data, fields, compact, max_bytes, tool="update_phone_number")
 
 
 # --- Voices ---
 
-@mcp.tool()
-async def list_voices() -> str:
-    """List available voices from Retell's voice library."""
-    c = _get_client()
-    data = await c.get("/list-voices")
-    if not isinstance(data, list):
-        data = [data]
-    result = [
-        {
-            "voice_id": v.get("voice_id"),
-            "voice_name": v.get("voice_name"),
-            "provider": v.get("provider"),
-            "gender": v.get("gender"),
-            "accent": v.get("accent"),
-        }
-        for v in data
-    ]
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
-async def get_voice(voice_id: str) -> str:
-    """Get details of a specific voice."""
-    c = _get_client()
-    data = await c.get(f"/get-voice/{voice_id}")
-    return json.dumps(data, indent=2)
+@_tool
+async def list_voices(
+    bypass_cache: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """List available voices from Retell's voice library. Set bypass_cache to force a fresh read."""
+    data = await voices.alist_voices(_get_client(), bypass_cache=bypass_cache)
+    return shape(data, fields, compact, max_bytes, tool="list_voices")
+
+
+@_tool
+async def get_voice(
+    voice_id: str,
+    bypass_cache: bool = False,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Get details of a specific voice. Set bypass_cache to force a fresh read."""
+    data = await voices.aget_voice(_get_client(), voice_id, bypass_cache=bypass_cache)
+    return shape(data, fields, compact, max_bytes, tool="get_voice")
+
+
+# --- Batching ---
+
+_BATCH_TOOLS = {
+    fn.__name__: fn
+    for fn in (
+        list_agents, get_agent, get_agents_many, create_agent, update_agent, delete_agent,
+        create_phone_call, bulk_create_phone_calls, wait_for_calls, list_calls, get_call,
+        get_calls_many, sync_call_archive, get_call_transcript, search_transcripts, analyze_calls,
+        download_recordings, list_phone_numbers, update_phone_number, list_voices, get_voice,
+    )
+}
+
+
+@_tool
+async def batch(
+    operations: list[dict],
+    concurrency: int = 8,
+    fields: Fields = None,
+    compact: Compact = None,
+    max_bytes: MaxBytes = None,
+) -> str:
+    """Run several of the other tools in one call and return all results.
+
+    operations is a list of {"tool": name, "args": {...}} objects, each with an
+    optional non-numeric "id". Entries run concurrently. An argument written as
+    "$<id or index>.<path>" takes its value from an earlier entry's result,
+    e.g. {"tool": "get_agents_many", "args": {"agent_ids": "$0.*.agent_id"}}
+    after a list_agents entry; the entry then waits for the one it references.
+    Each result is {"id", "tool", "result"} or {"id", "tool", "error"}.
+    """
+    data = await run_batch(operations, _BATCH_TOOLS, concurrency=concurrency)
+    return shape(data, fields, compact, max_bytes, tool="batch")
 
 
 def main():
@@ -0,0 +1,255 @@
+"""Response shaping shared by the MCP server and LangChain tools.
+
+Every tool result passes through :func:`shape`, which can
+
+* project the payload onto a set of ``fields`` (dotted paths reach into
+  nested objects; lists are projected element by element),
+* encode it compactly instead of pretty-printed, and
+* cap its size, trimming list items, or the largest lists and strings
+  inside an object, and leaving an explicit truncation marker. The result
+  is always valid JSON.
+
+``orjson`` is used for encoding when installed (``pip install
+'mcp-retell[fast]'``), with the standard library as fallback. Bytes before and
+after shaping are tallied per tool in :data:`stats`.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, Optional
+
+from .config import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is missing
+    orjson = None
+
+TRUNCATED_KEY = "_truncated"
+
+
+def parse_fields(fields: Optional[str | list[str]]) -> Optional[list[str]]:
+    """Normalise a comma-separated string or list of field paths."""
+    if fields is None:
+        return None
+    items = fields.split(",") if isinstance(fields, str) else fields
+    paths = [item.strip() for item in items if item and item.strip()]
+    return paths or None
+
+
+def _field_tree(paths: list[str]) -> dict:
+    tree: dict = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is None:  # a shorter path already selects the whole subtree
+                break
+            node = child
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def _apply(tree: dict, data: Any) -> Any:
+    if isinstance(data, list):
+        return [_apply(tree, item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {
+        key: data[key] if sub is None else _apply(sub, data[key])
+        for key, sub in tree.items()
+        if key in data
+    }
+
+
+def project(data: Any, fields: Optional[str | list[str]]) -> Any:
+    """Keep only ``fields`` of ``data``; a top-level list is projected per item."""
+    paths = parse_fields(fields)
+    return data if paths is None else _apply(_field_tree(paths), data)
+
+
+def dumps(data: Any, compact: bool = False) -> str:
+    """Encode as JSON text, pretty (2-space indent) unless ``compact``."""
+    if orjson is not None:
+        try:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option).decode()
+        except TypeError:
+            pass  # e.g. non-string keys or oversized ints; let json handle them
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _size(data: Any) -> int:
+    return len(dumps(data, compact=True).encode())
+
+
+def _trim_target(data: Any, path: tuple = ()) -> Optional[tuple[int, tuple]]:
+    """``(size, path)`` of the value to trim next: the largest string, or list
+    not dominated by one of its items, reachable from ``data``."""
+    if isinstance(data, str):
+        return (_size(data), path) if data else None
+    if isinstance(data, dict):
+        children = data.items()
+    elif isinstance(data, list):
+        children = enumerate(data)
+    else:
+        return None
+    best = None
+    for key, value in children:
+        found = _trim_target(value, (*path, key))
+        if found is not None and (best is None or found[0] > best[0]):
+            best = found
+    if isinstance(data, list) and data:
+        size = _size(data)
+        if best is None or best[0] * 2 < size:
+            return size, path
+    return best
+
+
+def _longest_fit(length: int, fits: Callable[[int], bool]) -> int:
+    """Largest ``n`` in ``[0, length)`` with ``fits(n)``, or ``0``."""
+    lo, hi, best = 0, length - 1, 0
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if fits(mid):
+            best, lo = mid, mid + 1
+        else:
+            hi = mid - 1
+    return best
+
+
+def _truncate_dict(data: dict, compact: bool, max_bytes: int) -> Optional[str]:
+    """Trim the largest strings and lists inside ``data`` until it fits,
+    recording what was cut under ``TRUNCATED_KEY``; ``None`` if it cannot."""
+    data = copy.deepcopy(data)
+    omitted: dict[str, dict] = {}
+    data[TRUNCATED_KEY] = omitted
+
+    def encoded() -> str:
+        return dumps(data, compact)
+
+    text = encoded()
+    while len(text.encode()) > max_bytes:
+        target = _trim_target({k: v for k, v in data.items() if k != TRUNCATED_KEY})
+        if target is None:
+            return None
+        *parents, last = target[1]
+        container = data
+        for key in parents:
+            container = container[key]
+        value = container[last]
+        label = ".".join(str(key) for key in target[1])
+        unit = "omitted_chars" if isinstance(value, str) else "omitted_items"
+
+        def fits(n: int) -> bool:
+            container[last] = value[:n]
+            omitted[label] = {unit: len(value) - n}
+            return len(encoded().encode()) <= max_bytes
+
+        keep = _longest_fit(len(value), fits)
+        container[last] = value[:keep]
+        omitted[label] = {unit: len(value) - keep}
+        text = encoded()
+    return text
+
+
+def _truncate(data: Any, text: str, compact: bool, max_bytes: int) -> str:
+    """Cut ``data`` to ``max_bytes`` of JSON that still parses, with a marker."""
+    if isinstance(data, list) and data:
+        # Binary search for the longest prefix of items that fits with a marker.
+        lo, hi = 0, len(data)
+        best = None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            candidate = dumps(data[:mid] + [{TRUNCATED_KEY: {"omitted_items": len(data) - mid}}], compact)
+            if len(candidate.encode()) <= max_bytes:
+                best, lo = candidate, mid + 1
+            else:
+                hi = mid - 1
+        if best is not None:
+            return best
+    elif isinstance(data, dict):
+        trimmed = _truncate_dict(data, compact, max_bytes)
+        if trimmed is not None:
+            return trimmed
+    return dumps({TRUNCATED_KEY: {"omitted_bytes": len(text.encode())}}, compact)
+
+
+class ShapingStats:
+    """Per-tool totals of unshaped vs. shaped response bytes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"calls": 0, "raw_bytes": 0, "shaped_bytes": 0}
+        )
+
+    def record(self, tool: str, raw_bytes: int, shaped_bytes: int) -> None:
+        with self._lock:
+            entry = self._tools[tool]
+            entry["calls"] += 1
+            entry["raw_bytes"] += raw_bytes
+            entry["shaped_bytes"] += shaped_bytes
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                tool: {
+                    **entry,
+                    "saved_pct": round(100 * (1 - entry["shaped_bytes"] / entry["raw_bytes"]), 1)
+                    if entry["raw_bytes"] else 0.0,
+                }
+                for tool, entry in self._tools.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+
+stats = ShapingStats()
+
+
+@lru_cache(maxsize=1)
+def _defaults() -> tuple[bool, int]:
+    settings = get_settings()
+    return settings.response_compact, settings.response_max_bytes
+
+
+def shape(
+    data: Any,
+    fields: Optional[str | list[str]] = None,
+    compact: Optional[bool] = None,
+    max_bytes: Optional[int] = None,
+    tool: Optional[str] = None,
+) -> str:
+    """Project, encode and size-cap a tool result.
+
+    ``compact`` and ``max_bytes`` default to ``RETELL_RESPONSE_COMPACT`` and
+    ``RETELL_RESPONSE_MAX_BYTES``. With ``tool`` set, the size of the unshaped pretty-printed payload and of
+    the returned text are recorded in :data:`stats`.
+    """
+    default_compact, default_max_bytes = _defaults()
+    compact = default_compact if compact is None else compact
+    max_bytes = default_max_bytes if max_bytes is None else max_bytes
+    shaped = project(data, fields)
+    text = dumps(shaped, compact)
+    full_bytes = len(text.encode())
+    if max_bytes and full_bytes > max_bytes:
+        text = _truncate(shaped, text, compact, max_bytes)
+    if tool is not None:
+        # Only re-encode for the baseline when shaping changed the payload.
+        unshaped = shaped is data and not compact
+        raw_bytes = full_bytes if unshaped else len(dumps(data).encode())
+        stats.record(tool, raw_bytes, len(text.encode()))
+    return text
@@ -0,0 +1,108 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same key while a request for it is already
+running, they wait for that request instead of starting their own. Nothing is
+kept once the request finishes — this is deduplication, not caching.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key, for both asyncio and threads.
+
+    Followers receive a deep copy of the leader's result so no two callers
+    share a mutable response object.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless an identical call is in flight on this event loop.
+
+        The shared request runs in its own task, so cancelling any one waiter
+        (including the caller that started it) does not cancel it for others.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        task = self._tasks.get(flight_key)
+        leader = task is None
+        if leader:
+            task = loop.create_task(fn())
+            self._tasks[flight_key] = task
+            task.add_done_callback(lambda t: self._finish(flight_key, t))
+        self._count(leader)
+        result = await asyncio.shield(task)
+        return result if leader else copy.deepcopy(result)
+
+    def _finish(self, flight_key: tuple, task: asyncio.Task) -> None:
+        self._tasks.pop(flight_key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter was cancelled
+
+    def do_sync(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless an identical call is in flight on another thread."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        self._count(leader)
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a call for ``key`` is running on any thread or event loop."""
+        with self._lock:
+            return key in self._calls or any(k == key for _, k in list(self._tasks))
+
+    def _count(self, leader: bool) -> None:
+        with self._lock:
+            if leader:
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "upstream": self.leaders,
+                "coalesced": self.followers,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
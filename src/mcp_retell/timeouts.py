@@ -0,0 +1,123 @@
+"""Per-endpoint request timeouts and deadline budgets.
+
+:class:`TimeoutPolicy` maps each request to an ``httpx.Timeout``: the
+connect/read/write/pool defaults from settings, with the read timeout
+overridden for endpoints matching a prefix in ``timeout_read_overrides``
+(e.g. a longer one for large ``/list-calls`` pages).
+
+:func:`deadline` sets an overall budget for everything run inside it. The
+budget lives in a context variable, so it follows ``await`` chains and the
+tasks they spawn; nested deadlines can only shorten it. Every request made
+while a deadline is active gets its timeouts clamped to the time left, is
+not retried past it, and fails with :class:`DeadlineExceeded` once it has
+passed.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+
+from mcp_retell.config import Settings
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("retell_deadline", default=None)
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """The active deadline passed before the request could be sent."""
+
+    def __init__(self, message: str = "deadline exceeded") -> None:
+        super().__init__(message)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bound every request made inside the block to ``seconds`` from now.
+
+    ``None`` or ``0`` leaves the current deadline (if any) unchanged.
+    """
+    if not seconds:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the active deadline, or ``None`` without one."""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def check() -> None:
+    """Raise :class:`DeadlineExceeded` if the active deadline has passed."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded()
+
+
+def clamp(timeout: httpx.Timeout) -> httpx.Timeout:
+    """``timeout`` with every phase capped at the time left on the deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded()
+
+    def cap(value: float | None) -> float:
+        return left if value is None else min(value, left)
+
+    return httpx.Timeout(
+        connect=cap(timeout.connect), read=cap(timeout.read),
+        write=cap(timeout.write), pool=cap(timeout.pool),
+    )
+
+
+class TimeoutPolicy:
+    """Request timeouts, with read-timeout overrides by endpoint prefix."""
+
+    def __init__(
+        self,
+        default: httpx.Timeout,
+        read_overrides: dict[str, float] | None = None,
+    ) -> None:
+        self.default = default
+        # Longest prefix first, so "/list-calls" wins over "/list-".
+        self.read_overrides = sorted((read_overrides or {}).items(), key=lambda item: -len(item[0]))
+        self._timeouts: dict[str, httpx.Timeout] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TimeoutPolicy:
+        return cls(
+            httpx.Timeout(
+                connect=settings.timeout_connect, read=settings.timeout_read,
+                write=settings.timeout_write, pool=settings.timeout_pool,
+            ),
+            read_overrides=settings.timeout_read_overrides,
+        )
+
+    def for_endpoint(self, endpoint: str) -> httpx.Timeout:
+        """The configured timeout for ``endpoint``, ignoring any deadline."""
+        for prefix, read in self.read_overrides:
+            if endpoint.startswith(prefix):
+                timeout = self._timeouts.get(prefix)
+                if timeout is None:
+                    timeout = self._timeouts[prefix] = httpx.Timeout(
+                        connect=self.default.connect, read=read,
+                        write=self.default.write, pool=self.default.pool,
+                    )
+                return timeout
+        return self.default
+
+    def for_request(self, endpoint: str) -> httpx.Timeout:
+        """The timeout to send a request to ``endpoint`` with, clamped to the deadline."""
+        return clamp(self.for_endpoint(endpoint))
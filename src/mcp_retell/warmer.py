@@ -0,0 +1,108 @@
+"""Background warm-up of catalog reads (agents, voices, phone numbers).
+
+:class:`CatalogWarmer` fetches the catalog lists concurrently when the server
+starts and then refreshes each one before its response-cache entry expires,
+so ``list_agents``/``list_voices``/``list_phone_numbers`` are answered from
+memory instead of going to Retell on the critical path.
+
+Refreshes bypass the cache but go through the client's single-flight, so a
+read that arrives while a refresh is in flight is served from the cached
+copy, even if that has just expired, instead of waiting or sending its own
+request. A failed refresh keeps the previous copy until its TTL runs out and
+is retried on the next cycle.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from .cache import AGENTS, PHONE_NUMBERS, VOICES
+from .client import RetellClient
+from .operations.batch import describe_error
+
+CATALOGS = {
+    AGENTS: "/list-agents",
+    VOICES: "/list-voices",
+    PHONE_NUMBERS: "/list-phone-numbers",
+}
+
+# Refresh once this fraction of a resource's TTL has passed.
+REFRESH_FRACTION = 0.8
+
+
+class CatalogWarmer:
+    """Keep the catalog lists in the client's response cache warm."""
+
+    def __init__(self, client: RetellClient, interval: Optional[float] = None) -> None:
+        """``interval`` shortens the per-resource refresh period, which is
+        ``REFRESH_FRACTION`` of each resource's cache TTL; a longer one is
+        capped so entries never expire between refreshes. Resources whose
+        cache is disabled are not warmed.
+        """
+        self.client = client
+        ttls = client.cache.ttls
+        self.intervals = {
+            resource: min(interval or ttls[resource], ttls[resource] * REFRESH_FRACTION)
+            for resource in CATALOGS
+            if resource in ttls
+        }
+        self.refreshes = {resource: 0 for resource in self.intervals}
+        self.errors: dict[str, str] = {}
+        self.last_refresh: dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self, resource: str) -> bool:
+        """Refetch one catalog into the cache; ``False`` if the request failed."""
+        try:
+            await self.client.get(CATALOGS[resource], bypass_cache=True)
+        except (httpx.HTTPError, ValueError) as exc:
+            self.errors[resource] = describe_error(exc)
+            return False
+        self.errors.pop(resource, None)
+        self.refreshes[resource] += 1
+        self.last_refresh[resource] = time.time()
+        return True
+
+    async def warm(self) -> dict[str, bool]:
+        """Refresh every catalog concurrently; returns which succeeded."""
+        resources = list(self.intervals)
+        results = await asyncio.gather(*(self.refresh(resource) for resource in resources))
+        return dict(zip(resources, results))
+
+    async def _keep_warm(self, resource: str) -> None:
+        while True:
+            await asyncio.sleep(self.intervals[resource])
+            await self.refresh(resource)
+
+    async def run(self) -> None:
+        """Warm every catalog, then keep refreshing each on its own interval."""
+        await self.warm()
+        await asyncio.gather(*(self._keep_warm(resource) for resource in self.intervals))
+
+    def start(self) -> asyncio.Task:
+        """Run :meth:`run` in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "intervals_s": self.intervals,
+            "refreshes": self.refreshes,
+            "last_refresh": self.last_refresh,
+            "errors": self.errors,
+        }
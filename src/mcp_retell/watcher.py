@@ -0,0 +1,274 @@
+"""Call-completion watcher — many calls, one loop, adaptive polling.
+
+:class:`CallWatcher` tracks any number of call IDs and polls ``/get-call``
+only for calls that are due. Each call starts on a short interval that backs
+off geometrically while it stays live. Once enough calls have finished to
+estimate typical durations, a live call's next poll is pulled forward to the
+next duration percentile it has not yet passed, so polling is fast exactly
+when the call is likely to end. :func:`wait_for_calls_async` seeds that
+estimate from recent ended calls (the archive if given, else one
+``/list-calls`` page); a bare :class:`CallWatcher` only learns it from the calls it watches
+unless given ``durations``. Requests still go through the client's rate
+limiter, and at most ``concurrency`` are in flight at once.
+
+Calls are yielded as soon as they reach a terminal status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Optional
+
+import httpx
+
+from .analytics import DurationHistogram
+from .client import RetellClient
+from .operations.batch import describe_error
+from .operations.calls import aget_call, alist_calls, is_terminal
+from .timeouts import remaining
+
+if TYPE_CHECKING:
+    from .archive import CallArchive
+
+# Duration percentiles a live call is polled at as it passes each one.
+EXPECTED_END_PERCENTILES = (25, 50, 75, 90, 99)
+MIN_DURATION_SAMPLES = 5
+DURATION_SEED_CALLS = 100
+MAX_ERRORS = 5
+
+
+class _Watch:
+    __slots__ = ("call_id", "interval", "polls", "errors")
+
+    def __init__(self, call_id: str, interval: float) -> None:
+        self.call_id = call_id
+        self.interval = interval
+        self.polls = 0
+        self.errors = 0
+
+
+class CallWatcher:
+    """Poll many calls until each reaches a terminal status.
+
+    ``durations`` seeds the end-time estimate (e.g. from
+    :func:`recent_durations`); durations of calls that finish while watching
+    are added to it. Without it, polling only adapts once
+    ``MIN_DURATION_SAMPLES`` watched calls have finished.
+    """
+
+    def __init__(
+        self,
+        client: RetellClient,
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        concurrency: int = 8,
+        durations: Optional[DurationHistogram] = None,
+        archive: Optional[CallArchive] = None,
+    ) -> None:
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.concurrency = max(1, concurrency)
+        self.durations = durations or DurationHistogram()
+        self.archive = archive
+        self.requests = 0
+        self.finished = 0
+        self.failed: dict[str, str] = {}
+        self._watches: dict[str, _Watch] = {}
+        self._due: list[tuple[float, int, str]] = []  # (when, tiebreak, call_id)
+        self._order = itertools.count()
+        self._added = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    @property
+    def pending(self) -> list[str]:
+        return list(self._watches)
+
+    def add(self, call_ids: Iterable[str]) -> None:
+        """Start watching ``call_ids``; each is first polled right away."""
+        now = time.monotonic()
+        for call_id in call_ids:
+            if call_id not in self._watches:
+                self._watches[call_id] = _Watch(call_id, self.min_interval)
+                heapq.heappush(self._due, (now, next(self._order), call_id))
+        self._added.set()
+
+    def _schedule(self, watch: _Watch, delay: float) -> None:
+        heapq.heappush(self._due, (time.monotonic() + delay, next(self._order), watch.call_id))
+
+    def next_interval(self, watch: _Watch, call: Optional[dict]) -> float:
+        """Seconds until ``watch`` is next polled, given its latest state."""
+        interval = watch.interval
+        watch.interval = min(self.max_interval, watch.interval * self.backoff)
+        start = (call or {}).get("start_timestamp")
+        if not start or self.durations.count < MIN_DURATION_SAMPLES:
+            return interval
+        elapsed = time.time() * 1000 - start
+        for q in EXPECTED_END_PERCENTILES:
+            expected = self.durations.percentile(q)
+            if expected > elapsed:
+                # Poll just after the next typical end time if it comes first.
+                return max(self.min_interval, min(interval, (expected - elapsed) / 1000))
+        return interval
+
+    async def _poll(self, call_id: str) -> tuple[str, Optional[dict], Optional[Exception]]:
+        self.requests += 1
+        try:
+            return call_id, await aget_call(self.client, call_id, archive=self.archive, refresh=True), None
+        except (httpx.HTTPError, ValueError) as exc:
+            # e.g. a body that is not valid JSON; retried like a network error.
+            return call_id, None, exc
+
+    def _handle(self, call_id: str, call: Optional[dict], exc: Optional[Exception]) -> Optional[dict]:
+        watch = self._watches[call_id]
+        watch.polls += 1
+        if exc is not None:
+            watch.errors += 1
+            status = exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
+            if status == 404 or watch.errors >= MAX_ERRORS:
+                del self._watches[call_id]
+                self.failed[call_id] = describe_error(exc)
+            else:
+                self._schedule(watch, self.next_interval(watch, None))
+            return None
+        watch.errors = 0
+        if not is_terminal(call):
+            self._schedule(watch, self.next_interval(watch, call))
+            return None
+        del self._watches[call_id]
+        self.finished += 1
+        start, end = call.get("start_timestamp"), call.get("end_timestamp")
+        if start and end:
+            self.durations.add(end - start)
+        return call
+
+    def _take_due(self) -> list[str]:
+        now, due = time.monotonic(), []
+        while self._due and self._due[0][0] <= now and len(due) < self.concurrency:
+            _, _, call_id = heapq.heappop(self._due)
+            if call_id in self._watches:
+                due.append(call_id)
+        return due
+
+    async def _sleep_until_due(self, stop_at: Optional[float]) -> None:
+        self._added.clear()
+        wake = self._due[0][0] if self._due else None
+        if stop_at is not None:
+            wake = stop_at if wake is None else min(wake, stop_at)
+        timeout = None if wake is None else max(0.0, wake - time.monotonic())
+        try:
+            await asyncio.wait_for(self._added.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def watch(self, timeout: Optional[float] = None) -> AsyncIterator[dict]:
+        """Yield each watched call once it is terminal, until none are left.
+
+        Stops early after ``timeout`` seconds (and before an active
+        deadline); calls still live then remain in :attr:`pending`.
+        """
+        left = remaining()
+        if left is not None:
+            timeout = left if timeout is None else min(timeout, left)
+        stop_at = None if timeout is None else time.monotonic() + timeout
+        while self._watches:
+            if stop_at is not None and time.monotonic() >= stop_at:
+                return
+            due = self._take_due()
+            if not due:
+                await self._sleep_until_due(stop_at)
+                continue
+            for done in asyncio.as_completed([self._poll(call_id) for call_id in due]):
+                call = self._handle(*await done)
+                if call is not None:
+                    yield call
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "finished": self.finished,
+            "failed": len(self.failed),
+            "pending": len(self._watches),
+            "requests_per_finished_call": (
+                round(self.requests / self.finished, 2) if self.finished else None
+            ),
+        }
+
+
+def call_outcome(call: dict) -> dict:
+    """The fields of a finished call that say how it ended."""
+    start, end = call.get("start_timestamp"), call.get("end_timestamp")
+    return {
+        "call_id": call.get("call_id"),
+        "call_status": call.get("call_status"),
+        "disconnection_reason": call.get("disconnection_reason"),
+        "start_timestamp": start,
+        "end_timestamp": end,
+        "duration_ms": end - start if start and end else None,
+    }
+
+
+async def recent_durations(
+    client: RetellClient,
+    archive: Optional[CallArchive] = None,
+    limit: int = DURATION_SEED_CALLS,
+) -> DurationHistogram:
+    """Durations of up to ``limit`` recently ended calls, to seed a watcher.
+
+    Read from ``archive`` when given, otherwise from one ``/list-calls``
+    page. Best effort: a failed read yields an empty histogram.
+    """
+    durations = DurationHistogram()
+    try:
+        recent = await alist_calls(client, limit=limit, archive=archive)
+    except (httpx.HTTPError, ValueError):
+        return durations
+    for call in recent:
+        start, end = call.get("start_timestamp"), call.get("end_timestamp")
+        if call.get("call_status") == "ended" and start and end:
+            durations.add(end - start)
+    return durations
+
+
+async def wait_for_calls_async(
+    client: RetellClient,
+    call_ids: list[str],
+    timeout: Optional[float] = 300.0,
+    min_interval: float = 2.0,
+    max_interval: float = 30.0,
+    concurrency: int = 8,
+    archive: Optional[CallArchive] = None,
+) -> dict:
+    """Wait until ``call_ids`` finish or ``timeout`` seconds pass (async).
+
+    Returns ``{"results", "pending", "failed", "summary"}``: the outcome of
+    each finished call in the order it finished, the IDs still live at the
+    timeout, per-call poll errors and request counts. Polling adapts to the
+    durations of recent calls (see :func:`recent_durations`).
+    """
+    started = time.monotonic()
+    watcher = CallWatcher(
+        client, min_interval=min_interval, max_interval=max_interval,
+        concurrency=concurrency, durations=await recent_durations(client, archive), archive=archive,
+    )
+    watcher.add(call_ids)
+    results = [call_outcome(call) async for call in watcher.watch(timeout)]
+    return {
+        "results": results,
+        "pending": watcher.pending,
+        "failed": watcher.failed,
+        "summary": {**watcher.stats(), "elapsed_s": round(time.monotonic() - started, 3)},
+    }
+
+
+def wait_for_calls(client: RetellClient, call_ids: list[str], **kwargs) -> dict:
+    """Wait until ``call_ids`` finish or ``timeout`` seconds pass (sync). See ``wait_for_calls_async``."""
+    return client.run(wait_for_calls_async(client, call_ids, **kwargs))
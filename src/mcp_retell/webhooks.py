@@ -0,0 +1,249 @@
+"""Webhook receiver for Retell call events.
+
+:class:`WebhookReceiver` is a small ASGI app that accepts Retell's
+``call_started``, ``call_ended`` and ``call_analyzed`` events, checks their
+``x-retell-signature``, and hands them to a bounded queue. A single worker
+drains the queue in batches and merges each event's call into the local
+:class:`~mcp_retell.archive.CallArchive`, so ``list_calls``/``get_call``
+with ``from_archive`` see new and finished calls without polling Retell.
+
+When the queue is full the receiver answers ``503`` with ``Retry-After``,
+and Retell redelivers the event later, so a burst is absorbed without
+unbounded memory. Events can be replayed offline by calling
+:meth:`WebhookReceiver.ingest` directly, or by posting bodies signed with
+:func:`sign`.
+
+Run it with ``mcp-retell webhooks``, or beside the MCP server by setting
+``RETELL_WEBHOOK_PORT`` (both need ``uvicorn``, which ``mcp[cli]`` installs).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import re
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from .config import Settings
+
+if TYPE_CHECKING:
+    from .archive import CallArchive
+
+EVENTS = frozenset({"call_started", "call_ended", "call_analyzed"})
+SIGNATURE_HEADER = b"x-retell-signature"
+SIGNATURE_TOLERANCE_MS = 5 * 60 * 1000
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+_SIGNATURE = re.compile(r"v=(\d+),d=([0-9a-fA-F]+)")
+
+
+def sign(body: bytes, secret: str, timestamp_ms: Optional[int] = None) -> str:
+    """The ``x-retell-signature`` value Retell would send for ``body``."""
+    timestamp_ms = int(time.time() * 1000) if timestamp_ms is None else timestamp_ms
+    digest = hmac.new(secret.encode(), body + str(timestamp_ms).encode(), hashlib.sha256).hexdigest()
+    return f"v={timestamp_ms},d={digest}"
+
+
+def verify_signature(
+    body: bytes,
+    signature: Optional[str],
+    secret: str,
+    now_ms: Optional[int] = None,
+    tolerance_ms: int = SIGNATURE_TOLERANCE_MS,
+) -> bool:
+    """Whether ``signature`` is a fresh ``v=<ms>,d=<hex hmac>`` over ``body``."""
+    match = _SIGNATURE.fullmatch(signature or "")
+    if match is None:
+        return False
+    timestamp = int(match.group(1))
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    if abs(now_ms - timestamp) > tolerance_ms:
+        return False
+    return hmac.compare_digest(sign(body, secret, timestamp), match.group(0).lower())
+
+
+class WebhookReceiver:
+    """ASGI app that queues signed call events and writes them to an archive."""
+
+    def __init__(
+        self,
+        archive: CallArchive,
+        secret: str,
+        queue_size: int = 1000,
+        batch_size: int = 100,
+        path: str = "/webhook",
+    ) -> None:
+        self.archive = archive
+        self.secret = secret
+        self.batch_size = max(1, batch_size)
+        self.path = path
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max(1, queue_size))
+        self.counters = {
+            "received": 0, "accepted": 0, "ignored": 0, "bad_signature": 0,
+            "bad_request": 0, "queue_full": 0, "written": 0, "batches": 0, "write_errors": 0,
+        }
+        self._worker: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(cls, archive: CallArchive, settings: Settings) -> WebhookReceiver:
+        return cls(
+            archive, settings.webhook_secret or settings.api_key,
+            queue_size=settings.webhook_queue_size,
+        )
+
+    # --- Queue and worker ---
+
+    def ingest(self, event: dict) -> bool:
+        """Queue a parsed event; ``False`` if the queue is full.
+
+        Events of other types, or without a ``call.call_id``, are dropped
+        (and count as ``ignored``).
+        """
+        call = event.get("call")
+        if event.get("event") not in EVENTS or not isinstance(call, dict) or not call.get("call_id"):
+            self.counters["ignored"] += 1
+            return True
+        self.start()
+        try:
+            self.queue.put_nowait(call)
+        except asyncio.QueueFull:
+            self.counters["queue_full"] += 1
+            return False
+        self.counters["accepted"] += 1
+        return True
+
+    def start(self) -> None:
+        """Start the archive writer if it is not running."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while True:
+            calls = [await self.queue.get()]
+            while len(calls) < self.batch_size:
+                try:
+                    calls.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                # SQLite writes; keep them off the event loop.
+                self.counters["written"] += await asyncio.to_thread(self.archive.merge_calls, calls)
+                self.counters["batches"] += 1
+            except Exception:  # noqa: BLE001 - already acknowledged; keep draining
+                self.counters["write_errors"] += len(calls)
+            finally:
+                for _ in calls:
+                    self.queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written."""
+        await self.queue.join()
+
+    async def stop(self) -> None:
+        """Write what is queued, then stop the worker."""
+        if self._worker is None:
+            return
+        await self.flush()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def stats(self) -> dict:
+        return {**self.counters, "queued": self.queue.qsize(), "queue_size": self.queue.maxsize}
+
+    # --- ASGI ---
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            status, body, headers = await self._handle(scope, receive)
+            await send({
+                "type": "http.response.start", "status": status,
+                "headers": [(b"content-type", b"application/json"), *headers],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Any, send: Any) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, scope: dict, receive: Any) -> tuple[int, bytes, list]:
+        if scope["path"] != self.path:
+            return 404, b'{"error": "not found"}', []
+        if scope["method"] == "GET":
+            return 200, json.dumps(self.stats()).encode(), []
+        if scope["method"] != "POST":
+            return 405, b'{"error": "method not allowed"}', [(b"allow", b"GET, POST")]
+        self.counters["received"] += 1
+        body = await _read_body(receive)
+        if body is None:
+            self.counters["bad_request"] += 1
+            return 413, b'{"error": "body too large"}', []
+        signature = dict(scope["headers"]).get(SIGNATURE_HEADER, b"").decode("latin-1")
+        if not verify_signature(body, signature, self.secret):
+            self.counters["bad_signature"] += 1
+            return 401, b'{"error": "invalid signature"}', []
+        try:
+            event = json.loads(body)
+        except ValueError:
+            event = None
+        if not isinstance(event, dict):
+            self.counters["bad_request"] += 1
+            return 400, b'{"error": "invalid JSON"}', []
+        if not self.ingest(event):
+            return 503, b'{"error": "queue full"}', [(b"retry-after", b"1")]
+        return 204, b"", []
+
+
+async def _read_body(receive: Any) -> Optional[bytes]:
+    """The request body, or ``None`` once it exceeds ``MAX_BODY_BYTES``."""
+    chunks, size, more = [], 0, True
+    while more:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        more = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def webhook_server(
+    receiver: WebhookReceiver,
+    host: str = "127.0.0.1",
+    port: int = 8787,
+    handle_signals: bool = True,
+) -> Any:
+    """A ``uvicorn.Server`` for ``receiver``.
+
+    Use ``server.run()`` to serve in the foreground, or ``await
+    server.serve()`` in a task beside another app (with
+    ``handle_signals=False``, leaving signals to that app) and set
+    ``server.should_exit`` to stop it.
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        raise ImportError(
+            "The webhook server needs uvicorn (pip install 'mcp-retell[mcp]').",
+        ) from None
+    server = uvicorn.Server(uvicorn.Config(receiver, host=host, port=port, log_level="warning"))
+    if not handle_signals:
+        server.capture_signals = contextlib.nullcontext  # type: ignore[method-assign]
+    return server
@@ -0,0 +1,88 @@
+"""Tests for streaming call analytics."""
+
+import random
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell.analytics import (
+    HOUR_MS, OTHER, CallAnalytics, DurationHistogram, aanalyze_calls, analyze_calls,
+)
+from mcp_retell.archive import CallArchive
+from mcp_retell.client import RetellClient
+
+BASE = "https://api.retellai.com"
+T0 = 1_700_000_000_000 - 1_700_000_000_000 % HOUR_MS
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE)
+
+
+def _call(n, agent_id="ag1", duration=60_000, **extra):
+    start = T0 + n * 600_000  # one call every 10 minutes
+    return {
+        "call_id": f"call{n}", "agent_id": agent_id, "call_status": "ended",
+        "from_number": "+1000", "to_number": f"+2{n:03d}", "direction": "outbound",
+        "start_timestamp": start, "end_timestamp": start + duration,
+        "disconnection_reason": "user_hangup", **extra,
+    }
+
+
+def test_histogram_percentiles_within_one_percent():
+    rng = random.Random(7)
+    values = [rng.randint(1_000, 600_000) for _ in range(5_000)]
+    histogram = DurationHistogram()
+    for v in values:
+        histogram.add(v)
+    ordered = sorted(values)
+    for q in (50, 90, 99):
+        exact = ordered[int(len(ordered) * q / 100) - 1]
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.011)
+    assert histogram.summary()["min"] == min(values)
+    assert len(histogram.buckets) < 700
+
+
+def test_rollups_are_columnar_and_bounded():
+    analytics = CallAnalytics(max_groups=2)
+    analytics.add_many([
+        _call(0, agent_id="ag1", duration=30_000),
+        _call(1, agent_id="ag1", duration=90_000),
+        _call(2, agent_id="ag2", disconnection_reason="agent_hangup"),
+        _call(3, agent_id="ag3", direction="inbound", to_number="+3000"),
+        _call(7, agent_id="ag1", call_status="error", end_timestamp=None),
+    ])
+    report = analytics.report()
+    assert report["calls"] == 5
+    assert report["by_agent"]["agent_id"] == ["ag1", "ag2", OTHER]
+    assert report["by_agent"]["calls"] == [3, 1, 1]
+    assert report["by_agent"]["error"] == [1, 0, 0]
+    assert report["by_number"]["phone_number"] == ["+1000", "+3000"]
+    assert report["disconnection_reason"] == {"user_hangup": 4, "agent_hangup": 1}
+    assert report["duration_ms"]["count"] == 4
+    assert report["hourly"]["hour_start_ms"] == [T0, T0 + HOUR_MS]
+    assert report["hourly"]["calls"] == [4, 1]
+
+
+@respx.mock
+async def test_api_scan_stops_at_start_after():
+    pages = [[_call(n) for n in range(9, 4, -1)], [_call(n) for n in range(4, -1, -1)]]
+    route = respx.get(f"{BASE}/list-calls").mock(side_effect=[httpx.Response(200, json=p) for p in pages])
+    report = await aanalyze_calls(
+        _client(), start_after=_call(2)["start_timestamp"], start_before=_call(9)["start_timestamp"],
+        page_size=5,
+    )
+    assert report["calls"] == 6  # calls 3..8
+    assert report["source"] == "api"
+    assert route.call_count == 2
+
+
+def test_archive_scan_pages_through_summaries(tmp_path):
+    archive = CallArchive(tmp_path / "calls.db")
+    archive.upsert_calls([_call(n, agent_id="ag1" if n % 2 else "ag2") for n in range(25)])
+    report = analyze_calls(_client(), agent_id="ag1", archive=archive, page_size=4)
+    assert report["calls"] == 12
+    assert report["source"] == "archive"
+    assert report["by_number"]["phone_number"] == ["+1000"]
+    archive.close()
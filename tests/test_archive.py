@@ -0,0 +1,180 @@
+"""Tests for the local SQLite call archive."""
+
+import sqlite3
+import time
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell.archive import _SCHEMA, CallArchive, arefresh_archive, refresh_archive
+from mcp_retell.client import RetellClient
+from mcp_retell.operations import calls
+
+BASE = "https://api.retellai.com"
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    store = CallArchive(tmp_path / "calls.db")
+    yield store
+    store.close()
+
+
+def _call(n, status="ended", agent_id="ag1"):
+    return {
+        "call_id": f"call{n}", "agent_id": agent_id, "call_status": status,
+        "start_timestamp": 1700000000 + n, "end_timestamp": 1700000060 + n,
+        "transcript": f"Agent: hello {n}",
+    }
+
+
+def test_archive_list_and_paginate(archive):
+    archive.upsert_calls([_call(n, agent_id="ag1" if n % 2 else "ag2") for n in range(6)])
+    page = archive.list_calls(limit=2)
+    assert [c["call_id"] for c in page] == ["call5", "call4"]
+    page = archive.list_calls(limit=2, pagination_key="call4")
+    assert [c["call_id"] for c in page] == ["call3", "call2"]
+    page = archive.list_calls(agent_id="ag1", sort_order="ascending")
+    assert [c["call_id"] for c in page] == ["call1", "call3", "call5"]
+    assert archive.get_call("call3")["transcript"] == "Agent: hello 3"
+    assert archive.get_call("missing") is None
+
+
+@respx.mock
+def test_refresh_is_incremental(archive):
+    listing = respx.get(f"{BASE}/list-calls")
+    listing.mock(return_value=httpx.Response(200, json=[_call(2, status="ongoing"), _call(1), _call(0)]))
+    report = refresh_archive(_client(), archive)
+    assert report["synced"] == 3
+    assert archive.watermark() == 1700000002
+    assert archive.open_call_ids() == ["call2"]
+
+    listing.mock(return_value=httpx.Response(200, json=[_call(4), _call(3), _call(2, status="ongoing"), _call(1)]))
+    respx.get(f"{BASE}/get-call/call2").mock(return_value=httpx.Response(200, json=_call(2)))
+    report = refresh_archive(_client(), archive)
+    assert report["synced"] == 3
+    assert report["refreshed"] == 1
+    assert archive.count() == 5
+    assert archive.open_call_ids() == []
+
+
+@respx.mock
+async def test_refresh_reports_failed_open_calls_and_advances(archive):
+    archive.upsert_calls([_call(2, status="ongoing"), _call(3, status="ongoing")])
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[_call(5)]))
+    respx.get(f"{BASE}/get-call/call2").mock(return_value=httpx.Response(200, json=_call(2)))
+    respx.get(f"{BASE}/get-call/call3").mock(return_value=httpx.Response(404, json={}))
+    report = await arefresh_archive(_client(), archive)
+    assert report["refreshed"] == 1
+    assert report["failed"] == {"call3": "HTTP 404"}
+    assert archive.watermark() == 1700000005
+    assert archive.open_call_ids() == ["call3"]
+
+
+@respx.mock
+def test_undated_call_does_not_end_sync_early(archive):
+    archive.set_watermark(1700000001)
+    undated = {"call_id": "queued", "agent_id": "ag1", "call_status": "registered"}
+    respx.get(f"{BASE}/list-calls").mock(
+        return_value=httpx.Response(200, json=[undated, _call(3), _call(2), _call(0)]),
+    )
+    report = refresh_archive(_client(), archive)
+    assert report["synced"] == 3
+    assert archive.watermark() == 1700000003
+    assert archive.get_call("call2") is not None
+
+
+@respx.mock
+async def test_async_refresh_uses_sync_watermark(archive):
+    # A call written through by get_call must not advance the sync watermark.
+    archive.upsert_calls([_call(9)])
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[_call(9), _call(1), _call(0)]))
+    report = await arefresh_archive(_client(), archive)
+    assert report["synced"] == 3
+    assert archive.watermark() == 1700000009
+
+
+@respx.mock
+def test_operations_read_from_archive(archive):
+    archive.upsert_calls([_call(1), _call(2, status="ongoing")])
+    route = respx.get(f"{BASE}/get-call/call2").mock(return_value=httpx.Response(200, json=_call(2)))
+    assert calls.get_call(_client(), "call1", archive=archive)["call_id"] == "call1"
+    assert calls.get_call(_client(), "call2", archive=archive)["call_status"] == "ended"
+    assert route.call_count == 1
+    assert archive.open_call_ids() == []
+    listed = calls.list_calls(_client(), archive=archive)
+    assert [c["call_id"] for c in listed] == ["call2", "call1"]
+    assert listed[0]["duration_ms"] == 60
+
+
+@respx.mock
+async def test_call_archived_before_its_analysis_is_refreshed(archive):
+    ended_now = {**_call(1), "end_timestamp": int(time.time() * 1000)}
+    archive.upsert_calls([ended_now])
+    assert archive.open_call_ids() == ["call1"]
+    analysed = {**ended_now, "call_analysis": {"call_successful": True}}
+    route = respx.get(f"{BASE}/get-call/call1").mock(return_value=httpx.Response(200, json=analysed))
+    assert await calls.aget_call(_client(), "call1", archive=archive) == analysed
+    assert await calls.aget_call(_client(), "call1", archive=archive) == analysed
+    assert route.call_count == 1
+    assert archive.open_call_ids() == []
+
+
+# =============================================================================
+# Transcript search
+# =============================================================================
+
+
+def test_search_transcripts_phrase_filters_and_paging(archive):
+    archive.upsert_calls([
+        {**_call(1), "transcript": "User: I want to cancel my subscription today."},
+        {**_call(2, agent_id="ag2"), "transcript": "User: please cancel my subscription."},
+        {**_call(3), "transcript": "User: my subscription renewal, do not cancel."},
+    ])
+    phrase = archive.search_transcripts('"cancel my subscription"')
+    assert {r["call_id"] for r in phrase["results"]} == {"call1", "call2"}
+    assert "[cancel my subscription]" in phrase["results"][0]["snippet"]
+
+    filtered = archive.search_transcripts('"cancel my subscription"', agent_id="ag2")
+    assert [r["call_id"] for r in filtered["results"]] == ["call2"]
+
+    boolean = archive.search_transcripts("subscription NOT renewal", start_after=1700000001)
+    assert [r["call_id"] for r in boolean["results"]] == ["call2"]
+
+    first = archive.search_transcripts("subscription", limit=2)
+    assert first["next_offset"] == 2
+    rest = archive.search_transcripts("subscription", limit=2, offset=2)
+    assert rest["next_offset"] is None
+    assert len(first["results"]) + len(rest["results"]) == 3
+
+
+def test_search_index_follows_transcript_updates(archive):
+    archive.upsert_calls([{**_call(1), "transcript": "old words"}])
+    archive.upsert_calls([{**_call(1), "transcript": "new words"}])
+    assert archive.search_transcripts("old")["results"] == []
+    assert [r["call_id"] for r in archive.search_transcripts("new")["results"]] == ["call1"]
+
+
+def test_search_index_built_for_existing_archive(tmp_path):
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    conn.execute(
+        "INSERT INTO calls (call_id, transcript, data, archived_at) VALUES (?, ?, ?, 0)",
+        ("call1", "refund request", "{}"),
+    )
+    conn.commit()
+    conn.close()
+    store = CallArchive(path)
+    assert [r["call_id"] for r in store.search_transcripts("refund")["results"]] == ["call1"]
+    store.close()
+
+
+def test_search_rejects_invalid_query(archive):
+    with pytest.raises(ValueError):
+        archive.search_transcripts('"unbalanced')
@@ -0,0 +1,560 @@
+"""Tests for RetellClient transport behaviour."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell import httpcache
+from mcp_retell.cache import MISS, ResponseCache, TTLCache
+from mcp_retell.callcache import CallCache, is_final
+from mcp_retell.client import RetellClient
+from mcp_retell.httpcache import DiskBackend, HTTPCache, MemoryBackend
+from mcp_retell.ratelimit import RateLimiter, TokenBucket, classify
+from mcp_retell.retry import RetryPolicy, retry_after
+from mcp_retell.singleflight import SingleFlight
+from mcp_retell.timeouts import DeadlineExceeded, TimeoutPolicy, deadline, remaining
+
+BASE = "https://api.retellai.com"
+
+
+def _client(**kwargs):
+    return RetellClient(api_key="test-key", base_url=BASE, **kwargs)
+
+
+# =============================================================================
+# Connection pooling
+# =============================================================================
+
+
+@respx.mock
+def test_sync_pool_is_reused():
+    respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=[]))
+    client = _client()
+    client.get_sync("/list-agents")
+    first = client._sync_http
+    client.get_sync("/list-agents")
+    assert client._sync_http is first
+    client.close()
+    assert first.is_closed
+    assert client._sync_http is None
+
+
+@respx.mock
+async def test_async_pool_is_reused():
+    respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=[]))
+    async with _client() as client:
+        await client.get("/list-agents")
+        first = client._async_http
+        await client.get("/list-agents")
+        assert client._async_http is first
+    assert first.is_closed
+
+
+@respx.mock
+def test_async_pool_rebuilt_per_event_loop():
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    client = _client()
+
+    async def fetch():
+        await client.get("/list-calls")
+        return client._async_http
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    assert first is not second
+    assert first.is_closed
+
+
+@respx.mock
+def test_run_closes_async_pool_before_loop_ends():
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    client = _client()
+
+    async def fetch():
+        await client.get("/list-calls")
+        return client._async_http
+
+    pool = client.run(fetch())
+    assert pool.is_closed
+    assert client._async_http is None
+
+
+@respx.mock
+def test_headers_and_compression_opt_out():
+    route = respx.get(f"{BASE}/list-voices").mock(return_value=httpx.Response(200, json=[]))
+    with _client(compression=False) as client:
+        client.get_sync("/list-voices")
+    request = route.calls.last.request
+    assert request.headers["Authorization"] == "Bearer test-key"
+    assert request.headers["Accept-Encoding"] == "identity"
+
+
+def test_pool_limits_from_constructor():
+    client = _client(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.0)
+    assert client.limits.max_connections == 5
+    assert client.limits.max_keepalive_connections == 2
+    assert client.limits.keepalive_expiry == 1.0
+
+
+# =============================================================================
+# Retries
+# =============================================================================
+
+
+def _fast_policy(**kwargs):
+    return RetryPolicy(backoff_base=0.0, backoff_max=0.0, **kwargs)
+
+
+@respx.mock
+def test_get_retries_transient_status():
+    route = respx.get(f"{BASE}/list-agents").mock(side_effect=[
+        httpx.Response(503),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json=[{"agent_id": "ag1"}]),
+    ])
+    client = _client(retry_policy=_fast_policy())
+    assert client.get_sync("/list-agents") == [{"agent_id": "ag1"}]
+    assert route.call_count == 3
+    stats = client.retry_stats.snapshot()
+    assert stats["retries"] == 2
+    assert stats["reasons"] == {"503": 1, "429": 1}
+
+
+@respx.mock
+async def test_async_get_retries_connect_error():
+    route = respx.get(f"{BASE}/list-voices").mock(side_effect=[
+        httpx.ConnectError("boom"),
+        httpx.Response(200, json=[]),
+    ])
+    client = _client(retry_policy=_fast_policy())
+    assert await client.get("/list-voices") == []
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_create_phone_call_not_retried_on_server_error():
+    route = respx.post(f"{BASE}/create-phone-call").mock(return_value=httpx.Response(503))
+    client = _client(retry_policy=_fast_policy())
+    with pytest.raises(httpx.HTTPStatusError):
+        client.post_sync("/create-phone-call", json={})
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_create_phone_call_retried_when_rejected_before_processing():
+    route = respx.post(f"{BASE}/create-phone-call").mock(side_effect=[
+        httpx.Response(429),
+        httpx.ConnectError("refused"),
+        httpx.Response(200, json={"call_id": "call1"}),
+    ])
+    client = _client(retry_policy=_fast_policy())
+    assert client.post_sync("/create-phone-call", json={})["call_id"] == "call1"
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_create_phone_call_not_retried_on_read_timeout():
+    route = respx.post(f"{BASE}/create-phone-call").mock(side_effect=httpx.ReadTimeout("slow"))
+    client = _client(retry_policy=_fast_policy())
+    with pytest.raises(httpx.ReadTimeout):
+        client.post_sync("/create-phone-call", json={})
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_retry_gives_up_after_max_attempts():
+    route = respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(502))
+    client = _client(retry_policy=_fast_policy(max_attempts=3))
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_sync("/list-agents")
+    assert route.call_count == 3
+    assert client.retry_stats.snapshot()["giveups"] == 1
+
+
+def test_retry_after_exceeding_budget_gives_up():
+    policy = RetryPolicy(max_elapsed=5.0)
+    response = httpx.Response(429, headers={"Retry-After": "60"})
+    assert policy.next_delay("GET", 1, 0.0, response=response) is None
+
+
+def test_retry_after_http_date():
+    response = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after(response) == 0.0
+
+
+# =============================================================================
+# Timeouts and deadlines
+# =============================================================================
+
+
+def test_read_timeout_overrides_by_longest_prefix():
+    policy = TimeoutPolicy(
+        httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=10.0),
+        read_overrides={"/list-": 15.0, "/list-calls": 60.0},
+    )
+    assert policy.for_endpoint("/list-calls").read == 60.0
+    assert policy.for_endpoint("/list-voices").read == 15.0
+    assert policy.for_endpoint("/get-call/c1").read == 30.0
+    assert policy.for_endpoint("/list-calls").connect == 5.0
+
+
+@respx.mock
+def test_requests_use_endpoint_timeouts_clamped_to_deadline():
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    client = _client()
+    client.get_sync("/list-calls")
+    assert respx.calls.last.request.extensions["timeout"]["read"] == 60.0
+    with deadline(2.0):
+        client.get_sync("/list-calls")
+    timeout = respx.calls.last.request.extensions["timeout"]
+    assert 0 < timeout["read"] <= 2.0
+    assert timeout["connect"] <= 2.0
+
+
+@respx.mock
+async def test_rate_limit_wait_is_bounded_by_deadline():
+    route = respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    bucket = TokenBucket(0.5, 1)  # one token every 2 s
+    client = RetellClient(api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({"read": bucket}))
+    await client.get("/list-calls")
+    started = time.monotonic()
+    with deadline(0.3), pytest.raises(DeadlineExceeded):
+        await client.get("/list-calls")
+    with deadline(0.3), pytest.raises(DeadlineExceeded):
+        client.get_sync("/list-calls")
+    assert time.monotonic() - started < 0.2
+    assert route.call_count == 1
+    assert bucket.snapshot()["rejected"] == 2
+    assert bucket.reserve() > 1.5  # the rejected waits took no tokens
+
+
+def test_nested_deadlines_only_shorten():
+    assert remaining() is None
+    with deadline(10.0):
+        with deadline(60.0):
+            assert remaining() <= 10.0
+        with deadline(1.0):
+            assert remaining() <= 1.0
+    assert remaining() is None
+
+
+@respx.mock
+async def test_expired_deadline_fails_without_a_request():
+    route = respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=[]))
+    client = _client()
+    with deadline(0.01):
+        await asyncio.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            await client.get("/list-agents")
+    assert route.call_count == 0
+
+
+@respx.mock
+async def test_no_retry_past_the_deadline():
+    route = respx.get(f"{BASE}/list-agents").mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "5"}),
+    )
+    client = _client(retry_policy=RetryPolicy(max_elapsed=30.0))
+    started = time.monotonic()
+    with deadline(1.0), pytest.raises(httpx.HTTPStatusError):
+        await client.get("/list-agents")
+    assert route.call_count == 1
+    assert time.monotonic() - started < 1.0
+    assert client.retry_stats.snapshot()["retries"] == 0
+
+
+# =============================================================================
+# Rate limiting
+# =============================================================================
+
+
+def test_endpoint_classification():
+    assert classify("GET", "/list-calls") == "read"
+    assert classify("GET", "/get-call/call1") == "read"
+    assert classify("POST", "/create-phone-call") == "create_call"
+    assert classify("PATCH", "/update-agent/ag1") == "write"
+
+
+def test_token_bucket_reports_queue_wait():
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    wait = bucket.reserve()
+    assert 0.05 < wait <= 0.1
+    stats = bucket.snapshot()
+    assert stats["acquired"] == 3
+    assert stats["waited"] == 1
+    assert stats["max_wait_s"] == pytest.approx(wait, abs=1e-6)
+
+
+@respx.mock
+def test_rate_limiter_buckets_are_separate():
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    respx.post(f"{BASE}/create-phone-call").mock(return_value=httpx.Response(200, json={}))
+    limiter = RateLimiter({"read": TokenBucket(1000.0, 5), "create_call": TokenBucket(1000.0, 1)})
+    client = _client(rate_limiter=limiter)
+    for _ in range(3):
+        client.get_sync("/list-calls")
+    client.post_sync("/create-phone-call", json={})
+    stats = client.rate_limiter.snapshot()
+    assert stats["read"]["acquired"] == 3
+    assert stats["create_call"]["acquired"] == 1
+    assert "write" not in stats
+
+
+@respx.mock
+async def test_rate_limiter_shared_across_concurrent_async_calls():
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    limiter = RateLimiter({"read": TokenBucket(10.0, 1)})
+    client = _client(rate_limiter=limiter)
+    await asyncio.gather(*(client.get("/list-calls", params={"limit": n}) for n in range(4)))
+    stats = limiter.snapshot()["read"]
+    assert stats["waited"] == 3
+    assert stats["total_wait_s"] > 0
+
+
+# =============================================================================
+# Response cache
+# =============================================================================
+
+
+@respx.mock
+def test_catalog_reads_are_cached():
+    route = respx.get(f"{BASE}/list-voices").mock(return_value=httpx.Response(200, json=[{"voice_id": "v1"}]))
+    client = _client()
+    first = client.get_sync("/list-voices")
+    first.append({"voice_id": "mutated"})
+    assert client.get_sync("/list-voices") == [{"voice_id": "v1"}]
+    assert route.call_count == 1
+    client.get_sync("/list-voices", bypass_cache=True)
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_uncached_endpoints_always_fetch():
+    route = respx.get(f"{BASE}/get-call/call1").mock(return_value=httpx.Response(200, json={"call_id": "call1"}))
+    client = _client()
+    client.get_sync("/get-call/call1")
+    client.get_sync("/get-call/call1")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_agent_mutation_invalidates_agent_entries():
+    agents_route = respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=[]))
+    respx.get(f"{BASE}/list-voices").mock(return_value=httpx.Response(200, json=[]))
+    respx.patch(f"{BASE}/update-agent/ag1").mock(return_value=httpx.Response(200, json={}))
+    client = _client()
+    await client.get("/list-agents")
+    await client.get("/list-voices")
+    await client.patch("/update-agent/ag1", json={"agent_name": "x"})
+    await client.get("/list-agents")
+    assert agents_route.call_count == 2
+    assert client.cache.snapshot()["size"] == 2
+
+
+def test_ttl_cache_expiry_and_lru_bound():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is MISS
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is MISS
+    assert cache.get("a") == 1
+    assert cache.snapshot()["evictions"] == 1
+
+
+# =============================================================================
+# HTTP validation cache
+# =============================================================================
+
+
+def _revalidating(request, etag='"v1"', body=None):
+    if request.headers.get("If-None-Match") == etag:
+        return httpx.Response(304, headers={"ETag": etag})
+    return httpx.Response(200, json=body or {"agent_id": "ag1", "prompt": "x" * 1000}, headers={"ETag": etag})
+
+
+@respx.mock
+async def test_conditional_requests_turn_unchanged_bodies_into_304s():
+    route = respx.get(f"{BASE}/get-agent/ag1").mock(side_effect=_revalidating)
+    client = _client(cache=ResponseCache({}), http_cache=HTTPCache(MemoryBackend()))
+    first = await client.get("/get-agent/ag1")
+    assert "If-None-Match" not in route.calls[0].request.headers
+    assert client.get_sync("/get-agent/ag1") == first
+    assert await client.get("/get-agent/ag1") == first
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    snapshot = client.http_cache.snapshot()
+    assert snapshot["not_modified"] == 2
+    assert snapshot["stored"] == 1
+
+
+@respx.mock
+def test_content_hash_reuses_unchanged_bodies_without_validators(monkeypatch):
+    route = respx.get(f"{BASE}/list-voices").mock(side_effect=[
+        httpx.Response(200, json=[{"voice_id": "v1"}]),
+        httpx.Response(200, json=[{"voice_id": "v1"}]),
+        httpx.Response(200, json=[{"voice_id": "v2"}]),
+    ])
+    client = _client(cache=ResponseCache({}), http_cache=HTTPCache(MemoryBackend()))
+    first = client.get_sync("/list-voices")
+    monkeypatch.setattr(httpcache, "_loads", None)  # a repeated body must not be decoded
+    assert client.get_sync("/list-voices") is first
+    monkeypatch.undo()
+    assert client.get_sync("/list-voices") == [{"voice_id": "v2"}]
+    assert "If-None-Match" not in route.calls[1].request.headers
+    snapshot = client.http_cache.snapshot()
+    assert (snapshot["stored"], snapshot["unchanged"], snapshot["reused"]) == (2, 1, 1)
+
+
+@respx.mock
+async def test_304_without_cached_body_refetches_unconditionally():
+    route = respx.get(f"{BASE}/get-agent/ag1").mock(side_effect=[
+        httpx.Response(304),
+        httpx.Response(200, json={"agent_id": "ag1"}, headers={"ETag": '"v1"'}),
+    ])
+    client = _client(cache=ResponseCache({}), http_cache=HTTPCache(MemoryBackend()))
+    assert await client.get("/get-agent/ag1") == {"agent_id": "ag1"}
+    assert route.calls[1].request.headers["Cache-Control"] == "no-cache"
+    assert client.http_cache.snapshot()["misses"] == 1
+
+
+@respx.mock
+def test_disk_backend_revalidates_across_clients(tmp_path):
+    modified = "Wed, 01 May 2024 10:00:00 GMT"
+
+    def last_modified(request):
+        if request.headers.get("If-Modified-Since") == modified:
+            return httpx.Response(304)
+        return httpx.Response(200, json={"agent_id": "ag1"}, headers={"Last-Modified": modified})
+
+    route = respx.get(f"{BASE}/get-agent/ag1").mock(side_effect=last_modified)
+    for _ in range(2):
+        backend = DiskBackend(tmp_path / "http.db")
+        client = _client(cache=ResponseCache({}), http_cache=HTTPCache(backend))
+        assert client.get_sync("/get-agent/ag1") == {"agent_id": "ag1"}
+        backend.close()
+    assert route.calls[1].response.status_code == 304
+
+
+# =============================================================================
+# Finished-call cache
+# =============================================================================
+
+
+def _finished_call(call_id, **extra):
+    return {"call_id": call_id, "call_status": "ended", "end_timestamp": 1_000,
+            "call_analysis": {"call_successful": True}, "transcript": "Agent: hi " * 50, **extra}
+
+
+@respx.mock
+async def test_finished_calls_are_fetched_once():
+    ended = respx.get(f"{BASE}/get-call/c1").mock(return_value=httpx.Response(200, json=_finished_call("c1")))
+    live = respx.get(f"{BASE}/get-call/c2").mock(
+        return_value=httpx.Response(200, json={"call_id": "c2", "call_status": "ongoing"}),
+    )
+    client = _client()
+    first = await client.get("/get-call/c1")
+    first["transcript"] = "mutated"
+    assert (await client.get("/get-call/c1"))["transcript"].startswith("Agent: hi")
+    assert client.get_sync("/get-call/c1")["call_id"] == "c1"
+    await client.get("/get-call/c1", bypass_cache=True)
+    await client.get("/get-call/c2")
+    await client.get("/get-call/c2")
+    assert ended.call_count == 2
+    assert live.call_count == 2
+    assert client.call_cache.snapshot()["hits"] == 2
+
+
+def test_call_finality():
+    now = 1_000_000.0
+    assert is_final({"call_status": "error"}, now=now)
+    assert is_final(_finished_call("c1"), now=now)
+    assert not is_final({"call_status": "ongoing"}, now=now)
+    recent = {"call_status": "ended", "end_timestamp": (now - 60) * 1000}
+    assert not is_final(recent, settle_s=600, now=now)  # analysis may still arrive
+    assert is_final(recent, settle_s=30, now=now)
+
+
+def test_disk_store_persists_and_stays_bounded(tmp_path):
+    path = tmp_path / "calls.db"
+    cache = CallCache(max_bytes=0, disk_path=path, disk_max_bytes=10_000)
+    for n in range(200):
+        assert cache.put(_finished_call(f"c{n}", summary=f"call {n} " * 40))
+    assert cache.disk.bytes <= 10_000
+    assert cache.get("c0") is None  # least recently read, evicted
+    cache.close()
+
+    reopened = CallCache(max_bytes=1_000_000, disk_path=path, disk_max_bytes=10_000)
+    assert reopened.get("c199")["summary"].startswith("call 199")
+    assert reopened.snapshot()["disk_hits"] == 1
+    assert reopened.get("c199") is not None
+    assert reopened.snapshot()["hits"] == 1
+    reopened.close()
+
+
+# =============================================================================
+# Single-flight
+# =============================================================================
+
+
+@respx.mock
+async def test_concurrent_identical_gets_share_one_request():
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"call_id": "call1"})
+
+    route = respx.get(f"{BASE}/get-call/call1").mock(side_effect=slow)
+    client = _client()
+    results = await asyncio.gather(*(client.get("/get-call/call1") for _ in range(5)))
+    assert route.call_count == 1
+    assert all(r == {"call_id": "call1"} for r in results)
+    assert len({id(r) for r in results}) == 5
+    assert client.singleflight.snapshot()["coalesced"] == 4
+    await client.get("/get-call/call1")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_singleflight_keys_include_params():
+    route = respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    client = _client()
+    await asyncio.gather(
+        client.get("/list-calls", params={"limit": 1}),
+        client.get("/list-calls", params={"limit": 2}),
+    )
+    assert route.call_count == 2
+
+
+def test_sync_singleflight_coalesces_threads():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"ok": True}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do_sync("k", fetch)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do_sync("k", fetch))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while flight.snapshot()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join()
+    assert len(calls) == 1
+    assert results == [{"ok": True}] * 4
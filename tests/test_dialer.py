@@ -0,0 +1,129 @@
+"""Tests for bulk outbound dialing."""
+
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell.client import RetellClient
+from mcp_retell.operations import dialer
+from mcp_retell.ratelimit import RateLimiter
+from mcp_retell.timeouts import deadline
+
+BASE = "https://api.retellai.com"
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({}))
+
+
+def _rows(n):
+    return [{"to_number": f"+1555000{i:04d}"} for i in range(n)]
+
+
+def test_load_rows_from_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text('to_number,agent_id,metadata\n+15550001,ag1,"{""a"": 1}"\n+15550002,,\n')
+    assert list(dialer.load_dial_rows(csv_path)) == [
+        {"to_number": "+15550001", "agent_id": "ag1", "metadata": '{"a": 1}'},
+        {"to_number": "+15550002"},
+    ]
+    stream = io.StringIO('{"to_number": "+15550003"}\n\n{"to_number": "+15550004"}\n')
+    assert [r["to_number"] for r in dialer.load_dial_rows(stream)] == ["+15550003", "+15550004"]
+
+
+@respx.mock
+async def test_bulk_dial_respects_per_number_cap():
+    in_flight = {"+1000": 0, "+2000": 0}
+    peak = {"+1000": 0, "+2000": 0}
+
+    async def handler(request):
+        number = json.loads(request.content)["from_number"]
+        in_flight[number] += 1
+        peak[number] = max(peak[number], in_flight[number])
+        await asyncio.sleep(0.01)
+        in_flight[number] -= 1
+        return httpx.Response(200, json={"call_id": f"call-{request.content.hex()[:6]}"})
+
+    respx.post(f"{BASE}/create-phone-call").mock(side_effect=handler)
+    rows = [{**row, "from_number": "+1000" if i % 2 else "+2000"} for i, row in enumerate(_rows(10))]
+    result = await dialer.adial_many(
+        _client(), rows, agent_id="ag1", concurrency=4, per_number_concurrency=2,
+    )
+    assert [r["index"] for r in result["results"]] == list(range(10))
+    assert result["summary"]["dialed"] == 10
+    assert peak == {"+1000": 2, "+2000": 2}
+
+
+@respx.mock
+async def test_bulk_dial_reports_invalid_and_failed_rows():
+    respx.post(f"{BASE}/create-phone-call").mock(return_value=httpx.Response(400, json={}))
+    rows = [{"to_number": "+15550001"}, {"agent_id": "ag1"}]
+    result = await dialer.adial_many(_client(), rows, from_number="+1000", agent_id="ag1")
+    statuses = [r["status"] for r in result["results"]]
+    assert statuses == [dialer.FAILED, dialer.INVALID]
+    assert result["summary"]["errors"] == {"HTTP 400": 1, "missing to_number": 1}
+
+
+@respx.mock
+async def test_bulk_dial_resumes_from_checkpoint(tmp_path):
+    checkpoint = tmp_path / "dial.ckpt"
+    route = respx.post(f"{BASE}/create-phone-call").mock(side_effect=[
+        httpx.Response(200, json={"call_id": "call0"}),
+        httpx.Response(503),
+        httpx.Response(422),
+        httpx.Response(200, json={"call_id": "call2"}),
+    ])
+    rows = _rows(3)
+    kwargs = dict(from_number="+1000", agent_id="ag1", concurrency=1, checkpoint_path=checkpoint)
+    first = await dialer.adial_many(_client(), rows, **kwargs)
+    assert [r["status"] for r in first["results"]] == [dialer.DIALED, dialer.UNCERTAIN, dialer.FAILED]
+
+    second = await dialer.adial_many(_client(), rows, **kwargs)
+    assert [r["status"] for r in second["results"]] == [dialer.SKIPPED, dialer.SKIPPED, dialer.DIALED]
+    assert route.call_count == 4
+
+
+@respx.mock
+async def test_unsent_requests_stay_retryable_and_uncertain_ones_do_not(tmp_path):
+    checkpoint = tmp_path / "dial.ckpt"
+    route = respx.post(f"{BASE}/create-phone-call").mock(side_effect=[
+        httpx.ReadTimeout("no response"),
+        httpx.Response(200, json={"call_id": "call1"}),
+    ])
+    kwargs = dict(from_number="+1000", agent_id="ag1", concurrency=1, checkpoint_path=checkpoint)
+    with deadline(0.001):
+        await asyncio.sleep(0.01)
+        first = await dialer.adial_many(_client(), _rows(2), **kwargs)
+    assert [r["error"] for r in first["results"]] == ["DeadlineExceeded", "DeadlineExceeded"]
+    assert first["summary"]["failed"] == 2
+    assert not route.called
+
+    second = await dialer.adial_many(_client(), _rows(2), **kwargs)
+    assert [r["status"] for r in second["results"]] == [dialer.UNCERTAIN, dialer.DIALED]
+    third = await dialer.adial_many(_client(), _rows(2), **kwargs)
+    assert [r["status"] for r in third["results"]] == [dialer.SKIPPED, dialer.SKIPPED]
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_duplicate_rows_in_one_run_are_dialed_once():
+    async def slow(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"call_id": "call0"})
+
+    route = respx.post(f"{BASE}/create-phone-call").mock(side_effect=slow)
+    rows = [{"id": "lead-1", "to_number": "+15550001"}] * 3
+    result = await dialer.adial_many(_client(), rows, from_number="+1000", agent_id="ag1", concurrency=3)
+    assert sorted(r["status"] for r in result["results"]) == [dialer.DIALED, dialer.SKIPPED, dialer.SKIPPED]
+    assert route.call_count == 1
+
+
+def test_dial_path_stays_inside_dial_directory(tmp_path):
+    assert dialer.dial_path("campaign.csv", tmp_path) == tmp_path.resolve() / "campaign.csv"
+    for name in ("../outside.csv", "/etc/passwd", "runs/../../x", "."):
+        with pytest.raises(ValueError):
+            dialer.dial_path(name, tmp_path)
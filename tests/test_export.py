@@ -0,0 +1,139 @@
+"""Tests for streaming call export and the CLI."""
+
+import csv
+import json
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell import cli
+from mcp_retell.client import RetellClient
+from mcp_retell.operations.export import COLUMNS, aexport_calls
+from mcp_retell.ratelimit import RateLimiter
+
+BASE = "https://api.retellai.com"
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({}))
+
+
+def _call(n):
+    return {"call_id": f"call{n}", "agent_id": "ag1", "call_status": "ended",
+            "start_timestamp": 1_000 * n, "end_timestamp": 1_000 * n + 500}
+
+
+def _mock_api(n_calls):
+    listed = [_call(n) for n in range(n_calls - 1, -1, -1)]
+
+    def list_calls(request):
+        key = request.url.params.get("pagination_key")
+        limit = int(request.url.params["limit"])
+        start = next(i + 1 for i, c in enumerate(listed) if c["call_id"] == key) if key else 0
+        return httpx.Response(200, json=listed[start:start + limit])
+
+    def get_call(request):
+        call_id = request.url.path.rsplit("/", 1)[-1]
+        if call_id == "call3":
+            return httpx.Response(404, json={})
+        n = int(call_id[4:])
+        return httpx.Response(200, json={**_call(n), "transcript": f"Agent: hi {n}", "call_analysis": {"ok": True}})
+
+    respx.get(f"{BASE}/list-calls").mock(side_effect=list_calls)
+    return respx.get(url__regex=rf"{BASE}/get-call/.+").mock(side_effect=get_call)
+
+
+@respx.mock
+async def test_jsonl_export_with_details(tmp_path):
+    _mock_api(7)
+    out = tmp_path / "calls.jsonl"
+    report = await aexport_calls(_client(), out, start_after=1_000, batch_size=3)
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [c["call_id"] for c in lines] == ["call6", "call5", "call4", "call3", "call2"]
+    assert lines[0]["transcript"] == "Agent: hi 6"
+    assert "transcript" not in lines[3]  # details failed; listed form kept
+    assert report["rows"] == 5
+    assert report["detail_errors"] == 1
+    assert report["rows_per_s"] > 0
+
+
+@respx.mock
+async def test_export_resumes_from_checkpoint(tmp_path):
+    details = _mock_api(10)
+    out, checkpoint = tmp_path / "calls.csv", tmp_path / "export.ckpt"
+
+    def interrupt(report):
+        if report["rows"] >= 4:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        await aexport_calls(_client(), out, fmt="csv", batch_size=4, checkpoint_path=checkpoint, progress=interrupt)
+    with open(out, "a") as f:
+        f.write("partial,row")  # written after the checkpoint; must be discarded
+    assert details.call_count == 4
+
+    report = await aexport_calls(_client(), out, fmt="csv", batch_size=4, checkpoint_path=checkpoint)
+    assert report["resumed"] is True
+    assert report["exported"] == 6
+    assert details.call_count == 10
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["call_id"] for r in rows] == [f"call{n}" for n in range(9, -1, -1)]
+    assert list(rows[0]) == list(COLUMNS)
+    assert rows[0]["duration_ms"] == "500"
+    assert json.loads(rows[0]["call_analysis"]) == {"ok": True}
+
+
+@respx.mock
+async def test_parquet_export(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    _mock_api(3)
+    out = tmp_path / "calls.parquet"
+    await aexport_calls(_client(), out, fmt="parquet", details=False)
+    assert pq.read_table(out).column("call_id").to_pylist() == ["call2", "call1", "call0"]
+
+
+@respx.mock
+async def test_parquet_export_resumes_from_closed_parts(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    _mock_api(10)
+    out, checkpoint = tmp_path / "calls.parquet", tmp_path / "export.ckpt"
+    kwargs = dict(fmt="parquet", details=False, batch_size=2, part_batches=2, checkpoint_path=checkpoint)
+    saved = []
+
+    def crash(report):
+        saved.append(checkpoint.read_text() if checkpoint.exists() else None)
+        if report["rows"] >= 6:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        await aexport_calls(_client(), out, progress=crash, **kwargs)
+    # The checkpoint only advances once a part file is closed and readable.
+    assert saved[0] is None
+    assert json.loads(saved[-1]) == {"last_call_id": "call6", "rows": 4, "part": 0}
+    # Simulate a hard crash at that point: part 1 never got its footer.
+    checkpoint.write_text(saved[-1])
+    part1 = tmp_path / "calls.part1.parquet"
+    part1.write_bytes(b"PAR1 no footer")
+
+    report = await aexport_calls(_client(), out, **kwargs)
+    assert report["resumed"] is True
+    assert report["exported"] == 6
+    assert report["parts"] == [str(part1), str(tmp_path / "calls.part2.parquet")]
+    ids = [
+        call_id
+        for part in (out, part1, tmp_path / "calls.part2.parquet")
+        for call_id in pq.read_table(part).column("call_id").to_pylist()
+    ]
+    assert ids == [f"call{n}" for n in range(9, -1, -1)]
+
+
+def test_cli_parses_times_and_defaults_to_serve():
+    assert cli.parse_time("1717200000000") == 1717200000000
+    assert cli.parse_time("2024-06-01") == 1717200000000
+    assert cli.parse_time("2024-06-01T02:00:00+02:00") == 1717200000000
+    args = cli._build_parser().parse_args([])
+    assert args.command is None
+    args = cli._build_parser().parse_args(["export", "out.csv", "--start-after", "2024-06-01"])
+    assert args.start_after == 1717200000000
@@ -1,12 +1,23 @@
 """Tests for LangChain tool interfaces."""
 
+import json
+
+import httpx
+import respx
 from langchain_core.tools import BaseTool
 
+from mcp_retell import langchain_tools
+from mcp_retell.archive import CallArchive
+from mcp_retell.client import RetellClient
+from mcp_retell.config import get_settings
 from mcp_retell.langchain_tools import TOOLS
+from mcp_retell.timeouts import remaining
+
+BASE = "https://api.retellai.com"
 
 
 def test_tools_count():
-    assert len(TOOLS) == 13
+    assert len(TOOLS) == 18
 
 
 def test_all_tools_are_base_tool():
@@ -29,13 +40,18 @@ def test_expected_tools_present():
     expected = {
         "retell_list_agents",
         "retell_get_agent",
+        "retell_get_agents_many",
         "retell_create_agent",
         "retell_update_agent",
         "retell_delete_agent",
         "retell_create_phone_call",
         "retell_list_calls",
         "retell_get_call",
+        "retell_get_calls_many",
+        "retell_sync_call_archive",
         "retell_get_call_transcript",
+        "retell_search_transcripts",
+        "retell_analyze_calls",
         "retell_list_phone_numbers",
         "retell_update_phone_number",
         "retell_list_voices",
@@ -47,3 +63,60 @@ def test_expected_tools_present():
 def test_all_tools_have_descriptions():
     for t in TOOLS:
         assert t.description, f"Tool {t.name} has no description"
+
+
+def test_all_tools_have_native_coroutines():
+    for t in TOOLS:
+        assert t.coroutine is not None, f"Tool {t.name} has no async implementation"
+
+
+@respx.mock
+async def test_ainvoke_uses_async_client(monkeypatch):
+    client = RetellClient(api_key="test-key", base_url=BASE)
+    monkeypatch.setattr(langchain_tools, "_get_client", lambda: client)
+    respx.get(f"{BASE}/get-agent/ag1").mock(return_value=httpx.Response(200, json={"agent_id": "ag1", "prompt": "p"}))
+    text = await langchain_tools.retell_get_agent.ainvoke({"agent_id": "ag1", "fields": "agent_id"})
+    assert json.loads(text) == {"agent_id": "ag1"}
+    assert client._async_http is not None
+    assert client._sync_http is None
+
+
+@respx.mock
+async def test_tools_run_under_the_tool_deadline(monkeypatch):
+    client = RetellClient(api_key="test-key", base_url=BASE)
+    settings = get_settings().model_copy(update={"tool_deadline": 30.0})
+    monkeypatch.setattr(langchain_tools, "_get_client", lambda: client)
+    monkeypatch.setattr(langchain_tools, "get_settings", lambda: settings)
+    left = []
+
+    def handler(request):
+        left.append(remaining())
+        return httpx.Response(200, json={"agent_id": request.url.path.rsplit("/", 1)[-1]})
+
+    respx.get(url__regex=rf"{BASE}/get-agent/.+").mock(side_effect=handler)
+    langchain_tools.retell_get_agent.invoke({"agent_id": "ag1"})
+    await langchain_tools.retell_get_agent.ainvoke({"agent_id": "ag2"})
+    assert len(left) == 2
+    assert all(value is not None and value <= 30 for value in left)
+    assert remaining() is None
+
+
+@respx.mock
+async def test_fetched_calls_are_indexed_for_search(monkeypatch, tmp_path):
+    client = RetellClient(api_key="test-key", base_url=BASE)
+    archive = CallArchive(tmp_path / "calls.db")
+    monkeypatch.setattr(langchain_tools, "_get_client", lambda: client)
+    monkeypatch.setattr(langchain_tools, "_get_archive", lambda: archive)
+    respx.get(f"{BASE}/get-call/call1").mock(return_value=httpx.Response(200, json={
+        "call_id": "call1", "call_status": "ongoing", "transcript": "User: cancel my plan",
+    }))
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[{
+        "call_id": "call2", "call_status": "ended", "start_timestamp": 1, "end_timestamp": 2,
+        "transcript": "User: cancel the renewal",
+    }]))
+    await langchain_tools.retell_get_call.ainvoke({"call_id": "call1"})
+    report = json.loads(langchain_tools.retell_sync_call_archive.invoke({}))
+    assert report["synced"] == 1
+    found = json.loads(await langchain_tools.retell_search_transcripts.ainvoke({"query": "cancel"}))
+    assert sorted(r["call_id"] for r in found["results"]) == ["call1", "call2"]
+    archive.close()
@@ -0,0 +1,82 @@
+"""Tests for the batch meta-tool."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell import server
+from mcp_retell.client import RetellClient
+from mcp_retell.multicall import run_batch
+
+BASE = "https://api.retellai.com"
+
+
+async def _echo(**kwargs):
+    await asyncio.sleep(0.01)
+    return json.dumps(kwargs)
+
+
+async def _fail(**kwargs):
+    raise ValueError("boom")
+
+
+TOOLS = {"echo": _echo, "fail": _fail}
+
+
+async def test_batch_resolves_references_and_keeps_order():
+    results = await run_batch([
+        {"id": "a", "tool": "echo", "args": {"items": [{"x": 1}, {"x": 2}]}},
+        {"tool": "echo", "args": {"xs": "$a.items.*.x", "first": "$0.items.0"}},
+        {"tool": "echo", "args": {"plain": "$not a ref"}},
+    ], TOOLS)
+    assert [r["id"] for r in results] == ["a", "1", "2"]
+    assert results[1]["result"] == {"xs": [1, 2], "first": {"x": 1}}
+    assert results[2]["result"] == {"plain": "$not a ref"}
+
+
+async def test_batch_reports_errors_per_entry():
+    results = await run_batch([
+        {"tool": "fail"},
+        {"tool": "echo", "args": {"v": "$0.x"}},
+        {"tool": "missing"},
+        {"tool": "echo", "args": {"v": 1}},
+    ], TOOLS)
+    assert results[0]["error"] == "ValueError: boom"
+    assert results[1]["error"] == "depends on failed entry '0'"
+    assert results[2]["error"] == "unknown tool 'missing'"
+    assert results[3]["result"] == {"v": 1}
+
+
+async def test_batch_rejects_forward_references():
+    with pytest.raises(ValueError):
+        await run_batch([{"tool": "echo", "args": {"v": "$1"}}, {"tool": "echo"}], TOOLS)
+
+
+async def test_batch_rejects_numeric_custom_ids():
+    # "1" would name both the second entry and the first one's custom id.
+    with pytest.raises(ValueError, match="numeric"):
+        await run_batch([{"id": "1", "tool": "echo"}, {"tool": "echo", "args": {"v": "$1"}}], TOOLS)
+
+
+@respx.mock
+async def test_batch_tool_chains_server_tools(monkeypatch):
+    monkeypatch.setattr(server, "_client", RetellClient(api_key="test-key", base_url=BASE))
+    respx.get(f"{BASE}/list-agents").mock(
+        return_value=httpx.Response(200, json=[{"agent_id": "ag1"}, {"agent_id": "ag2"}])
+    )
+    respx.get(url__regex=rf"{BASE}/get-agent/.+").mock(
+        side_effect=lambda request: httpx.Response(200, json={"agent_id": request.url.path.rsplit("/", 1)[-1]})
+    )
+    respx.get(f"{BASE}/list-voices").mock(return_value=httpx.Response(200, json=[{"voice_id": "v1"}]))
+    text = await server.batch([
+        {"id": "agents", "tool": "list_agents"},
+        {"tool": "get_agents_many", "args": {"agent_ids": "$agents.*.agent_id"}},
+        {"tool": "list_voices", "args": {"fields": "voice_id"}},
+    ])
+    agents, details, voices = json.loads(text)
+    assert [a["agent_id"] for a in agents["result"]] == ["ag1", "ag2"]
+    assert [r["data"]["agent_id"] for r in details["result"]["results"]] == ["ag1", "ag2"]
+    assert voices["result"] == [{"voice_id": "v1"}]
@@ -1,10 +1,14 @@
 """Tests for Retell operations using respx mocks."""
 
+import asyncio
+import json
+
 import httpx
 import respx
 
 from mcp_retell.client import RetellClient
 from mcp_retell.operations import agents, calls, phones, voices
+from mcp_retell.timeouts import deadline, remaining
 
 BASE = "https://api.retellai.com"
 
@@ -72,6 +76,17 @@ def test_update_agent():
     assert result["agent_name"] == "Updated Bot"
 
 
+def test_agent_update_payload_extended_fields():
+    payload = agents.agent_update_payload(
+        prompt="Hi.", responsiveness=0.0, enable_backchannel=False,
+        extra={"ambient_sound": "coffee-shop"},
+    )
+    assert payload == {
+        "prompt": "Hi.", "responsiveness": 0.0, "enable_backchannel": False,
+        "ambient_sound": "coffee-shop",
+    }
+
+
 @respx.mock
 def test_delete_agent():
     respx.delete(f"{BASE}/delete-agent/ag1").mock(
@@ -137,6 +152,89 @@ def test_list_calls_no_end():
     assert result[0]["duration_ms"] is None
 
 
+def _paged_calls(total, page_size):
+    """respx side effect serving ``total`` calls in pages keyed by pagination_key."""
+    ids = [f"call{i}" for i in range(total)]
+
+    def handler(request):
+        key = request.url.params.get("pagination_key")
+        start = ids.index(key) + 1 if key else 0
+        limit = int(request.url.params["limit"])
+        assert limit == page_size
+        return httpx.Response(200, json=[{"call_id": cid} for cid in ids[start:start + limit]])
+
+    return handler
+
+
+@respx.mock
+def test_list_calls_pagination_key():
+    route = respx.get(f"{BASE}/list-calls").mock(side_effect=_paged_calls(5, 2))
+    result = calls.list_calls(_client(), limit=2, pagination_key="call1")
+    assert [c["call_id"] for c in result] == ["call2", "call3"]
+    assert route.calls.last.request.url.params["pagination_key"] == "call1"
+
+
+@respx.mock
+def test_iter_calls_walks_all_pages():
+    route = respx.get(f"{BASE}/list-calls").mock(side_effect=_paged_calls(5, 2))
+    ids = [c["call_id"] for c in calls.iter_calls(_client(), page_size=2)]
+    assert ids == [f"call{i}" for i in range(5)]
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_iter_calls_prefetch_keeps_the_callers_deadline():
+    pages = _paged_calls(5, 2)
+    left = []
+
+    def handler(request):
+        left.append(remaining())
+        return pages(request)
+
+    respx.get(f"{BASE}/list-calls").mock(side_effect=handler)
+    with deadline(30):
+        assert len(list(calls.iter_calls(_client(), page_size=2))) == 5
+    assert len(left) == 3
+    assert all(value is not None and value <= 30 for value in left)
+
+
+@respx.mock
+async def test_aiter_calls_walks_all_pages():
+    route = respx.get(f"{BASE}/list-calls").mock(side_effect=_paged_calls(4, 2))
+    ids = [c["call_id"] async for c in calls.aiter_calls(_client(), page_size=2)]
+    assert ids == [f"call{i}" for i in range(4)]
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_aiter_calls_sends_start_range_and_drops_undated_calls():
+    route = respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[
+        {"call_id": "call2", "start_timestamp": 2_000},
+        {"call_id": "draft"},
+        {"call_id": "call1", "start_timestamp": 1_000},
+    ]))
+    ids = [c["call_id"] async for c in calls.aiter_calls(
+        _client(), agent_id="ag1", start_after=1_000, start_before=5_000,
+    )]
+    assert ids == ["call2"]
+    assert json.loads(route.calls.last.request.url.params["filter_criteria"]) == [
+        {"member": "agent_id", "operator": "eq", "value": "ag1"},
+        {"member": "start_timestamp", "operator": "gt", "value": 1_000},
+        {"member": "start_timestamp", "operator": "lt", "value": 5_000},
+    ]
+
+
+@respx.mock
+async def test_aiter_calls_stops_early():
+    respx.get(f"{BASE}/list-calls").mock(side_effect=_paged_calls(10, 2))
+    seen = []
+    async for call in calls.aiter_calls(_client(), page_size=2):
+        seen.append(call["call_id"])
+        if len(seen) == 3:
+            break
+    assert seen == ["call0", "call1", "call2"]
+
+
 @respx.mock
 def test_get_call():
     respx.get(f"{BASE}/get-call/call1").mock(
@@ -211,3 +309,178 @@ def test_get_voice():
     )
     result = voices.get_voice(_client(), "v1")
     assert result["voice_id"] == "v1"
+
+
+# =============================================================================
+# Caching
+# =============================================================================
+
+
+@respx.mock
+def test_list_agents_cached_until_agent_created():
+    route = respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=[]))
+    respx.post(f"{BASE}/create-agent").mock(return_value=httpx.Response(200, json={"agent_id": "ag2"}))
+    client = _client()
+    agents.list_agents(client)
+    agents.list_agents(client)
+    assert route.call_count == 1
+    agents.create_agent(client, "New Bot", "v1", "You are helpful.")
+    agents.list_agents(client)
+    assert route.call_count == 2
+    agents.list_agents(client, bypass_cache=True)
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_update_phone_number_invalidates_phone_numbers():
+    route = respx.get(f"{BASE}/list-phone-numbers").mock(return_value=httpx.Response(200, json=[]))
+    respx.patch(f"{BASE}/update-phone-number/+15551234567").mock(return_value=httpx.Response(200, json={}))
+    client = _client()
+    phones.list_phone_numbers(client)
+    phones.update_phone_number(client, "+15551234567", nickname="Main")
+    phones.list_phone_numbers(client)
+    assert route.call_count == 2
+
+
+# =============================================================================
+# Transcript windows
+# =============================================================================
+
+
+_TURNS = [
+    {"role": "agent", "content": "Hello, how can I help?", "words": [{"word": "Hello"}]},
+    {"role": "user", "content": "I need to reschedule."},
+    {"role": "agent", "content": "Sure, what day works?"},
+    {"role": "user", "content": "Friday."},
+]
+
+
+def test_transcript_window_turn_range_and_speaker():
+    data = {"call_id": "call1", "transcript_object": _TURNS}
+    window = calls.transcript_window(data, start_turn=1, end_turn=3)
+    assert [t["index"] for t in window["turns"]] == [1, 2]
+    assert "words" not in window["turns"][0]
+    assert window["total_turns"] == 4
+    users = calls.transcript_window(data, speaker="user", last_n=1)
+    assert users["turns"] == [{"index": 3, "role": "user", "content": "Friday."}]
+
+
+def test_transcript_window_budget_streams_with_cursor():
+    data = {"call_id": "call1", "transcript_object": _TURNS}
+    cursor, seen = None, []
+    while True:
+        chunk = calls.transcript_window(data, max_chars=30, cursor=cursor)
+        assert chunk["chars"] <= 30
+        seen.extend(t["index"] for t in chunk["turns"])
+        cursor = chunk["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [0, 1, 2, 3]
+
+
+def test_transcript_window_parses_plain_transcript():
+    data = {"call_id": "call1", "transcript": "Agent: Hi\nUser: Hello\nthere\nAgent: Bye"}
+    window = calls.transcript_window(data, last_n=2)
+    assert window["turns"] == [
+        {"index": 1, "role": "user", "content": "Hello\nthere"},
+        {"index": 2, "role": "agent", "content": "Bye"},
+    ]
+
+
+@respx.mock
+def test_get_transcript_window():
+    respx.get(f"{BASE}/get-call/call1").mock(
+        return_value=httpx.Response(200, json={"call_id": "call1", "transcript_object": _TURNS})
+    )
+    result = calls.get_transcript_window(_client(), "call1", max_tokens=6)
+    assert [t["index"] for t in result["turns"]] == [0]
+    assert result["next_cursor"] == 1
+
+
+# =============================================================================
+# Async variants
+# =============================================================================
+
+
+@respx.mock
+async def test_async_variants_match_sync():
+    respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=[{"agent_id": "ag1"}]))
+    respx.get(f"{BASE}/list-phone-numbers").mock(return_value=httpx.Response(200, json={"phone_number": "+1"}))
+    respx.get(f"{BASE}/list-voices").mock(return_value=httpx.Response(200, json=[{"voice_id": "v1"}]))
+    respx.get(f"{BASE}/get-call/c1").mock(
+        return_value=httpx.Response(200, json={"call_id": "c1", "transcript": "Agent: hi", "start_timestamp": 1, "end_timestamp": 5})
+    )
+    client = _client()
+    assert await agents.alist_agents(client) == agents.list_agents(client)
+    assert await phones.alist_phone_numbers(client) == phones.list_phone_numbers(client)
+    assert await voices.alist_voices(client) == voices.list_voices(client)
+    assert await calls.aget_call_transcript(client, "c1") == calls.get_call_transcript(client, "c1")
+    window = await calls.aget_transcript_window(client, "c1", last_n=1)
+    assert window["turns"] == [{"index": 0, "role": "agent", "content": "hi"}]
+
+
+@respx.mock
+async def test_async_writes_build_same_payloads():
+    create = respx.post(f"{BASE}/create-phone-call").mock(return_value=httpx.Response(200, json={"call_id": "c1"}))
+    update = respx.patch(f"{BASE}/update-agent/ag1").mock(return_value=httpx.Response(200, json={"agent_id": "ag1"}))
+    delete = respx.delete(f"{BASE}/delete-agent/ag1").mock(return_value=httpx.Response(200, json={}))
+    client = _client()
+    await calls.acreate_phone_call(client, "ag1", "+1", "+2", metadata='{"k": "v"}')
+    assert create.calls.last.request.content == b'{"agent_id":"ag1","to_number":"+1","from_number":"+2","metadata":{"k":"v"}}'
+    await agents.aupdate_agent(client, "ag1", prompt="new")
+    assert update.calls.last.request.content == b'{"prompt":"new"}'
+    assert await agents.adelete_agent(client, "ag1") == {"status": "deleted", "agent_id": "ag1"}
+    assert delete.called
+
+
+# =============================================================================
+# Batch fetch
+# =============================================================================
+
+
+@respx.mock
+async def test_aget_calls_many_keeps_order_and_reports_errors():
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        call_id = request.url.path.rsplit("/", 1)[-1]
+        if call_id == "missing":
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"call_id": call_id})
+
+    respx.get(url__regex=rf"{BASE}/get-call/.+").mock(side_effect=handler)
+    ids = [f"c{i}" for i in range(8)] + ["missing"]
+    report = await calls.aget_calls_many(_client(), ids, concurrency=3)
+    assert [r["call_id"] for r in report["results"]] == ids
+    assert report["results"][0]["data"] == {"call_id": "c0"}
+    assert report["results"][-1] == {"call_id": "missing", "error": "HTTP 404"}
+    assert report["summary"]["succeeded"] == 8
+    assert report["summary"]["failed"] == 1
+    assert peak == 3
+
+
+@respx.mock
+def test_get_agents_many_sync():
+    respx.get(f"{BASE}/get-agent/ag1").mock(return_value=httpx.Response(200, json={"agent_id": "ag1"}))
+    respx.get(f"{BASE}/get-agent/ag2").mock(return_value=httpx.Response(404, json={}))
+    report = agents.get_agents_many(_client(), ["ag2", "ag1"], concurrency=2)
+    assert report["results"] == [
+        {"agent_id": "ag2", "error": "HTTP 404"},
+        {"agent_id": "ag1", "data": {"agent_id": "ag1"}},
+    ]
+
+
+@respx.mock
+async def test_fetch_many_reports_invalid_bodies_per_item():
+    respx.get(f"{BASE}/get-call/bad").mock(return_value=httpx.Response(200, text="<html>oops</html>"))
+    respx.get(f"{BASE}/get-call/ok").mock(return_value=httpx.Response(200, json={"call_id": "ok"}))
+    expected = [{"call_id": "bad", "error": "JSONDecodeError"}, {"call_id": "ok", "data": {"call_id": "ok"}}]
+    report = await calls.aget_calls_many(_client(), ["bad", "ok"])
+    assert report["results"] == expected
+    report = calls.get_calls_many(_client(), ["bad", "ok"])
+    assert report["results"] == expected
@@ -0,0 +1,129 @@
+"""Tests for recording downloads."""
+
+import hashlib
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell import cli
+from mcp_retell.client import RetellClient
+from mcp_retell.operations.recordings import RecordingCache, RecordingDownloader, adownload_recordings
+from mcp_retell.ratelimit import RateLimiter
+from mcp_retell.retry import RetryPolicy
+
+BASE = "https://api.retellai.com"
+STORAGE = "https://storage.example.com"
+AUDIO = bytes(range(256)) * 1000
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({}))
+
+
+def _mock_get_call(urls):
+    def get_call(request):
+        call_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"call_id": call_id, "recording_url": urls.get(call_id)})
+
+    return respx.get(url__regex=rf"{BASE}/get-call/.+").mock(side_effect=get_call)
+
+
+def _serve_audio(request):
+    header = request.headers.get("Range")
+    if header:
+        start = int(header.split("=")[1].rstrip("-"))
+        return httpx.Response(206, content=AUDIO[start:], headers={
+            "Content-Range": f"bytes {start}-{len(AUDIO) - 1}/{len(AUDIO)}",
+        })
+    return httpx.Response(200, content=AUDIO)
+
+
+@respx.mock
+async def test_downloads_resume_and_dedupe(tmp_path):
+    _mock_get_call({"c1": f"{STORAGE}/c1.mp3", "c2": f"{STORAGE}/c2.mp3", "c3": None})
+    audio = respx.get(url__startswith=STORAGE).mock(side_effect=_serve_audio)
+    cache = RecordingCache(tmp_path)
+    cache.partial_path("c1").write_bytes(AUDIO[:100_000])  # interrupted earlier
+
+    report = await adownload_recordings(_client(), ["c1", "c2", "c3"], cache_dir=tmp_path)
+    c1, c2, c3 = report["results"]
+    assert c1["resumed"] is True and c2["resumed"] is False
+    assert sorted(str(call.request.headers.get("Range")) for call in audio.calls) == ["None", "bytes=100000-"]
+    digest = hashlib.sha256(AUDIO).hexdigest()
+    assert c1["sha256"] == c2["sha256"] == digest
+    assert c1["path"] == c2["path"]  # same content stored once
+    assert open(c1["path"], "rb").read() == AUDIO
+    assert c1["path"].endswith(".mp3")
+    assert c3 == {"call_id": "c3", "error": "no recording"}
+    assert report["summary"]["downloaded"] == 2
+    assert report["summary"]["failed"] == 1
+    assert not cache.partial_path("c1").exists()
+
+
+@respx.mock
+async def test_cached_recordings_skip_the_network(tmp_path):
+    get_call = _mock_get_call({"c1": f"{STORAGE}/c1.wav"})
+    respx.get(url__startswith=STORAGE).mock(side_effect=_serve_audio)
+    await adownload_recordings(_client(), ["c1"], cache_dir=tmp_path)
+
+    report = await adownload_recordings(_client(), ["c1"], cache_dir=tmp_path)
+    assert report["results"][0]["cached"] is True
+    assert report["results"][0]["bytes"] == len(AUDIO)
+    assert get_call.call_count == 1
+
+
+@respx.mock
+async def test_http_errors_are_reported_per_call(tmp_path):
+    _mock_get_call({"c1": f"{STORAGE}/gone.wav"})
+    respx.get(f"{STORAGE}/gone.wav").mock(return_value=httpx.Response(404))
+    report = await adownload_recordings(_client(), ["c1"], cache_dir=tmp_path)
+    assert report["results"] == [{"call_id": "c1", "error": "HTTP 404"}]
+
+
+@respx.mock
+async def test_retries_stop_at_max_elapsed_across_attempts(tmp_path):
+    route = respx.get(f"{STORAGE}/busy.wav").mock(
+        return_value=httpx.Response(503, headers={"Retry-After": "0.1"}),
+    )
+    downloader = RecordingDownloader(tmp_path, retry_policy=RetryPolicy(max_attempts=50, max_elapsed=0.35))
+    report = await downloader.download(_client(), ["c1"], urls={"c1": f"{STORAGE}/busy.wav"})
+    assert report["results"] == [{"call_id": "c1", "error": "HTTP 503"}]
+    assert route.call_count <= 4
+
+
+@respx.mock
+async def test_416_commits_partial_only_when_sizes_match(tmp_path):
+    cache = RecordingCache(tmp_path)
+
+    def serve(request):
+        if request.headers.get("Range"):
+            return httpx.Response(416, headers={"Content-Range": f"bytes */{len(AUDIO)}"})
+        return httpx.Response(200, content=AUDIO)
+
+    route = respx.get(url__startswith=STORAGE).mock(side_effect=serve)
+    cache.partial_path("done").write_bytes(AUDIO)  # every byte already here
+    cache.partial_path("stale").write_bytes(b"x" * 1000)  # from an older, different object
+    urls = {"done": f"{STORAGE}/done.wav", "stale": f"{STORAGE}/stale.wav"}
+    report = await RecordingDownloader(tmp_path).download(_client(), ["done", "stale"], urls=urls)
+    done, stale = report["results"]
+    assert done["resumed"] is True and done["bytes"] == len(AUDIO)
+    assert stale["resumed"] is False
+    assert open(stale["path"], "rb").read() == AUDIO
+    assert route.call_count == 3
+
+
+async def test_call_ids_cannot_escape_the_cache(tmp_path):
+    cache = RecordingCache(tmp_path / "cache")
+    for call_id in ("../x", "a/b", "..", ""):
+        with pytest.raises(ValueError):
+            cache.partial_path(call_id)
+    report = await adownload_recordings(_client(), ["../../escape"], cache_dir=tmp_path / "cache")
+    assert report["results"] == [{"call_id": "../../escape", "error": "invalid call ID"}]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache"]
+
+
+def test_cli_parses_recordings_command():
+    args = cli._build_parser().parse_args(["recordings", "c1", "c2", "--concurrency", "4"])
+    assert args.call_ids == ["c1", "c2"]
+    assert args.concurrency == 4
@@ -0,0 +1,96 @@
+"""Tests for tool response shaping."""
+
+import json
+
+import pytest
+
+from mcp_retell import shaping
+from mcp_retell.shaping import project, shape
+
+CALL = {
+    "call_id": "call1",
+    "call_status": "ended",
+    "transcript": "Agent: hi",
+    "call_analysis": {"user_sentiment": "Positive", "call_summary": "Greeting", "custom": {"a": 1}},
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    shaping.stats.reset()
+    yield
+    shaping.stats.reset()
+
+
+def test_project_top_level_and_nested_fields():
+    assert project(CALL, "call_id, call_analysis.user_sentiment") == {
+        "call_id": "call1",
+        "call_analysis": {"user_sentiment": "Positive"},
+    }
+    # A shorter path wins over a longer one that it contains.
+    assert project(CALL, ["call_analysis.custom.a", "call_analysis"])["call_analysis"] == CALL["call_analysis"]
+    assert project(CALL, "missing") == {}
+    assert project(CALL, None) is CALL
+
+
+def test_project_lists_per_item():
+    data = [{**CALL, "call_id": f"call{i}"} for i in range(3)]
+    assert project(data, "call_id") == [{"call_id": "call0"}, {"call_id": "call1"}, {"call_id": "call2"}]
+
+
+def test_compact_encoding_is_smaller():
+    pretty = shape(CALL)
+    compact = shape(CALL, compact=True)
+    assert json.loads(pretty) == json.loads(compact) == CALL
+    assert "\n" in pretty and "\n" not in compact
+    assert len(compact) < len(pretty)
+
+
+def test_max_bytes_trims_list_items_with_marker():
+    data = [{"call_id": f"call{i}", "transcript": "x" * 50} for i in range(20)]
+    text = shape(data, compact=True, max_bytes=400)
+    assert len(text.encode()) <= 400
+    items = json.loads(text)
+    marker = items.pop()
+    assert marker["_truncated"]["omitted_items"] == 20 - len(items)
+    assert items == data[: len(items)]
+
+
+def test_max_bytes_trims_inside_objects():
+    text = shape({"call_id": "call1", "transcript": "y" * 1000}, max_bytes=200)
+    assert len(text.encode()) <= 200
+    data = json.loads(text)
+    assert data["call_id"] == "call1"
+    assert data["transcript"].startswith("yyy")
+    assert data["_truncated"] == {"transcript": {"omitted_chars": 1000 - len(data["transcript"])}}
+
+
+def test_max_bytes_trims_nested_lists_and_strings():
+    batch = {
+        "results": [{"call_id": f"call{i}", "transcript": "x" * 3000} for i in range(5)],
+        "summary": {"requested": 5},
+    }
+    data = json.loads(shape(batch, compact=True, max_bytes=4000))
+    assert data["summary"] == {"requested": 5}
+    assert data["_truncated"] == {"results": {"omitted_items": 4}}
+
+    single = {"results": [{"call_id": "call1", "transcript": "x" * 30000}]}
+    text = shape(single, compact=True, max_bytes=2000)
+    assert len(text.encode()) <= 2000
+    data = json.loads(text)
+    assert data["results"][0]["call_id"] == "call1"
+    assert "results.0.transcript" in data["_truncated"]
+
+
+def test_max_bytes_falls_back_to_a_bare_marker():
+    text = shape({"call_id": "c" * 500}, max_bytes=60)
+    assert json.loads(text) == {"_truncated": {"omitted_bytes": len(shape({"call_id": "c" * 500}, max_bytes=0))}}
+
+
+def test_stats_record_savings_per_tool():
+    shape(CALL, tool="get_call")
+    shape(CALL, fields="call_id", compact=True, tool="get_call")
+    snapshot = shaping.stats.snapshot()["get_call"]
+    assert snapshot["calls"] == 2
+    assert snapshot["shaped_bytes"] < snapshot["raw_bytes"]
+    assert 0 < snapshot["saved_pct"] < 100
@@ -0,0 +1,155 @@
+"""Tests for declarative agent sync."""
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from mcp_retell import cli
+from mcp_retell.client import RetellClient
+from mcp_retell.operations.sync import diff_agent, field_digest, load_manifest, sync_agents_async
+from mcp_retell.ratelimit import RateLimiter
+
+BASE = "https://api.retellai.com"
+
+CURRENT = {
+    "ag1": {"agent_id": "ag1", "agent_name": "Support", "prompt": "Help.", "voice_id": "v1",
+            "response_engine": {"type": "retell-llm", "llm_id": "llm1"}},
+    "ag2": {"agent_id": "ag2", "agent_name": "Sales", "prompt": "Sell.", "voice_id": "v2",
+            "responsiveness": 1.0},
+}
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({}))
+
+
+def _mock_agents():
+    def get_agent(request):
+        agent = CURRENT.get(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, json=agent) if agent else httpx.Response(404, json={})
+
+    respx.get(url__regex=rf"{BASE}/get-agent/.+").mock(side_effect=get_agent)
+    respx.get(f"{BASE}/list-agents").mock(return_value=httpx.Response(200, json=list(CURRENT.values())))
+    return respx.patch(url__regex=rf"{BASE}/update-agent/.+").mock(
+        return_value=httpx.Response(200, json={}),
+    )
+
+
+def test_field_digest_ignores_key_order():
+    assert field_digest({"a": 1, "b": [1, 2]}) == field_digest({"b": [1, 2], "a": 1})
+    assert field_digest(1.0) != field_digest("1.0")
+
+
+def test_diff_agent_returns_only_changed_fields():
+    desired = {"agent_id": "ag1", "agent_name": "Support", "prompt": "Help more.",
+               "response_engine": {"llm_id": "llm1", "type": "retell-llm"}, "language": "en-US"}
+    assert diff_agent(desired, CURRENT["ag1"]) == {"prompt": "Help more.", "language": "en-US"}
+
+
+@respx.mock
+async def test_noop_sync_only_reads():
+    patch = _mock_agents()
+    report = await sync_agents_async(_client(), [dict(agent) for agent in CURRENT.values()])
+    assert [r["status"] for r in report["results"]] == ["unchanged", "unchanged"]
+    assert report["summary"]["reads"] == 2
+    assert report["summary"]["writes"] == 0
+    assert not patch.called
+
+
+@respx.mock
+async def test_sync_patches_changed_fields_only():
+    patch = _mock_agents()
+    desired = [
+        {**CURRENT["ag1"], "prompt": "Help kindly."},
+        {"agent_id": "ag2", "responsiveness": 0.5, "enable_backchannel": False},
+    ]
+    report = await sync_agents_async(_client(), desired)
+    assert [(r["agent_id"], r["status"], r["fields"]) for r in report["results"]] == [
+        ("ag1", "updated", ["prompt"]),
+        ("ag2", "updated", ["enable_backchannel", "responsiveness"]),
+    ]
+    bodies = {c.request.url.path: json.loads(c.request.content) for c in patch.calls}
+    assert bodies == {
+        "/update-agent/ag1": {"prompt": "Help kindly."},
+        "/update-agent/ag2": {"responsiveness": 0.5, "enable_backchannel": False},
+    }
+    assert report["summary"]["writes"] == 2
+
+
+@respx.mock
+async def test_second_sync_settles_when_retell_drops_null_fields():
+    agent = {"agent_id": "ag1", "agent_name": "Support", "prompt": "Help."}
+    respx.get(f"{BASE}/get-agent/ag1").mock(side_effect=lambda request: httpx.Response(200, json=agent))
+
+    def update(request):
+        changes = json.loads(request.content)
+        agent.update({k: v for k, v in changes.items() if v is not None})
+        for key in [k for k, v in changes.items() if v is None]:
+            agent.pop(key, None)  # Retell omits null fields from the agent object
+        return httpx.Response(200, json=agent)
+
+    patch = respx.patch(f"{BASE}/update-agent/ag1").mock(side_effect=update)
+    desired = [{"agent_id": "ag1", "prompt": "Help kindly.", "begin_message": None, "webhook_url": None}]
+    first = await sync_agents_async(_client(), desired)
+    assert first["results"][0]["fields"] == ["prompt"]
+    second = await sync_agents_async(_client(), desired)
+    assert second["results"][0]["status"] == "unchanged"
+    assert diff_agent(desired[0], agent) == {}
+    assert patch.call_count == 1
+
+
+@respx.mock
+async def test_dry_run_reports_without_writing():
+    patch = _mock_agents()
+    report = await sync_agents_async(_client(), [{"agent_id": "ag1", "voice_id": "v9"}], dry_run=True)
+    assert report["results"][0]["status"] == "changed"
+    assert report["results"][0]["fields"] == ["voice_id"]
+    assert report["summary"]["changed"] == 1
+    assert not patch.called
+
+
+@respx.mock
+async def test_agents_matched_by_name_and_missing_reported():
+    patch = _mock_agents()
+    desired = [{"agent_name": "Sales", "prompt": "Sell more."}, {"agent_name": "Nobody"},
+               {"agent_id": "ag404", "prompt": "x"}]
+    report = await sync_agents_async(_client(), desired)
+    assert [(r["agent_id"], r["status"]) for r in report["results"]] == [
+        ("ag2", "updated"), (None, "not_found"), ("ag404", "not_found"),
+    ]
+    assert report["summary"]["reads"] == 3
+    assert patch.call_count == 1
+
+
+@respx.mock
+async def test_failed_patch_is_reported_per_agent():
+    respx.patch(f"{BASE}/update-agent/ag1").mock(return_value=httpx.Response(422, json={}))
+    _mock_agents()
+    report = await sync_agents_async(_client(), [{"agent_id": "ag1", "prompt": "New."}])
+    assert report["results"][0]["status"] == "failed"
+    assert report["results"][0]["error"] == "HTTP 422"
+    assert report["summary"]["writes"] == 0
+
+
+def test_load_manifest_json_and_yaml(tmp_path):
+    agents = [{"agent_id": "ag1", "prompt": "Help."}]
+    (tmp_path / "agents.json").write_text(json.dumps({"agents": agents}))
+    assert load_manifest(tmp_path / "agents.json") == agents
+    pytest.importorskip("yaml")
+    (tmp_path / "agents.yaml").write_text("- agent_id: ag1\n  prompt: Help.\n")
+    assert load_manifest(tmp_path / "agents.yaml") == agents
+
+
+def test_load_manifest_rejects_agents_without_id_or_name(tmp_path):
+    (tmp_path / "agents.json").write_text(json.dumps([{"prompt": "Help."}]))
+    with pytest.raises(ValueError):
+        load_manifest(tmp_path / "agents.json")
+
+
+def test_cli_parses_sync_agents_command():
+    args = cli._build_parser().parse_args(["sync-agents", "agents.yaml", "--dry-run"])
+    assert args.manifest == "agents.yaml"
+    assert args.dry_run
+    assert args.concurrency == 10
@@ -0,0 +1,120 @@
+"""Tests for background catalog warm-up."""
+
+import asyncio
+
+import httpx
+import respx
+
+from mcp_retell.cache import AGENTS, PHONE_NUMBERS, VOICES, ResponseCache
+from mcp_retell.client import RetellClient
+from mcp_retell.operations import agents, voices
+from mcp_retell.ratelimit import RateLimiter
+from mcp_retell.retry import RetryPolicy
+from mcp_retell.warmer import CatalogWarmer
+
+BASE = "https://api.retellai.com"
+
+
+def _client(ttls=None):
+    cache = ResponseCache(ttls or {AGENTS: 60, VOICES: 3600, PHONE_NUMBERS: 300})
+    return RetellClient(
+        api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({}), cache=cache,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+
+def _mock_catalogs():
+    return {
+        "/list-agents": respx.get(f"{BASE}/list-agents").mock(
+            return_value=httpx.Response(200, json=[{"agent_id": "ag1", "agent_name": "A"}]),
+        ),
+        "/list-voices": respx.get(f"{BASE}/list-voices").mock(return_value=httpx.Response(200, json=[])),
+        "/list-phone-numbers": respx.get(f"{BASE}/list-phone-numbers").mock(
+            return_value=httpx.Response(500),
+        ),
+    }
+
+
+@respx.mock
+async def test_warm_prefetches_catalogs_concurrently():
+    routes = _mock_catalogs()
+    client = _client()
+    warmer = CatalogWarmer(client)
+    assert warmer.intervals == {AGENTS: 48.0, VOICES: 2880.0, PHONE_NUMBERS: 240.0}
+    assert await warmer.warm() == {AGENTS: True, VOICES: True, PHONE_NUMBERS: False}
+    assert warmer.errors == {PHONE_NUMBERS: "HTTP 500"}
+
+    assert (await agents.alist_agents(client))[0]["agent_id"] == "ag1"
+    await voices.alist_voices(client)
+    assert routes["/list-agents"].call_count == 1
+    assert routes["/list-voices"].call_count == 1
+
+
+@respx.mock
+async def test_reads_use_warm_copy_while_refresh_is_in_flight():
+    release = asyncio.Event()
+    agents_list = [[{"agent_id": "old"}], [{"agent_id": "new"}]]
+
+    async def slow_list(request):
+        await release.wait()
+        return httpx.Response(200, json=agents_list.pop(0))
+
+    route = respx.get(f"{BASE}/list-agents").mock(side_effect=slow_list)
+    client = _client({AGENTS: 60})
+    warmer = CatalogWarmer(client)
+    release.set()
+    await warmer.warm()
+
+    release.clear()
+    refresh = asyncio.create_task(warmer.refresh(AGENTS))
+    await asyncio.sleep(0)
+    assert await client.get("/list-agents") == [{"agent_id": "old"}]  # no wait, no request
+    release.set()
+    await refresh
+    assert await client.get("/list-agents") == [{"agent_id": "new"}]
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_expired_copy_is_served_while_refresh_is_in_flight():
+    release = asyncio.Event()
+    agents_list = [[{"agent_id": "old"}], [{"agent_id": "new"}]]
+
+    async def slow_list(request):
+        await release.wait()
+        return httpx.Response(200, json=agents_list.pop(0))
+
+    route = respx.get(f"{BASE}/list-agents").mock(side_effect=slow_list)
+    client = _client({AGENTS: 0.05})
+    warmer = CatalogWarmer(client)
+    release.set()
+    await warmer.warm()
+    await asyncio.sleep(0.06)  # the warm copy has expired
+
+    release.clear()
+    refresh = asyncio.create_task(warmer.refresh(AGENTS))
+    await asyncio.sleep(0)
+    assert await asyncio.wait_for(client.get("/list-agents"), 0.01) == [{"agent_id": "old"}]
+    release.set()
+    await refresh
+    assert await client.get("/list-agents") == [{"agent_id": "new"}]
+    assert route.call_count == 2
+    assert client.cache.snapshot()["stale_hits"] == 1
+
+
+def test_interval_is_capped_below_the_ttl():
+    warmer = CatalogWarmer(_client({AGENTS: 60, VOICES: 3600}), interval=600)
+    assert warmer.intervals == {AGENTS: 48.0, VOICES: 600}
+
+
+@respx.mock
+async def test_background_loop_refreshes_until_stopped():
+    routes = _mock_catalogs()
+    client = _client({AGENTS: 60})
+    warmer = CatalogWarmer(client, interval=0.01)
+    assert list(warmer.intervals) == [AGENTS]  # disabled caches are not warmed
+    warmer.start()
+    await asyncio.sleep(0.08)
+    await warmer.stop()
+    assert warmer.refreshes[AGENTS] >= 3
+    assert routes["/list-voices"].call_count == 0
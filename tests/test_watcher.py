@@ -0,0 +1,103 @@
+"""Tests for the call-completion watcher."""
+
+import time
+
+import httpx
+import respx
+
+from mcp_retell.analytics import DurationHistogram
+from mcp_retell.client import RetellClient
+from mcp_retell.ratelimit import RateLimiter
+from mcp_retell.watcher import CallWatcher, _Watch, recent_durations, wait_for_calls_async
+
+BASE = "https://api.retellai.com"
+
+
+def _client():
+    return RetellClient(api_key="test-key", base_url=BASE, rate_limiter=RateLimiter({}))
+
+
+def _mock_calls(polls_until_ended):
+    """Serve each call as ongoing for its first N polls, then ended."""
+    seen = {call_id: 0 for call_id in polls_until_ended}
+
+    def get_call(request):
+        call_id = request.url.path.rsplit("/", 1)[-1]
+        if call_id not in seen:
+            return httpx.Response(404, json={})
+        seen[call_id] += 1
+        ended = seen[call_id] > polls_until_ended[call_id]
+        return httpx.Response(200, json={
+            "call_id": call_id, "call_status": "ended" if ended else "ongoing",
+            "start_timestamp": 1_000, "end_timestamp": 61_000 if ended else None,
+            "disconnection_reason": "user_hangup" if ended else None,
+        })
+
+    respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[]))
+    return respx.get(url__regex=rf"{BASE}/get-call/.+").mock(side_effect=get_call)
+
+
+@respx.mock
+async def test_yields_calls_as_they_end():
+    route = _mock_calls({"c1": 3, "c2": 0, "c3": 1})
+    report = await wait_for_calls_async(
+        _client(), ["c1", "c2", "c3", "gone"], timeout=5.0, min_interval=0.01, max_interval=0.05,
+    )
+    assert [r["call_id"] for r in report["results"]] == ["c2", "c3", "c1"]
+    assert report["results"][0]["duration_ms"] == 60_000
+    assert report["failed"] == {"gone": "HTTP 404"}
+    assert report["pending"] == []
+    assert route.call_count == 4 + 1 + 2 + 1  # polls of c1, c2, c3 and "gone"
+    assert report["summary"]["requests"] == 8
+    assert report["summary"]["finished"] == 3
+
+
+@respx.mock
+async def test_timeout_leaves_live_calls_pending():
+    _mock_calls({"c1": 1_000})
+    report = await wait_for_calls_async(_client(), ["c1"], timeout=0.1, min_interval=0.02)
+    assert report["results"] == []
+    assert report["pending"] == ["c1"]
+
+
+def test_polls_pulled_forward_near_typical_end_time():
+    durations = DurationHistogram()
+    for _ in range(10):
+        durations.add(60_000)
+    watcher = CallWatcher(_client(), min_interval=1.0, max_interval=30.0, durations=durations)
+    now_ms = time.time() * 1000
+
+    watch = _Watch("c1", interval=30.0)
+    interval = watcher.next_interval(watch, {"start_timestamp": now_ms - 55_000})
+    assert 1.0 <= interval <= 5.5  # next poll just after the typical 60s end
+
+    watch = _Watch("c2", interval=8.0)
+    assert watcher.next_interval(watch, {"start_timestamp": now_ms - 120_000}) == 8.0
+    assert watch.interval == 12.0  # backs off once past every percentile
+
+
+@respx.mock
+async def test_invalid_bodies_are_retried_then_reported():
+    respx.get(f"{BASE}/get-call/bad").mock(return_value=httpx.Response(200, text="<html>"))
+    route = _mock_calls({"c1": 0})
+    report = await wait_for_calls_async(_client(), ["bad", "c1"], timeout=5.0, min_interval=0.01, max_interval=0.02)
+    assert [r["call_id"] for r in report["results"]] == ["c1"]
+    assert report["failed"] == {"bad": "JSONDecodeError"}
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_durations_seeded_from_recent_calls():
+    ended = [
+        {"call_id": f"c{i}", "call_status": "ended", "start_timestamp": 1_000, "end_timestamp": 61_000}
+        for i in range(6)
+    ]
+    live = {"call_id": "live", "call_status": "ongoing", "start_timestamp": 1_000}
+    route = respx.get(f"{BASE}/list-calls").mock(return_value=httpx.Response(200, json=[live, *ended]))
+    durations = await recent_durations(_client())
+    assert durations.count == 6
+    assert 59_000 <= durations.percentile(50) <= 61_000
+    assert route.calls.last.request.url.params["limit"] == "100"
+
+    route.mock(return_value=httpx.Response(503, json={}))
+    assert (await recent_durations(_client())).count == 0
@@ -0,0 +1,96 @@
+"""Tests for the webhook receiver, replaying synthetic events offline."""
+
+import asyncio
+import json
+
+import httpx
+
+from mcp_retell.archive import CallArchive
+from mcp_retell.webhooks import WebhookReceiver, sign, verify_signature
+
+SECRET = "key_test"
+
+
+def _event(event, call_id="c1", **call):
+    return {"event": event, "call": {"call_id": call_id, "agent_id": "ag1", **call}}
+
+
+async def _post(receiver, event, secret=SECRET, signature=None):
+    body = json.dumps(event).encode()
+    headers = {"x-retell-signature": signature or sign(body, secret)}
+    transport = httpx.ASGITransport(app=receiver)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        return await http.post("/webhook", content=body, headers=headers)
+
+
+def test_signature_round_trip_and_freshness():
+    body = b'{"event": "call_ended"}'
+    signature = sign(body, SECRET, timestamp_ms=1_700_000_000_000)
+    assert verify_signature(body, signature, SECRET, now_ms=1_700_000_060_000)
+    assert not verify_signature(body + b" ", signature, SECRET, now_ms=1_700_000_060_000)
+    assert not verify_signature(body, signature, "other", now_ms=1_700_000_060_000)
+    assert not verify_signature(body, signature, SECRET, now_ms=1_700_001_000_000)  # stale
+    assert not verify_signature(body, "garbage", SECRET)
+
+
+async def test_events_merge_into_archive(tmp_path):
+    archive = CallArchive(tmp_path / "calls.db")
+    receiver = WebhookReceiver(archive, SECRET)
+    replay = [
+        _event("call_started", call_status="ongoing", start_timestamp=1_000),
+        _event("call_ended", call_status="ended", end_timestamp=61_000, transcript="Agent: hi"),
+        _event("call_analyzed", call_status="ended", call_analysis={"call_successful": True}),
+        _event("call_started", call_status="ongoing"),  # late duplicate
+    ]
+    for event in replay:
+        assert (await _post(receiver, event)).status_code == 204
+    await receiver.flush()
+    call = archive.get_call("c1")
+    assert call["call_status"] == "ended"
+    assert call["start_timestamp"] == 1_000
+    assert call["call_analysis"] == {"call_successful": True}
+    assert archive.search_transcripts("hi")["results"][0]["call_id"] == "c1"
+    assert receiver.stats()["accepted"] == 4
+    await receiver.stop()
+    archive.close()
+
+
+async def test_rejects_bad_signatures_and_full_queue(tmp_path):
+    archive = CallArchive(tmp_path / "calls.db")
+    receiver = WebhookReceiver(archive, SECRET, queue_size=2)
+    assert (await _post(receiver, _event("call_ended"), secret="wrong")).status_code == 401
+    assert (await _post(receiver, _event("call_ended"), signature="v=1,d=00")).status_code == 401
+
+    # Burst on a stalled loop: the writer cannot run between posts.
+    assert receiver.ingest(_event("call_ended", "c1"))
+    assert receiver.ingest(_event("call_ended", "c2"))
+    response = await _post(receiver, _event("call_ended", "c3"))
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert receiver.ingest({"event": "transcript_updated", "call": {"call_id": "c4"}})
+
+    await receiver.stop()
+    assert archive.count() == 2
+    assert receiver.stats()["bad_signature"] == 2
+    assert receiver.stats()["ignored"] == 1
+    archive.close()
+
+
+async def test_lifespan_starts_and_drains_writer(tmp_path):
+    archive = CallArchive(tmp_path / "calls.db")
+    receiver = WebhookReceiver(archive, SECRET)
+    messages = asyncio.Queue()
+    sent = []
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await messages.put({"type": "lifespan.startup"})
+    lifespan = asyncio.create_task(receiver({"type": "lifespan"}, messages.get, send))
+    await asyncio.sleep(0)
+    receiver.ingest(_event("call_ended"))
+    await messages.put({"type": "lifespan.shutdown"})
+    await lifespan
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert archive.get_call("c1") is not None
+    archive.close()